@@ -0,0 +1,62 @@
+"""Compare a cold BookReader scan with a warm sidecar-index load.
+
+Writes a synthetic scene tree (5,000 scenes by default) to a temp folder, then
+times BookReader construction with and without `.book_index.json`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import write_scene_tree
+from sample_code.book_index import manifest_path
+from sample_code.reader import BookReader
+
+
+def open_book(scenes_dir: Path, progress: Path) -> float:
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        BookReader(scenes_dir, progress_file=progress)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", type=int, default=5000, help="Number of synthetic scenes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes_dir = write_scene_tree(Path(tmp) / "book", args.scenes)
+        progress = Path(tmp) / "progress.json"
+
+        cold = []
+        for _ in range(args.repeat):
+            manifest_path(scenes_dir).unlink(missing_ok=True)
+            cold.append(open_book(scenes_dir, progress))
+        warm = [open_book(scenes_dir, progress) for _ in range(args.repeat)]
+
+        summary = {
+            "scenes": args.scenes,
+            "index_bytes": manifest_path(scenes_dir).stat().st_size,
+            "cold_scan_seconds": round(statistics.median(cold), 4),
+            "warm_index_seconds": round(statistics.median(warm), 4),
+            "speedup": round(statistics.median(cold) / statistics.median(warm), 1),
+        }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""Measure bulk library import throughput (books/second) against the number of worker processes.
+
+Writes `--books` copies of the sample Dracula text as separate `.txt` books,
+imports them into a fresh library once per worker count in `--workers`, and
+finally times a resumed run in which every book is skipped as unchanged.
+Speed-up is relative to the first worker count; it cannot exceed the number
+of cores reported as `cpu_count`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_BOOK
+from sample_code.bulk_import import import_library
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--books", type=int, default=48)
+    parser.add_argument("--workers", default="1,2,4", help="comma-separated worker counts to try")
+    args = parser.parse_args()
+    counts = [int(n) for n in args.workers.split(",")]
+
+    results = {"cpu_count": os.cpu_count(), "books": args.books, "runs": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / "books"
+        source.mkdir()
+        for i in range(args.books):
+            shutil.copyfile(SAMPLE_BOOK, source / f"book{i:04d}.txt")
+
+        base = None
+        for workers in counts:
+            library = tmp / f"library{workers}"
+            summary = import_library([str(source)], library, workers=workers)
+            base = base or summary["books_per_second"]
+            results["runs"][workers] = {
+                "seconds": summary["seconds"],
+                "books_per_second": summary["books_per_second"],
+                "speedup": round(summary["books_per_second"] / base, 2),
+                "failed": summary["failed"],
+            }
+
+        resumed = import_library([str(source)], tmp / f"library{counts[-1]}", workers=counts[-1])
+        results["resume_all_skipped_seconds"] = resumed["seconds"]
+        results["resume_skipped"] = resumed["skipped"]
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
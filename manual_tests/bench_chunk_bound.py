@@ -0,0 +1,90 @@
+"""Show the worst-case chunk length and synthesis latency on pathological text.
+
+Builds scenes with no sentence punctuation (a run-on paragraph, a long comma
+list, a table of contents joined into one line, one giant token) and feeds them
+through BookReader.get_next_chunk twice: with the sentence length bound
+disabled (the old behaviour) and with it enabled. Synthesis latency is
+estimated from chunk length, a speaking rate and a model real-time factor.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import sample_code.reader as reader_module
+from sample_code import sentences
+from sample_code.book_index import manifest_path
+from sample_code.reader import BookReader, Scene
+
+CHARS_PER_SECOND = 15.0   # ~150 spoken words per minute
+
+
+def pathological_texts(scale: int) -> list[str]:
+    run_on = " ".join(f"and then the carriage went on word{i}" for i in range(60 * scale))
+    commas = ", ".join(f"item {i} of the inventory" for i in range(80 * scale))
+    toc = " ".join(f"Chapter {i} The Journey Continues {i * 7}" for i in range(40 * scale))
+    token = "x" * (2000 * scale)
+    return [f"# Scene\n{t}\n" for t in (run_on, commas, toc, token)]
+
+
+def write_scenes(scenes_dir: Path, texts: list[str]) -> None:
+    ch_dir = scenes_dir / "ch01"
+    ch_dir.mkdir(parents=True)
+    for i, text in enumerate(texts, 1):
+        (ch_dir / f"scene{i}.md").write_text(text, encoding="utf-8")
+
+
+def measure(scenes_dir: Path, max_chars: int, rtf: float) -> dict:
+    Scene.cache.clear()
+    manifest_path(scenes_dir).unlink(missing_ok=True)   # sentence counts differ per run
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader = BookReader(scenes_dir, progress_file=scenes_dir.parent / "progress.json")
+    lengths = []
+    started = time.perf_counter()
+    while (chunk := reader.get_next_chunk(max_chars=max_chars)) is not None:
+        lengths.append(len(chunk))
+    elapsed = time.perf_counter() - started
+    worst = max(lengths)
+    return {
+        "chunks": len(lengths),
+        "max_chunk_chars": worst,
+        "worst_synthesis_s": round(worst / CHARS_PER_SECOND / rtf, 2),
+        "chunking_ms": round(elapsed * 1000, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=5, help="Multiply pathological text length.")
+    parser.add_argument("--max-chars", type=int, default=500, help="Chunk budget passed to get_next_chunk.")
+    parser.add_argument("--rtf", type=float, default=3.0, help="Model real-time factor.")
+    args = parser.parse_args()
+
+    results = {"max_chars": args.max_chars, "sentence_limit": sentences.MAX_SENTENCE_CHARS}
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes_dir = Path(tmp) / "scenes"
+        write_scenes(scenes_dir, pathological_texts(args.scale))
+        bounded = sentences.segment_sentences
+        try:
+            reader_module.segment_sentences = lambda text: bounded(text, max_chars=sys.maxsize)
+            results["unbounded"] = measure(scenes_dir, args.max_chars, args.rtf)
+        finally:
+            reader_module.segment_sentences = bounded
+        results["bounded"] = measure(scenes_dir, args.max_chars, args.rtf)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+"""Compare reaching chunk N by replaying get_next_chunk with a chunk plan seek.
+
+Also reports the one-time cost of building the plan and of loading it back
+from `.chunk_plan.json`, on a copy of the sample book.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_SCENES
+from sample_code.reader import BookReader
+
+
+def open_reader(scenes_dir: Path, progress: Path) -> BookReader:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return BookReader(scenes_dir, progress_file=progress)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-chars", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes_dir = Path(tmp) / "scenes"
+        shutil.copytree(SAMPLE_SCENES, scenes_dir)
+        progress = Path(tmp) / "progress.json"
+
+        reader = open_reader(scenes_dir, progress)
+        started = time.perf_counter()
+        plan = reader.chunk_plan(args.max_chars)
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        open_reader(scenes_dir, progress).chunk_plan(args.max_chars)
+        load_s = time.perf_counter() - started
+
+        target = len(plan) - 1
+        walker = open_reader(scenes_dir, progress)
+        started = time.perf_counter()
+        for _ in range(target):
+            walker.get_next_chunk(max_chars=args.max_chars)
+        replay_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        reader.seek_chunk(plan, target)
+        text = reader.chunk_text(plan, target)
+        seek_s = time.perf_counter() - started
+        assert text == walker.get_next_chunk(max_chars=args.max_chars)
+        reader.flush_progress()
+
+    print(json.dumps({
+        "chunks": len(plan),
+        "plan_build_s": round(build_s, 4),
+        "plan_load_s": round(load_s, 4),
+        "replay_to_last_chunk_s": round(replay_s, 4),
+        "seek_to_last_chunk_ms": round(seek_s * 1000, 3),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,56 @@
+"""Report `_clean_text` throughput in MB/s on dracula.txt-sized inputs.
+
+Times the whole-text cleaner against the original line-by-line implementation
+(kept in tests/test_clean_text.py as the parity reference).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_BOOK
+from clean_text_reference import reference_clean_text
+from sample_code.reader import _clean_text
+
+
+def throughput(func, raw: str, repeat: int) -> float:
+    """Return the best MB/s over `repeat` runs."""
+    size_mb = len(raw.encode("utf-8")) / 1_000_000
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(raw)
+        best = min(best, time.perf_counter() - started)
+    return size_mb / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--book", default=str(SAMPLE_BOOK), help="Plain-text book to clean.")
+    parser.add_argument("--scale", type=int, default=1, help="Repeat the book N times.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per implementation.")
+    args = parser.parse_args()
+
+    raw = Path(args.book).read_text(encoding="utf-8") * args.scale
+    assert _clean_text(raw) == reference_clean_text(raw), "cleaner output diverged from reference"
+
+    current = throughput(_clean_text, raw, args.repeat)
+    reference = throughput(reference_clean_text, raw, args.repeat)
+    print(json.dumps({
+        "input_mb": round(len(raw.encode("utf-8")) / 1_000_000, 2),
+        "clean_text_mb_per_s": round(current, 1),
+        "line_by_line_mb_per_s": round(reference, 1),
+        "speedup": round(current / reference, 1),
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+"""Deterministic synthetic books for the manual benchmarks.
+
+Scene text is recycled from `sample_book/scenes`, so generated books have
+realistic sentence lengths and markdown artefacts without needing a download.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_SCENES = ROOT / "sample_book" / "scenes"
+SAMPLE_BOOK = ROOT / "sample_book" / "dracula.txt"
+
+
+def sample_scene_texts() -> list[str]:
+    """Return the sample book's scene files in a stable order."""
+    return [path.read_text(encoding="utf-8") for path in sorted(SAMPLE_SCENES.rglob("*.md"))]
+
+
+def write_scene_tree(root: Path, scenes: int, scenes_per_chapter: int = 10, text: str | None = None) -> Path:
+    """Write a ch01/scene1.md style tree with `scenes` files beneath root.
+
+    Scene bodies cycle through the sample book unless a fixed `text` is given.
+    """
+    texts = [text] if text is not None else sample_scene_texts()
+    root.mkdir(parents=True, exist_ok=True)
+    for i in range(scenes):
+        ch, sc = divmod(i, scenes_per_chapter)
+        ch_dir = root / f"ch{ch + 1:02d}"
+        if sc == 0:
+            ch_dir.mkdir(exist_ok=True)
+        (ch_dir / f"scene{sc + 1}.md").write_text(texts[i % len(texts)], encoding="utf-8")
+    return root
+
+
+def write_long_book(path: Path, copies: int) -> Path:
+    """Write a Gutenberg-style `.txt` holding the sample book's chapters `copies` times.
+
+    Chapters are renumbered (CHAPTER 1 … CHAPTER 27·copies) so every copy is
+    split into its own chapters, just like one very long novel.
+    """
+    from sample_code.book_structure import RE_CHAPTER, gutenberg_bounds
+
+    lines = SAMPLE_BOOK.read_text(encoding="utf-8").splitlines(keepends=True)
+    start, end = gutenberg_bounds(lines)
+    body = lines[start:end]
+    first = next(i for i, line in enumerate(body) if RE_CHAPTER.match(line.strip()))
+    head, chapters = lines[:start] + body[:first], body[first:]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    number = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(head)
+        for _ in range(copies):
+            for line in chapters:
+                if RE_CHAPTER.match(line.strip()):
+                    number += 1
+                    line = f"CHAPTER {number}\n"
+                f.write(line)
+        f.writelines(lines[end:])
+    return path
@@ -0,0 +1,108 @@
+"""Measure time-to-first-audio for fixed vs latency-ramped chunking.
+
+Uses a stub TTS model whose synthesis time is audio duration divided by a
+configurable real-time factor (RTF), so no MLX model is needed. Synthesis is
+sequential, like BufferedSpeaker; playback starts when the first chunk is
+ready and any later wait for the next chunk counts as a stall.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_SCENES
+from sample_code.chunking import ChunkPlanner
+from sample_code.reader import BookReader
+from sample_code.speaker import DEFAULT_TTS_MODEL_ID, available_tts_models, chunk_settings
+
+SAMPLE_RATE = 24000
+CHARS_PER_SECOND = 15.0   # ~150 spoken words per minute
+
+
+class StubModel:
+    """Sleeps for (speech duration / rtf) * time_scale, then returns silence."""
+
+    def __init__(self, rtf: float, time_scale: float):
+        self.rtf = rtf
+        self.time_scale = time_scale
+
+    def generate(self, text: str, **kwargs):
+        duration = len(text) / CHARS_PER_SECOND
+        time.sleep(duration / self.rtf * self.time_scale)
+        yield SimpleNamespace(audio=np.zeros(int(SAMPLE_RATE * duration), dtype=np.float32))
+
+
+def simulate(reader: BookReader, next_chunk, model: StubModel, chunks: int) -> dict:
+    """Synthesize `chunks` chunks and model playback against the synthesis timeline."""
+    started = time.perf_counter()
+    first_audio = None
+    play_until = 0.0   # scaled seconds at which queued audio runs out
+    stall = 0.0
+    sizes = []
+    for _ in range(chunks):
+        text = next_chunk(reader)
+        if text is None:
+            break
+        audio = next(model.generate(text)).audio
+        ready = (time.perf_counter() - started) / model.time_scale
+        if first_audio is None:
+            first_audio = ready
+            play_until = ready
+        elif ready > play_until:
+            stall += ready - play_until
+            play_until = ready
+        play_until += audio.size / SAMPLE_RATE
+        sizes.append(len(text))
+    return {
+        "time_to_first_audio_s": round(first_audio or 0.0, 2),
+        "stall_after_start_s": round(stall, 2),
+        "chunk_chars": sizes,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default=DEFAULT_TTS_MODEL_ID, choices=available_tts_models(),
+                        help="Model whose chunking settings to use.")
+    parser.add_argument("--rtf", type=float, default=3.0, help="Stub real-time factor (audio seconds per second).")
+    parser.add_argument("--chunks", type=int, default=12, help="Chunks to synthesize per strategy.")
+    parser.add_argument("--time-scale", type=float, default=0.02, help="Shrink stub sleeps by this factor.")
+    args = parser.parse_args()
+
+    settings = chunk_settings(args.model)
+    model = StubModel(args.rtf, args.time_scale)
+    results = {"model": args.model, "rtf": args.rtf, "chunking": settings}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes_dir = Path(tmp) / "scenes"
+        shutil.copytree(SAMPLE_SCENES, scenes_dir)
+        strategies = {
+            "fixed_max_chars": lambda r: r.get_next_chunk(max_chars=settings["max_chars"]),
+            "ramped": ChunkPlanner.from_settings(settings).next_chunk,
+        }
+        for name, next_chunk in strategies.items():
+            with contextlib.redirect_stdout(io.StringIO()):
+                reader = BookReader(scenes_dir, progress_file=Path(tmp) / "progress.json")
+            reader.go_to(1, 2)
+            results[name] = simulate(reader, next_chunk, model, args.chunks)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""Time-to-first-scene on a deep folder tree: full scan versus progressive loading.
+
+Writes a synthetic Part/Volume/Chapter tree (20,000 scenes by default) to a
+temp folder and, with no `.book_index.json`, times BookReader construction
+plus reading the first scene's sentences. The progressive mode also reports
+how long background indexing takes to finish.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import sample_scene_texts
+from sample_code.book_index import manifest_path
+from sample_code.reader import BookReader
+
+
+def write_deep_tree(root: Path, scenes: int, per_chapter: int = 8, chapters_per_volume: int = 25,
+                    volumes_per_part: int = 4) -> Path:
+    """Write Part NN/Volume NN/Chapter NNN - Title/Chapter NNN Scene NNN - Title.txt files."""
+    texts = sample_scene_texts()
+    for i in range(scenes):
+        ch, sc = divmod(i, per_chapter)
+        vol = ch // chapters_per_volume
+        part = vol // volumes_per_part
+        folder = root / f"Part {part + 1:02d}" / f"Volume {vol + 1:02d}" / f"Chapter {ch + 1:03d} - Title"
+        if sc == 0:
+            folder.mkdir(parents=True, exist_ok=True)
+        name = f"Chapter {ch + 1:03d} Scene {sc + 1:03d} - Title.txt"
+        (folder / name).write_text(texts[i % len(texts)], encoding="utf-8")
+    return root
+
+
+def first_scene(scenes_dir: Path, progress: Path, progressive: bool) -> tuple[float, float]:
+    """Return (seconds to the first scene's sentences, seconds until fully indexed)."""
+    manifest_path(scenes_dir).unlink(missing_ok=True)
+    progress.unlink(missing_ok=True)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader = BookReader(scenes_dir, progress_file=progress, progressive=progressive)
+        reader.current.sentences()
+        first = time.perf_counter() - started
+        reader.wait_for_index()
+    return first, time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", type=int, default=20_000, help="Number of synthetic scenes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes_dir = write_deep_tree(Path(tmp) / "book", args.scenes)
+        progress = Path(tmp) / "progress.json"
+        full = [first_scene(scenes_dir, progress, False) for _ in range(args.repeat)]
+        progressive = [first_scene(scenes_dir, progress, True) for _ in range(args.repeat)]
+
+    full_first = statistics.median(r[0] for r in full)
+    prog_first = statistics.median(r[0] for r in progressive)
+    summary = {
+        "scenes": args.scenes,
+        "full_scan_first_scene_seconds": round(full_first, 4),
+        "progressive_first_scene_seconds": round(prog_first, 4),
+        "progressive_fully_indexed_seconds": round(statistics.median(r[1] for r in progressive), 3),
+        "speedup": round(full_first / prog_first, 1),
+    }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+"""Time BookReader navigation (go_to and chapter jumps) on very large scene trees.
+
+Navigation should cost the same per call whether the book has 100 scenes or
+tens of thousands; compare the per-call timings across --scenes values.
+`index_lookup_us` times the SceneIndex lookups behind them on their own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import write_scene_tree
+from sample_code.reader import BookReader, SceneIndex
+
+
+def per_call_us(func, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", type=int, default=20000, help="Number of synthetic scenes.")
+    parser.add_argument("--calls", type=int, default=2000, help="Navigation calls per operation.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes_dir = write_scene_tree(Path(tmp) / "book", args.scenes, text="# Scene\nShort text.")
+        with contextlib.redirect_stdout(io.StringIO()):
+            reader = BookReader(scenes_dir, progress_file=Path(tmp) / "progress.json")
+
+        rng = random.Random(0)
+        targets = [(sc.chapter, sc.scene) for sc in reader._scenes]
+
+        def go_to():
+            reader.go_to(*rng.choice(targets))
+
+        def next_chapter():
+            if reader.next_chapter() is None:
+                reader.go_to(*targets[0])
+
+        def prev_chapter():
+            if reader.prev_chapter() is None:
+                reader.go_to(*targets[-1])
+
+        index = SceneIndex(reader._scenes)
+
+        def index_lookup():
+            i = rng.randrange(len(targets))
+            index.positions[targets[i]]
+            index.chapter_start(i)
+            index.next_chapter_start(i)
+
+        summary = {
+            "scenes": len(reader._scenes),
+            "chapters": reader._chapter_count(),
+            "go_to_us": round(per_call_us(go_to, args.calls), 2),
+            "next_chapter_us": round(per_call_us(next_chapter, args.calls), 2),
+            "prev_chapter_us": round(per_call_us(prev_chapter, args.calls), 2),
+            "index_lookup_us": round(per_call_us(index_lookup, args.calls), 2),
+        }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,98 @@
+"""Compare a scene folder with a packed `.tbrpack` book: open, full read and seek.
+
+Splits the sample Dracula text both ways, then times opening the book (folder
+scan, folder with a warm `.book_index.json`, packed), reading every scene's
+text with an empty scene cache, and random seeks that each read one uncached
+scene (go_to + get_next_chunk).
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_BOOK
+from sample_code.book_index import manifest_path
+from sample_code.reader import BookReader, Scene
+from sample_code.splitter import BookSplitter
+
+
+def open_book(path: Path, progress: Path) -> tuple[BookReader, float]:
+    Scene.cache.clear()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader = BookReader(path, progress_file=progress)
+    return reader, time.perf_counter() - started
+
+
+def read_all(reader: BookReader) -> float:
+    Scene.cache.clear()
+    started = time.perf_counter()
+    for sc in reader._scenes:
+        sc.text()
+    return time.perf_counter() - started
+
+
+def seeks(reader: BookReader, count: int, seed: int) -> float:
+    rng = random.Random(seed)
+    targets = [(sc.chapter, sc.scene) for sc in reader._scenes]
+    Scene.cache.clear()
+    started = time.perf_counter()
+    for _ in range(count):
+        reader.go_to(*rng.choice(targets))
+        Scene.cache.clear()   # every seek lands on an uncached scene
+        reader.get_next_chunk()
+    elapsed = time.perf_counter() - started
+    reader.flush_progress()
+    return elapsed / count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeks", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        splitter = BookSplitter(verbose=False)
+        folder = splitter.split_book(SAMPLE_BOOK, tmp / "scenes")
+        pack = splitter.split_book(SAMPLE_BOOK, tmp / "dracula.tbrpack")
+        progress = tmp / "progress.json"
+
+        manifest_path(folder).unlink(missing_ok=True)
+        reader, scan_s = open_book(folder, progress)
+        _, index_s = open_book(folder, progress)
+        results["folder"] = {
+            "open_scan_ms": round(scan_s * 1000, 2),
+            "open_index_ms": round(index_s * 1000, 2),
+            "read_all_ms": round(read_all(reader) * 1000, 2),
+            "seek_us": round(seeks(reader, args.seeks, args.seed) * 1e6, 1),
+        }
+
+        reader, open_s = open_book(pack, progress)
+        results["packed"] = {
+            "bytes": pack.stat().st_size,
+            "open_ms": round(open_s * 1000, 2),
+            "read_all_ms": round(read_all(reader) * 1000, 2),
+            "seek_us": round(seeks(reader, args.seeks, args.seed) * 1e6, 1),
+        }
+        results["scenes"] = len(reader._scenes)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
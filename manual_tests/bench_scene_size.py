@@ -0,0 +1,102 @@
+"""Show per-scene load latency with and without a maximum scene size, for ever longer undivided acts.
+
+Writes a play whose acts hold `--sizes` kilobytes of sample prose each (no
+journal dates, so nothing splits an act), splits it with and without
+`max_scene_chars`, and times loading each scene cold (read, clean and
+segment, with the splitter's sentence stream removed so the files are read).
+Without a bound the slowest scene grows with the act; with one it stays flat.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_BOOK
+from sample_code.book_structure import RE_CHAPTER, RE_JOURNAL_DATE, gutenberg_bounds
+from sample_code.reader import BookReader, Scene
+from sample_code.splitter import BookSplitter
+from sample_code.tts_stream import STREAM_NAME
+
+
+def prose_lines() -> list[str]:
+    lines = SAMPLE_BOOK.read_text(encoding="utf-8").splitlines(keepends=True)
+    start, end = gutenberg_bounds(lines)
+    return [l for l in lines[start:end] if not RE_CHAPTER.match(l.strip()) and not RE_JOURNAL_DATE.match(l)]
+
+
+def write_play(path: Path, sizes_kb: list[int]) -> Path:
+    prose = prose_lines()
+    with open(path, "w", encoding="utf-8") as f:
+        for act, kb in enumerate(sizes_kb, start=1):
+            f.write(f"ACT {act}\n\n")
+            written, i = 0, 0
+            while written < kb * 1024:
+                line = prose[i % len(prose)]
+                f.write(line)
+                written += len(line)
+                i += 1
+            f.write("\n")
+    return path
+
+
+def scene_latencies(scenes: Path, progress: Path) -> dict[int, list[float]]:
+    """Return {act: [cold load seconds per scene]}."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader = BookReader(scenes, progress_file=progress)
+    by_act: dict[int, list[float]] = {}
+    for sc in reader._scenes:
+        Scene.cache.clear()
+        started = time.perf_counter()
+        sc.sentences()
+        by_act.setdefault(sc.chapter, []).append(time.perf_counter() - started)
+    reader.flush_progress()
+    return by_act
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,500,2000", help="comma-separated act sizes in KB")
+    parser.add_argument("--max-scene-chars", type=int, default=20_000)
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    results = {"max_scene_chars": args.max_scene_chars, "acts": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        book = write_play(tmp / "play.txt", sizes)
+        runs = {}
+        for name, bound in (("unbounded", None), ("bounded", args.max_scene_chars)):
+            out = tmp / name
+            BookSplitter(verbose=False, max_scene_chars=bound).import_book(book, out)
+            os.remove(out / STREAM_NAME)
+            runs[name] = scene_latencies(out, tmp / f"{name}.json")
+
+        for act, kb in enumerate(sizes, start=1):
+            row = {"act_kb": kb}
+            for name, by_act in runs.items():
+                times = by_act[act]
+                row[name] = {
+                    "scenes": len(times),
+                    "max_ms": round(max(times) * 1000, 2),
+                    "median_ms": round(statistics.median(times) * 1000, 2),
+                }
+            results["acts"].append(row)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Measure the scene table of a large library: load time and retained memory.
+
+Writes a synthetic tree (100,000 scenes by default, tiny bodies) to a temp
+folder, then times a cold scan and a warm `.book_index.json` load and reports
+the memory retained by the loaded scene list, as tracked by tracemalloc.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import write_scene_tree
+from sample_code.book_index import manifest_path
+from sample_code.reader import BookReader, _scene_sort_key
+
+
+def open_book(scenes_dir: Path, progress: Path) -> tuple[BookReader, float]:
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader = BookReader(scenes_dir, progress_file=progress)
+    return reader, time.perf_counter() - started
+
+
+def scene_table_bytes(scenes_dir: Path, progress: Path) -> int:
+    """Bytes still allocated by a warm open once only the scene list is kept."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    reader, _ = open_book(scenes_dir, progress)
+    scenes = reader._scenes
+    del reader
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del scenes
+    return retained
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", type=int, default=100_000, help="Number of synthetic scenes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scenes_dir = write_scene_tree(Path(tmp) / "book", args.scenes, scenes_per_chapter=50,
+                                      text="# Title\nOne short sentence. Another one.")
+        progress = Path(tmp) / "progress.json"
+
+        manifest_path(scenes_dir).unlink(missing_ok=True)
+        reader, cold = open_book(scenes_dir, progress)
+        warm = [open_book(scenes_dir, progress)[1] for _ in range(args.repeat)]
+
+        scenes = list(reader._scenes)
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            sorted(scenes, key=_scene_sort_key)
+        sort_seconds = (time.perf_counter() - started) / args.repeat
+        del reader, scenes
+
+        retained = scene_table_bytes(scenes_dir, progress)
+        summary = {
+            "scenes": args.scenes,
+            "cold_scan_seconds": round(cold, 3),
+            "warm_index_seconds": round(statistics.median(warm), 3),
+            "sort_seconds": round(sort_seconds, 4),
+            "scene_table_mb": round(retained / 2**20, 1),
+            "bytes_per_scene": round(retained / args.scenes),
+        }
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
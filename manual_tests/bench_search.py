@@ -0,0 +1,91 @@
+"""Time search index builds and query latency on the sample book and a scaled corpus.
+
+For each corpus: a cold build of `.search_index.sqlite`, a no-op incremental
+update after reopening the book, and query latency (median and worst of
+`--repeat` runs, for the first 100 hits and for all hits) for common, rare,
+multi-word, phrase and missing queries.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_SCENES, write_scene_tree
+from sample_code.reader import BookReader
+from sample_code.search_index import search_index_path
+
+QUERIES = ["the", "transylvania", "count dracula", '"the count"', "professor van helsing", "xylophone"]
+
+
+def open_reader(scenes_dir: Path, progress: Path) -> BookReader:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return BookReader(scenes_dir, progress_file=progress)
+
+
+def bench(scenes_dir: Path, progress: Path, repeat: int) -> dict:
+    reader = open_reader(scenes_dir, progress)
+    started = time.perf_counter()
+    reader.search_index()
+    build_s = time.perf_counter() - started
+
+    reader = open_reader(scenes_dir, progress)
+    started = time.perf_counter()
+    reader.search_index()
+    update_s = time.perf_counter() - started
+
+    queries = {}
+    for query in QUERIES:
+        result = {}
+        for label, limit in (("first_100", 100), ("all", None)):
+            times = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                hits = reader.search(query, limit=limit)
+                times.append(time.perf_counter() - started)
+            result[f"{label}_median_ms"] = round(statistics.median(times) * 1000, 3)
+            result[f"{label}_max_ms"] = round(max(times) * 1000, 3)
+        result["hits"] = len(hits)
+        queries[query] = result
+    return {
+        "scenes": len(reader._scenes),
+        "build_s": round(build_s, 3),
+        "noop_update_ms": round(update_s * 1000, 2),
+        "index_bytes": search_index_path(scenes_dir).stat().st_size,
+        "queries": queries,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=50, help="Synthetic corpus size as a multiple of the sample book.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        sample = tmp / "dracula"
+        shutil.copytree(SAMPLE_SCENES, sample)
+        results["dracula"] = bench(sample, tmp / "progress.json", args.repeat)
+
+        scaled = write_scene_tree(tmp / "scaled", results["dracula"]["scenes"] * args.scale)
+        results[f"{args.scale}x"] = bench(scaled, tmp / "progress.json", args.repeat)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
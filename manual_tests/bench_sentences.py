@@ -0,0 +1,68 @@
+"""Compare span-based sentence segmentation with the old list-of-strings split.
+
+Runs on the largest scenes in `sample_book/scenes` (ch21/scene2.md first) and
+reports segmentation time plus the memory each representation keeps alive.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_SCENES
+from sample_code.reader import _clean_text
+from sample_code.sentences import segment_sentences
+from tests.test_sentences import reference_sentences
+
+
+def best_time(func, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def retained_bytes(func, text: str) -> int:
+    """Bytes still allocated by func's result (the shared text is excluded)."""
+    tracemalloc.start()
+    result = func(text)
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenes", type=int, default=3, help="How many of the largest scenes to measure.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per scene.")
+    args = parser.parse_args()
+
+    largest = sorted(SAMPLE_SCENES.rglob("*.md"), key=lambda p: p.stat().st_size, reverse=True)
+    runs = []
+    for path in largest[:args.scenes]:
+        text = _clean_text(path.read_text(encoding="utf-8"))
+        runs.append({
+            "scene": path.relative_to(SAMPLE_SCENES).as_posix(),
+            "chars": len(text),
+            "sentences": len(segment_sentences(text)),
+            "list_ms": round(best_time(reference_sentences, text, args.repeat) * 1000, 2),
+            "spans_ms": round(best_time(segment_sentences, text, args.repeat) * 1000, 2),
+            "list_bytes": retained_bytes(reference_sentences, text),
+            "spans_bytes": retained_bytes(segment_sentences, text),
+        })
+    print(json.dumps(runs, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+"""Compare the streaming BookSplitter with a whole-file split: throughput and peak memory.
+
+Builds a Gutenberg-style book by concatenating renumbered copies of the sample
+Dracula text up to `--megabytes`, then splits it into a scenes folder twice,
+each in a fresh subprocess so peak RSS is measured per run:
+
+    whole-file   readlines() + plan_scenes, every scene sliced from the full line list
+    streaming    BookSplitter.split_book (one pass, one chapter in memory)
+
+With `--gzip` the streaming run also reads a gzip-compressed copy of the book.
+Both outputs are compared file by file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import SAMPLE_BOOK, write_long_book
+
+
+def whole_file_split(book: Path, out_dir: Path) -> None:
+    """The splitter before streaming: read every line, plan, then write."""
+    from sample_code.book_structure import plan_scenes, scene_content
+    from sample_code.splitter import write_scene
+
+    with open(book, encoding="utf-8", errors="replace") as f:
+        lines = f.readlines()
+    _fmt, plans = plan_scenes(lines, book.stem)
+    for p in plans:
+        write_scene(out_dir / f"ch{p.chapter:02d}" / f"scene{p.scene}.md", p.title, scene_content(lines, p))
+
+
+def run_one(mode: str, book: Path, out_dir: Path) -> dict:
+    from sample_code.splitter import BookSplitter
+
+    started = time.perf_counter()
+    if mode == "whole-file":
+        whole_file_split(book, out_dir)
+    else:
+        BookSplitter(verbose=False).split_book(book, out_dir)
+    elapsed = time.perf_counter() - started
+    return {"seconds": round(elapsed, 2), "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+
+
+def measure(mode: str, book: Path, out_dir: Path, book_bytes: int) -> dict:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--run", mode, str(book), str(out_dir)],
+        check=True, capture_output=True, text=True,
+    )
+    result = json.loads(proc.stdout)
+    result["mb_per_s"] = round(book_bytes / (1 << 20) / result["seconds"], 1)
+    return result
+
+
+def tree_digest(root: Path) -> str:
+    h = hashlib.sha1()
+    for path in sorted(root.rglob("*.md")):
+        h.update(path.relative_to(root).as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--megabytes", type=int, default=100, help="approximate size of the generated book")
+    parser.add_argument("--gzip", action="store_true", help="also split a gzip-compressed copy")
+    parser.add_argument("--run", nargs=3, metavar=("MODE", "BOOK", "OUT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        mode, book, out_dir = args.run
+        print(json.dumps(run_one(mode, Path(book), Path(out_dir))))
+        return 0
+
+    copies = max(1, round(args.megabytes * (1 << 20) / SAMPLE_BOOK.stat().st_size))
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        book = write_long_book(tmp / "corpus.txt", copies)
+        size = book.stat().st_size
+        results["book_mb"] = round(size / (1 << 20), 1)
+
+        results["whole_file"] = measure("whole-file", book, tmp / "whole", size)
+        results["streaming"] = measure("streaming", book, tmp / "stream", size)
+        results["scenes"] = sum(1 for _ in (tmp / "stream").rglob("*.md"))
+        results["identical_output"] = tree_digest(tmp / "whole") == tree_digest(tmp / "stream")
+        shutil.rmtree(tmp / "whole")
+
+        if args.gzip:
+            compressed = tmp / "corpus.txt.gz"
+            with open(book, "rb") as src, gzip.open(compressed, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+            results["streaming_gzip"] = measure("streaming", compressed, tmp / "gz", size)
+            results["streaming_gzip"]["identical_output"] = tree_digest(tmp / "gz") == tree_digest(tmp / "stream")
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,245 @@
+"""Splitter and reader benchmark suite over the sample book scaled 10×, 100× and 1000×.
+
+For each `--scales` factor, `bench_corpus.write_long_book` writes a
+deterministic Gutenberg-style book of that many renumbered copies of
+`sample_book/dracula.txt` (about 0.85 MB per copy, so 1000× is ~850 MB and
+needs ~3 GB of scratch space with its split output). The suite then times:
+
+    split          BookSplitter.split_book into a scenes folder
+    open           BookReader construction from the splitter's index, and by a full scan
+    clean_text     _clean_text over every scene file's raw text (MB/s)
+    sentences      segment_sentences over every cleaned scene, and Scene.sentences()
+                   through the reader with an empty cache (the splitter's stream)
+    chunks         get_next_chunk from the first scene to the end of the book
+    navigation     random go_to, next_scene / next_chapter / prev_chapter across the book
+
+Results are printed and written to `--output` as JSON. With `--compare` a
+previous result file is loaded and every timing that got slower by more than
+`--threshold` is reported (exit status 1), so runs on one laptop can be
+compared for regressions. Generated books are kept in `--corpus-dir` when
+given, so repeated runs skip generating them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import write_long_book
+from sample_code.book_index import MANIFEST_NAME
+from sample_code.reader import BookReader, Scene, _clean_text
+from sample_code.sentences import segment_sentences
+from sample_code.splitter import BookSplitter
+from sample_code.tts_stream import STREAM_NAME
+
+NAV_JUMPS = 2000
+
+
+def quiet():
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def corpus(corpus_dir: Path, copies: int) -> Path:
+    """Return the scaled book, generating it unless corpus_dir already has it."""
+    path = corpus_dir / f"dracula_x{copies}.txt"
+    done = path.with_name(path.name + ".done")
+    if not done.exists():
+        write_long_book(path, copies)
+        done.touch()
+    return path
+
+
+def open_reader(scenes: Path, progress: Path) -> tuple[float, BookReader]:
+    Scene.cache.clear()
+    with quiet():
+        return timed(BookReader, scenes, progress_file=progress)
+
+
+def bench_text(reader: BookReader) -> dict:
+    """Time _clean_text and segment_sentences scene by scene, excluding file reads."""
+    raw_bytes = clean_s = segment_s = 0.0
+    sentences = 0
+    for sc in reader._scenes:
+        with open(sc.filename, encoding="utf-8") as f:
+            raw = f.read()
+        raw_bytes += len(raw.encode("utf-8"))
+        t, text = timed(_clean_text, raw)
+        clean_s += t
+        t, spans = timed(segment_sentences, text)
+        segment_s += t
+        sentences += len(spans)
+    mb = raw_bytes / 1e6
+    return {
+        "clean_text_s": round(clean_s, 3),
+        "clean_text_mb_per_s": round(mb / clean_s, 2) if clean_s else None,
+        "segment_s": round(segment_s, 3),
+        "sentences": sentences,
+    }
+
+
+def bench_scene_sentences(reader: BookReader) -> float:
+    Scene.cache.clear()
+    started = time.perf_counter()
+    for sc in reader._scenes:
+        sc.sentences()
+    return time.perf_counter() - started
+
+
+def bench_chunks(reader: BookReader, max_chars: int) -> dict:
+    reader.go_to_scene(reader._scenes[0])
+    Scene.cache.clear()
+    chunks = chars = 0
+    started = time.perf_counter()
+    while (chunk := reader.get_next_chunk(max_chars)) is not None:
+        chunks += 1
+        chars += len(chunk)
+    elapsed = time.perf_counter() - started
+    return {
+        "chunks_s": round(elapsed, 3),
+        "chunks": chunks,
+        "chunks_per_s": round(chunks / elapsed) if elapsed else None,
+        "chunk_chars": chars,
+    }
+
+
+def bench_navigation(reader: BookReader) -> dict:
+    scenes = reader._scenes
+    rng = random.Random(0)
+    targets = [scenes[rng.randrange(len(scenes))] for _ in range(NAV_JUMPS)]
+    go_to_s, _ = timed(lambda: [reader.go_to(sc.chapter, sc.scene) for sc in targets])
+
+    reader.go_to_scene(scenes[0])
+    next_scene_s, _ = timed(lambda: [reader.next_scene() for _ in range(len(scenes) - 1)])
+    reader.go_to_scene(scenes[0])
+    started = time.perf_counter()
+    chapters = 0
+    while reader.next_chapter() is not None:
+        chapters += 1
+    next_chapter_s = time.perf_counter() - started
+    started = time.perf_counter()
+    while reader.prev_chapter() is not None:
+        pass
+    prev_chapter_s = time.perf_counter() - started
+    us = lambda seconds, n: round(seconds / max(n, 1) * 1e6, 2)
+    return {
+        "go_to_us": us(go_to_s, NAV_JUMPS),
+        "next_scene_us": us(next_scene_s, len(scenes) - 1),
+        "next_chapter_us": us(next_chapter_s, chapters),
+        "prev_chapter_us": us(prev_chapter_s, chapters),
+    }
+
+
+def bench_scale(copies: int, corpus_dir: Path, work: Path, max_chars: int) -> dict:
+    book = corpus(corpus_dir, copies)
+    scenes = work / f"scenes_x{copies}"
+    shutil.rmtree(scenes, ignore_errors=True)
+    result = {"copies": copies, "book_mb": round(book.stat().st_size / 1e6, 2)}
+
+    split_s, _ = timed(BookSplitter(verbose=False).split_book, book, scenes)
+    result["split_s"] = round(split_s, 3)
+    result["split_mb_per_s"] = round(result["book_mb"] / split_s, 2)
+
+    open_s, reader = open_reader(scenes, work / "progress.json")
+    result["open_index_s"] = round(open_s, 4)
+    result["scenes"] = len(reader._scenes)
+    result["scene_sentences_stream_s"] = round(bench_scene_sentences(reader), 3)
+    result.update(bench_chunks(reader, max_chars))
+    result.update(bench_navigation(reader))
+    reader.flush_progress()
+
+    os.remove(scenes / STREAM_NAME)
+    os.remove(scenes / MANIFEST_NAME)
+    open_s, reader = open_reader(scenes, work / "progress.json")
+    result["open_scan_s"] = round(open_s, 3)
+    result["scene_sentences_files_s"] = round(bench_scene_sentences(reader), 3)
+    result.update(bench_text(reader))
+    reader.flush_progress()
+    Scene.cache.clear()
+    shutil.rmtree(scenes, ignore_errors=True)
+    return result
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def regressions(old: dict, new: dict, threshold: float) -> list[dict]:
+    """Compare the timings (keys ending in _s or _us) of scales present in both runs."""
+    found = []
+    old_scales = {str(r["copies"]): r for r in old.get("scales", [])}
+    for row in new["scales"]:
+        before = old_scales.get(str(row["copies"]))
+        if before is None:
+            continue
+        for key, value in row.items():
+            if not key.endswith(("_s", "_us")) or not before.get(key) or value is None:
+                continue
+            ratio = value / before[key]
+            if ratio > threshold:
+                found.append({"copies": row["copies"], "metric": key, "before": before[key],
+                              "after": value, "ratio": round(ratio, 2)})
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="10,100,1000", help="comma-separated copy counts of the sample book")
+    parser.add_argument("--max-chars", type=int, default=500, help="chunk size for get_next_chunk")
+    parser.add_argument("--corpus-dir", type=Path, default=None, help="keep generated books here between runs")
+    parser.add_argument("--output", type=Path, default=Path("bench_suite.json"))
+    parser.add_argument("--compare", type=Path, default=None, help="earlier result file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "max_chars": args.max_chars,
+        "scales": [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp)
+        corpus_dir = args.corpus_dir or work / "corpus"
+        corpus_dir.mkdir(parents=True, exist_ok=True)
+        for copies in (int(s) for s in args.scales.split(",")):
+            results["scales"].append(bench_scale(copies, corpus_dir, work, args.max_chars))
+            args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")   # keep partial runs
+
+    status = 0
+    if args.compare is not None:
+        old = json.loads(args.compare.read_text(encoding="utf-8"))
+        results["regressions"] = regressions(old, results, args.threshold)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        status = 1 if results["regressions"] else 0
+    print(json.dumps(results, indent=2))
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Compare a freshly split book read through the splitter's TTS stream with reading its scene files.
+
+For a book made of `--copies` back-to-back copies of the sample Dracula text,
+times the split itself (which now also writes the index and stream), then the
+first open plus first chunk and reading every scene's text and sentences with
+an empty scene cache: once as split, once with the stream removed, and once
+with neither stream nor index (a full scan).
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import write_long_book
+from sample_code.book_index import MANIFEST_NAME
+from sample_code.reader import BookReader, Scene
+from sample_code.splitter import BookSplitter
+from sample_code.tts_stream import STREAM_NAME
+
+
+def measure(scenes: Path, progress: Path) -> dict:
+    Scene.cache.clear()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        reader = BookReader(scenes, progress_file=progress)
+    reader.get_next_chunk()
+    first = time.perf_counter() - started
+
+    Scene.cache.clear()
+    started = time.perf_counter()
+    for sc in reader._scenes:
+        sc.sentences()
+    read_all = time.perf_counter() - started
+    reader.flush_progress()
+    return {"first_chunk_ms": round(first * 1000, 2), "read_all_ms": round(read_all * 1000, 2)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        book = write_long_book(tmp / "book.txt", args.copies)
+        scenes = tmp / "scenes"
+        started = time.perf_counter()
+        BookSplitter(verbose=False).import_book(book, scenes)
+        results["book_bytes"] = book.stat().st_size
+        results["split_s"] = round(time.perf_counter() - started, 3)
+        results["stream_bytes"] = (scenes / STREAM_NAME).stat().st_size
+
+        results["stream"] = measure(scenes, tmp / "p1.json")
+        os.remove(scenes / STREAM_NAME)
+        results["index_only"] = measure(scenes, tmp / "p2.json")
+        os.remove(scenes / MANIFEST_NAME)
+        results["scan"] = measure(scenes, tmp / "p3.json")
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
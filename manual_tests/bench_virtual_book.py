@@ -0,0 +1,85 @@
+"""Compare reading a `.txt` book in place (virtual split) with splitting it to scene files first.
+
+For a book made of `--copies` back-to-back copies of the sample Dracula text,
+times split + open + first chunk against virtual open + first chunk, then
+reading every scene's text with an empty scene cache, and counts the files
+each approach leaves on disk.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from bench_corpus import write_long_book
+from sample_code.reader import BookReader, Scene
+from sample_code.splitter import BookSplitter
+
+
+def first_chunk(path: Path, progress: Path, split_to: Path | None = None) -> tuple[BookReader, float]:
+    Scene.cache.clear()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if split_to is not None:
+            path = BookSplitter(verbose=False).split_book(path, split_to)
+        reader = BookReader(path, progress_file=progress)
+    reader.get_next_chunk()
+    return reader, time.perf_counter() - started
+
+
+def read_all(reader: BookReader) -> float:
+    Scene.cache.clear()
+    started = time.perf_counter()
+    for sc in reader._scenes:
+        sc.text()
+    return time.perf_counter() - started
+
+
+def count_files(root: Path) -> int:
+    return sum(len(files) for _dirpath, _dirnames, files in os.walk(root))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        book = write_long_book(tmp / "book" / "book.txt", args.copies)
+        results["book_bytes"] = book.stat().st_size
+
+        reader, split_s = first_chunk(book, tmp / "p1.json", split_to=tmp / "scenes")
+        results["split"] = {
+            "first_chunk_ms": round(split_s * 1000, 2),
+            "read_all_ms": round(read_all(reader) * 1000, 2),
+            "files_written": count_files(tmp / "scenes"),
+        }
+        reader.flush_progress()
+
+        reader, virtual_s = first_chunk(book, tmp / "p2.json")
+        results["virtual"] = {
+            "first_chunk_ms": round(virtual_s * 1000, 2),
+            "read_all_ms": round(read_all(reader) * 1000, 2),
+            "files_written": count_files(tmp / "book") - 1,
+        }
+        reader.flush_progress()
+        results["scenes"] = len(reader._scenes)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
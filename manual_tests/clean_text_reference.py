@@ -0,0 +1,24 @@
+"""The original line-by-line text cleaner, kept as the parity reference for `reader._clean_text`.
+
+`bench_clean_text.py` times the two against each other and
+`tests/test_clean_text.py` checks they agree byte for byte.
+"""
+
+import re
+
+
+def reference_clean_text(raw: str) -> str:
+    """The original line-by-line cleaner; _clean_text must match it byte for byte."""
+    lines = []
+    for line in raw.splitlines():
+        line = re.sub(r"^#{1,6}\s+", "", line)
+        line = re.sub(r"\[Illustration.*?\]", "", line, flags=re.IGNORECASE)
+        line = re.sub(r"_\[.*?\]_", "", line, flags=re.DOTALL)
+        line = re.sub(r"\(_Mem\._.*?\)", "", line, flags=re.IGNORECASE)
+        line = re.sub(r"(\*{1,3}|_{1,3})(.*?)\1", r"\2", line)
+        line = re.sub(r"_([^_]+)_", r"\1", line)
+        line = re.sub(r"--+", " — ", line)
+        line = line.replace("_", "")
+        lines.append(line)
+    text = "\n".join(lines)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
@@ -0,0 +1,85 @@
+"""
+audio_ring.py — Lock-free single-producer/single-consumer float32 ring buffer.
+
+The sounddevice callback runs on the audio device's real-time thread, where
+taking a lock, allocating a buffer or printing can make it miss its deadline
+(an audible underrun). `BufferedSpeaker` therefore moves synthesized audio
+into a preallocated AudioRing from an ordinary thread, and the callback only
+copies samples out of it.
+
+Positions are running sample totals rather than wrapped indices: only the
+producer stores `written` and only the consumer stores `consumed`, each after
+its copy is complete, so neither side ever waits for the other. A plain
+attribute store is atomic in CPython, which is all the hand-off needs.
+`discard()` may be called from any thread to drop everything buffered.
+"""
+
+import numpy as np
+
+
+class AudioRing:
+    """Preallocated ring of float32 samples shared by one writer and one reader thread."""
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buf = np.zeros(capacity, dtype=np.float32)
+        self._written = 0      # samples ever written (producer only)
+        self._read = 0         # samples ever read (consumer only)
+        self._discard_to = 0   # samples before this position are dropped unread
+
+    @property
+    def written(self) -> int:
+        """Position just past the last sample written."""
+        return self._written
+
+    @property
+    def consumed(self) -> int:
+        """Position of the next sample the consumer will play (or skip past)."""
+        return max(self._read, self._discard_to)
+
+    @property
+    def discarded(self) -> int:
+        """Position up to which samples were dropped by `discard()` rather than read."""
+        return self._discard_to
+
+    def readable(self) -> int:
+        return self._written - self.consumed
+
+    def writable(self) -> int:
+        return self.capacity - self.readable()
+
+    def write(self, samples: np.ndarray) -> int:
+        """Producer: copy as many samples as fit and return how many were written."""
+        n = min(len(samples), self.writable())
+        if n <= 0:
+            return 0
+        at = self._written % self.capacity
+        first = min(n, self.capacity - at)
+        self._buf[at:at + first] = samples[:first]
+        if n > first:
+            self._buf[:n - first] = samples[first:n]
+        self._written += n   # publish only after the copy
+        return n
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Consumer: fill out with the next samples, padding with silence, and
+        return how many real samples it got. Allocates no buffers.
+        """
+        start = self.consumed
+        n = min(len(out), self._written - start)
+        at = start % self.capacity
+        first = min(n, self.capacity - at)
+        out[:first] = self._buf[at:at + first]
+        if n > first:
+            out[first:n] = self._buf[:n - first]
+        if n < len(out):
+            out[n:] = 0.0
+        self._read = start + n
+        return n
+
+    def discard(self) -> None:
+        """Drop everything written so far (any thread). The consumer skips it on its next read."""
+        self._discard_to = self._written
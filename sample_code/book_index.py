@@ -0,0 +1,104 @@
+"""
+book_index.py — Sidecar scene index so a book can be reopened without rescanning it.
+
+The index is a small JSON file stored inside the scenes folder. It records every
+scene's chapter/scene numbers, title, size, mtime and sentence/word counts, plus
+the mtime of every directory that was scanned. Adding, removing or renaming a
+scene file changes its parent directory's mtime, so checking the directory
+stamps is enough to know whether the cached scene list is still valid.
+
+The scenes folder itself is validated by its visible entry names instead of its
+mtime, because the reader's own hidden sidecar files live there.
+"""
+
+import json
+import os
+from pathlib import Path
+
+MANIFEST_NAME = ".book_index.json"
+MANIFEST_VERSION = 2   # 2: over-long sentences are split
+
+
+def sidecar_path(scenes_dir: str | Path, name: str) -> Path:
+    """
+    Return where a hidden sidecar file lives for a book: inside a scenes
+    folder, or beside a packed book file as `.<book file name><name>`.
+    """
+    root = Path(scenes_dir)
+    if root.is_file():
+        return root.with_name(f".{root.name}{name}")
+    return root / name
+
+
+def manifest_path(scenes_dir: str | Path) -> Path:
+    """Return the sidecar index location for a scenes folder."""
+    return Path(scenes_dir) / MANIFEST_NAME
+
+
+def visible_entries(scenes_dir: str | Path) -> list[str]:
+    """Return the sorted non-hidden names directly inside scenes_dir."""
+    return sorted(name for name in os.listdir(scenes_dir) if not name.startswith("."))
+
+
+def directory_stamps(scenes_dir: str | Path, dirs: list[Path]) -> dict[str, int]:
+    """Return {relative dir: mtime_ns} for directories beneath scenes_dir."""
+    root = Path(scenes_dir)
+    return {d.relative_to(root).as_posix(): os.stat(d).st_mtime_ns for d in dirs if d != root}
+
+
+def load_manifest(scenes_dir: str | Path) -> list[dict] | None:
+    """
+    Return the cached scene entries, or None if the index is missing, corrupt
+    or stale. Validation stats only the recorded directories, never the scenes.
+    """
+    root = Path(scenes_dir)
+    target = manifest_path(root)
+    try:
+        data = json.loads(target.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+
+    dirs = data.get("dirs")
+    entries = data.get("scenes")
+    if not isinstance(dirs, dict) or not isinstance(entries, list) or not entries:
+        return None
+    try:
+        if visible_entries(root) != data.get("root"):
+            return None
+    except OSError:
+        return None
+    for rel, mtime_ns in dirs.items():
+        try:
+            if os.stat(root / rel).st_mtime_ns != mtime_ns:
+                return None
+        except OSError:
+            return None
+    return entries
+
+
+def write_manifest(scenes_dir: str | Path, entries: list[dict], dirs: list[Path]) -> bool:
+    """
+    Atomically write the sidecar index. Returns False if the folder is read-only;
+    the index is only an optimization, so failures are never fatal.
+    """
+    root = Path(scenes_dir)
+    target = manifest_path(root)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        data = {
+            "version": MANIFEST_VERSION,
+            "root": visible_entries(root),
+            "dirs": directory_stamps(root, dirs),
+            "scenes": entries,
+        }
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, target)
+        return True
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
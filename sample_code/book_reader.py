@@ -215,7 +215,7 @@ def main():
         "scenes_dir",
         nargs="?",
         default="sample_book/scenes",
-        help="Path to the scenes directory (default: sample_book/scenes)",
+        help="Scenes directory, packed .tbrpack or plain .txt book (default: sample_book/scenes)",
     )
     parser.add_argument("--voice", default=None, help="TTS voice name")
     parser.add_argument("--model", default=DEFAULT_TTS_MODEL_ID, choices=available_tts_models(), help="HuggingFace model ID")
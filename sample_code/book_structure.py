@@ -0,0 +1,411 @@
+"""
+book_structure.py — Chapter/act/scene heuristics shared by the splitter and virtual books.
+
+`plan_scenes` maps out a plain-text book as a list of ScenePlan line ranges
+without copying any text, so `VirtualBook` can keep them as byte offsets into
+the original `.txt`. `SceneStream` applies the same heuristics in one pass
+over a line iterator, handing out each chapter's scenes as soon as the next
+heading closes it, which is how `BookSplitter` writes books of any size. A
+scene's content is `clean_block` of its lines with trailing whitespace
+removed, under a `# {title}` heading.
+
+Both take an optional `max_scene_chars`. A scene longer than that (an act, an
+undivided chapter, a book with no headings) is cut at paragraph breaks into
+parts of at most that size, numbered on as ordinary scenes of the chapter
+(`scene1.md`, `scene2.md` …), so every reader orders them without changes.
+"""
+
+import re
+import tempfile
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+# ---------------------------------------------------------------------------
+# Regex patterns
+# These regexes map out structural heuristics for Project Gutenberg files.
+# Project Gutenberg books follow loose but mostly predictable patterns for
+# marking chapters and starting/ending the actual text block.
+# ---------------------------------------------------------------------------
+
+RE_CHAPTER = re.compile(r"^CHAPTER\s+([IVXLCDM]+|\d+)\s*$", re.IGNORECASE)
+RE_CHAPTER_TOC = re.compile(r"^CHAPTER\s+([IVXLCDM]+|\d+)\s*[.\-—]", re.IGNORECASE)
+RE_ACT = re.compile(r"^ACT\s+([IVXLCDM]+|\d+)\s*$", re.IGNORECASE)
+RE_ACT_TOC = re.compile(r"^\s+ACT\s|^ACT\s+([IVXLCDM]+|\d+)\s*\.", re.IGNORECASE)
+# Journal date format often appears in epistolary novels like Dracula directly before a scene break (e.g., _3 May_)
+RE_JOURNAL_DATE = re.compile(r"^_\d")
+RE_START = re.compile(r"\*{3}\s*START OF THE PROJECT GUTENBERG", re.IGNORECASE)
+RE_END   = re.compile(r"\*{3}\s*END OF THE PROJECT GUTENBERG",   re.IGNORECASE)
+
+
+class ScenePlan(NamedTuple):
+    """One scene of a book: its numbering, title and [start, end) line range."""
+    chapter: int
+    scene: int
+    title: str
+    start: int
+    end: int
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def roman_to_int(s: str) -> Optional[int]:
+    vals = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+    s = s.strip().upper()
+    if not all(c in vals for c in s): return None
+    total, prev = 0, 0
+    for ch in reversed(s):
+        cur = vals[ch]
+        total += cur if cur >= prev else -cur
+        prev = cur
+    return total
+
+def parse_num(s: str) -> int:
+    s = s.strip()
+    if s.isdigit(): return int(s)
+    return roman_to_int(s) or 1
+
+def gutenberg_bounds(lines: list[str]) -> tuple[int, int]:
+    """Return the [start, end) line range between the Gutenberg START/END markers."""
+    start_idx, end_idx = 0, len(lines)
+    for i, line in enumerate(lines):
+        if RE_START.search(line):
+            start_idx = i + 1
+            break
+    for i in range(len(lines) - 1, start_idx, -1):
+        if RE_END.search(lines[i]):
+            end_idx = i
+            break
+    return start_idx, end_idx
+
+def strip_gutenberg(lines: list[str]) -> list[str]:
+    start_idx, end_idx = gutenberg_bounds(lines)
+    return lines[start_idx:end_idx]
+
+def clean_block(lines: list[str]) -> str:
+    while lines and not lines[0].strip(): lines.pop(0)
+    while lines and not lines[-1].strip(): lines.pop()
+    return "\n".join(lines)
+
+def detect_format(lines: list[str]) -> str:
+    chapters = sum(1 for l in lines if RE_CHAPTER.match(l.rstrip()) and not RE_CHAPTER_TOC.match(l.rstrip()))
+    acts     = sum(1 for l in lines if RE_ACT.match(l.rstrip()) and not RE_ACT_TOC.match(l.rstrip()))
+    if chapters >= acts and chapters > 0: return "chapter"
+    if acts > 0: return "act"
+    return "unknown"
+
+def scene_ranges(ch_title: str, lines: list[str], start: int, end: int) -> list[tuple[str, int, int]]:
+    """Split one chapter's lines [start, end) at journal dates into (title, start, end) scenes."""
+    scenes: list[tuple[str, int, int]] = []
+    current_title, current_start = ch_title, start
+
+    for i in range(start, end):
+        raw = lines[i].rstrip()
+        if RE_JOURNAL_DATE.match(raw):
+            if i > current_start:
+                scenes.append((current_title, current_start, i))
+            title_text = raw.lstrip("_").split("_")[0].rstrip(".").strip()
+            current_title = f"{ch_title} — {title_text}" if title_text else ch_title
+            current_start = i
+
+    if end > current_start:
+        scenes.append((current_title, current_start, end))
+
+    first = lines[start].rstrip() if end > start else ""
+    if not scenes or (len(scenes) == 1 and scenes[0][0] == ch_title and not RE_JOURNAL_DATE.match(first)):
+        return [(ch_title, start, end)]
+    return scenes
+
+def part_title(title: str, part: int) -> str:
+    """Title of the part-th (0-based) piece of a scene cut by max_scene_chars."""
+    return title if part == 0 else f"{title} (part {part + 1})"
+
+def bound_lines(lines: Iterable[str], max_chars: int) -> Iterator[list[str]]:
+    """
+    Cut right-stripped lines into pieces of at most max_chars (counting a
+    newline per line), preferring the last blank line of a piece, otherwise a
+    line break. A single longer line becomes a piece of its own. Blank lines
+    left over after the last piece are dropped, as `clean_block` would; a
+    scene with no text still yields one piece.
+    """
+    buf: list[str] = []
+    size = 0
+    text = False    # buf holds a non-blank line
+    brk = 0         # buf[:brk] ends with a blank line after text (0: no such break)
+    emitted = False
+    for line in lines:
+        cost = len(line) + 1
+        while text and size + cost > max_chars:   # cutting at a break may not free enough room
+            cut = brk or len(buf)
+            yield buf[:cut]
+            emitted = True
+            buf = buf[cut:]
+            size = sum(len(l) + 1 for l in buf)
+            text, brk = False, 0
+            for i, held in enumerate(buf, start=1):
+                if held.strip():
+                    text = True
+                elif text:
+                    brk = i
+        buf.append(line)
+        size += cost
+        if line.strip():
+            text = True
+        elif text:
+            brk = len(buf)
+    if text or not emitted:
+        yield buf
+
+def bounded_ranges(lines: list[str], start: int, end: int, max_chars: int | None) -> list[tuple[int, int]]:
+    """Return the [start, end) line ranges `bound_lines` cuts lines[start:end] into."""
+    if max_chars is None:
+        return [(start, end)]
+    ranges, at = [], start
+    for piece in bound_lines((l.rstrip() for l in lines[start:end]), max_chars):
+        ranges.append((at, at + len(piece)))
+        at += len(piece)
+    ranges[-1] = (ranges[-1][0], end)   # trailing blank lines belong to the last piece
+    return ranges
+
+def split_into_scenes(ch_num: int, ch_title: str, lines: list[str]) -> list[tuple[str, list[str]]]:
+    return [(title, [l.rstrip() for l in lines[a:b]]) for title, a, b in scene_ranges(ch_title, lines, 0, len(lines))]
+
+def _heading_ranges(lines: list[str], start: int, end: int, fmt: str) -> list[tuple[int, str, int, int]]:
+    """Return (number, heading, first line, end line) for each chapter or act body."""
+    pattern, toc = (RE_CHAPTER, RE_CHAPTER_TOC) if fmt == "chapter" else (RE_ACT, RE_ACT_TOC)
+    sections: list[tuple[int, str, int, int]] = []
+    current = None
+
+    for i in range(start, end):
+        raw = lines[i].rstrip(); stripped = raw.strip()
+        m = pattern.match(stripped)
+        # Chapter TOC lines are checked stripped, act TOC lines as written (indentation matters).
+        if m and not toc.match(stripped if fmt == "chapter" else raw):
+            if current: sections.append((*current, i))
+            current = (parse_num(m.group(1)), stripped, i + 1)
+
+    if current and current[2] < end: sections.append((*current, end))
+    return sections
+
+def plan_scenes(lines: list[str], title: str, max_scene_chars: int | None = None) -> tuple[str, list[ScenePlan]]:
+    """
+    Map out a whole book (lines with or without their newlines) as
+    (format, scenes in reading order). Chapters split further at journal
+    dates; acts are one scene each; an unrecognised book is one scene
+    titled `title`. With max_scene_chars, longer scenes are cut into parts.
+    """
+    start, end = gutenberg_bounds(lines)
+    if start >= end:
+        start, end = 0, len(lines)   # no Gutenberg markers: use the full file
+
+    fmt = detect_format(lines[start:end])
+    if fmt == "unknown":
+        sections = [(1, title, [(title, start, end)])]
+    else:
+        sections = [
+            (num, heading, [(heading, a, b)] if fmt == "act" else scene_ranges(heading, lines, a, b))
+            for num, heading, a, b in _heading_ranges(lines, start, end, fmt)
+        ]
+
+    plans = []
+    for num, heading, ranges in sections:
+        sc_num = 0
+        for sc_title, sa, sb in ranges:
+            for part, (pa, pb) in enumerate(bounded_ranges(lines, sa, sb, max_scene_chars)):
+                sc_num += 1
+                plans.append(ScenePlan(num, sc_num, part_title(sc_title or heading, part), pa, pb))
+    return fmt, plans
+
+def scene_content(lines: list[str], plan: ScenePlan) -> str:
+    """Return one planned scene's body text, as written below its `# title` heading."""
+    return clean_block([l.rstrip() for l in lines[plan.start:plan.end]])
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+# Lines held back by SceneStream (a Gutenberg header or licence, or a book
+# with no headings at all) stay in memory up to this size, then go to disk.
+SPOOL_BYTES = 8 << 20
+
+_HEADING_INITIALS = frozenset("CcAa")   # first letters of CHAPTER and ACT headings
+
+
+class _LineSpool:
+    """Append-only buffer of lines that spills to a temporary file past SPOOL_BYTES."""
+
+    def __init__(self):
+        self._file = None
+
+    def __bool__(self) -> bool:
+        return self._file is not None
+
+    def append(self, line: str) -> None:
+        if self._file is None:
+            self._file = tempfile.SpooledTemporaryFile(SPOOL_BYTES, mode="w+", encoding="utf-8", newline="\n")
+        self._file.write(line)
+        self._file.write("\n")
+
+    def drain(self) -> Iterator[str]:
+        """Yield the buffered lines in order and empty the spool."""
+        f, self._file = self._file, None
+        if f is None:
+            return
+        with f:
+            f.seek(0)
+            for line in f:
+                yield line[:-1]
+
+    def clear(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SceneStream:
+    """
+    Single-pass equivalent of `plan_scenes` over any line iterator.
+
+    `scenes(lines)` yields (chapter, scene, title, lines) as each chapter or
+    act closes, so at most one chapter is held in memory. Lines whose role is
+    not known yet (a header that may precede a START marker, text after an END
+    marker that may not be the last one, text before the first heading) are
+    kept in spools that move to disk when large.
+
+    `plan_scenes` picks chapters or acts by counting both over the whole book;
+    a stream commits to the kind of the first heading it meets. When the book
+    turns out to mix both and the other kind wins, `detected` differs from
+    `format` at the end, and the caller can split again with `fmt` forced.
+    """
+
+    def __init__(self, title: str, fmt: str | None = None, max_scene_chars: int | None = None):
+        self.title = title
+        self.format = fmt   # "chapter" or "act" once the first heading is seen (or forced)
+        self.max_scene_chars = max_scene_chars
+        self.counts = {"chapter": 0, "act": 0}
+        self._header = _LineSpool()      # lines up to and including the START marker
+        self._started = False            # START marker seen
+        self._body_seen = False          # at least one body line processed
+        self._tail = _LineSpool()        # from the latest END marker on
+        self._undecided = _LineSpool()   # body lines before the first heading
+        self._section: tuple[int, str, list[str]] | None = None
+        self._ready: list[tuple[int, int, str, Iterable[str]]] = []
+
+    @property
+    def detected(self) -> str:
+        """The format `detect_format` would report for the lines seen so far."""
+        chapters, acts = self.counts["chapter"], self.counts["act"]
+        if chapters >= acts and chapters > 0: return "chapter"
+        if acts > 0: return "act"
+        return "unknown"
+
+    def scenes(self, lines: Iterable[str]) -> Iterator[tuple[int, int, str, Iterable[str]]]:
+        """
+        Yield every scene of the book as (chapter, scene, title, lines), with
+        lines right-stripped but not yet trimmed (see `clean_block`). Consume
+        each scene's lines before asking for the next scene.
+        """
+        for line in lines:
+            raw = line.rstrip()
+            section = self._section
+            # Fast path for ordinary text inside a chapter: it cannot be a heading
+            # (those start with C or A) or a Gutenberg marker (those contain ***).
+            if (section is not None and raw.lstrip()[:1] not in _HEADING_INITIALS and "***" not in raw
+                    and not self._tail):
+                section[2].append(raw)
+                continue
+            self._feed(raw)
+            if self._ready:
+                yield from self._take_ready()
+        yield from self._finish()
+        if self.format is None:
+            yield from self._parts(1, 1, self.title, self._undecided.drain())
+
+    def _parts(self, ch: int, sc: int, title: str, lines: Iterable[str]):
+        """Yield one scene, or its parts numbered on from sc when it exceeds max_scene_chars."""
+        if self.max_scene_chars is None:
+            yield ch, sc, title, lines
+            return
+        for part, piece in enumerate(bound_lines(lines, self.max_scene_chars)):
+            yield ch, sc + part, part_title(title, part), piece
+
+    def _take_ready(self):
+        ready, self._ready = self._ready, []
+        return ready
+
+    def _feed(self, raw: str) -> None:
+        if not self._started:
+            self._header.append(raw)
+            self._started = bool(RE_START.search(raw))
+            return
+        if self._header:
+            self._header.clear()   # the body is not empty, so the header is not needed
+        self._body_line(raw)
+
+    def _body_line(self, raw: str) -> None:
+        # Like gutenberg_bounds: the last END marker after the first body line ends the book.
+        first, self._body_seen = not self._body_seen, True
+        if not first and RE_END.search(raw):
+            for held in self._tail.drain():
+                self._section_line(held)
+            self._tail.append(raw)
+        elif self._tail:
+            self._tail.append(raw)
+        else:
+            self._section_line(raw)
+
+    def _section_line(self, raw: str) -> None:
+        is_chapter = bool(RE_CHAPTER.match(raw) and not RE_CHAPTER_TOC.match(raw))
+        is_act = bool(RE_ACT.match(raw) and not RE_ACT_TOC.match(raw))
+        self.counts["chapter"] += is_chapter
+        self.counts["act"] += is_act
+        if self.format is None:
+            if not (is_chapter or is_act):
+                self._undecided.append(raw)
+                return
+            self.format = "chapter" if is_chapter else "act"
+            for held in self._undecided.drain():
+                self._split_line(held)
+        self._split_line(raw)
+
+    def _split_line(self, raw: str) -> None:
+        stripped = raw.strip()
+        chapters = self.format == "chapter"
+        pattern, toc = (RE_CHAPTER, RE_CHAPTER_TOC) if chapters else (RE_ACT, RE_ACT_TOC)
+        m = pattern.match(stripped)
+        if m and not toc.match(stripped if chapters else raw):
+            self._close_section()
+            self._section = (parse_num(m.group(1)), stripped, [])
+        elif self._section is not None:
+            self._section[2].append(raw)
+
+    def _close_section(self, last: bool = False) -> None:
+        section, self._section = self._section, None
+        if section is None:
+            return
+        num, heading, lines = section
+        if last and not lines:
+            return   # like plan_scenes, a trailing heading with no text is dropped
+        if self.format == "act":
+            self._ready.extend(self._parts(num, 1, heading, lines))
+            return
+        sc_num = 1
+        for sc_title, a, b in scene_ranges(heading, lines, 0, len(lines)):
+            parts = list(self._parts(num, sc_num, sc_title or heading, lines[a:b]))
+            self._ready.extend(parts)
+            sc_num += len(parts)
+
+    def _finish(self) -> Iterator[tuple[int, int, str, Iterable[str]]]:
+        if not self._body_seen:
+            # No START marker: the book runs from the first line to the last END
+            # marker. A START marker with nothing after it: the whole file is the book.
+            # Scenes are handed on as they close, so the book is never all in memory.
+            feed = self._section_line if self._started else self._body_line
+            for held in self._header.drain():
+                feed(held)
+                if self._ready:
+                    yield from self._take_ready()
+        self._tail.clear()
+        self._close_section(last=True)
+        yield from self._take_ready()
@@ -0,0 +1,45 @@
+"""
+book_watcher.py — Poll a book for scene files being added, removed or edited.
+
+Authors edit scenes while listening. `BookWatcher` calls
+`BookReader.has_changes()` (directory stats plus one stat per scene, no
+reads) on a daemon thread and reports when something changed; the owner then
+calls `BookReader.refresh()` on its own thread to re-index just those files.
+Polling keeps this dependency-free and works on network volumes where file
+system notifications are unreliable.
+"""
+
+import threading
+from typing import Callable
+
+DEFAULT_POLL_SECONDS = 2.0
+
+
+class BookWatcher:
+    """Daemon thread that calls on_change() whenever the reader's files changed."""
+
+    def __init__(self, reader, on_change: Callable[[], None], interval: float = DEFAULT_POLL_SECONDS):
+        self.reader = reader
+        self.on_change = on_change
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "BookWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="book-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.interval + 1)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                if self.reader.has_changes():
+                    self.on_change()
+            except Exception as e:
+                print(f"Error checking {self.reader.scenes_dir} for changes: {e}")
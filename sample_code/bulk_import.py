@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+bulk_import.py — Split whole directories of plain-text books into a library in parallel.
+
+`splitter.py` imports one book per run. `import_library` takes directories
+(searched recursively for `.txt` / `.txt.gz`) or glob patterns, and splits
+every book into its own folder (or `.tbrpack`) under one library directory
+on a process pool, one book per task:
+
+    python sample_code/bulk_import.py ~/gutenberg "more/*.txt.gz" my_library --workers 8
+
+Progress is recorded in `library_manifest.json` in the library directory:
+per book its source, output name, source (mtime_ns, size), status, error,
+split time and scene/chapter counts. The manifest is saved as books finish,
+so an interrupted run picks up where it stopped: books whose source is
+unchanged since a successful import are skipped. Re-splitting a book is
+idempotent anyway (see `scene_writer.py`), so `--force` only costs time.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+try:
+    from .splitter import BookSplitter, book_title
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from splitter import BookSplitter, book_title
+
+MANIFEST_NAME = "library_manifest.json"
+MANIFEST_VERSION = 1
+BOOK_SUFFIXES = (".txt", ".txt.gz")
+
+SAVE_INTERVAL = 1.0   # seconds between manifest saves while books are finishing
+
+_UNSAFE_NAME = re.compile(r"[^\w.\- ]+")
+
+
+def collect_sources(inputs: list[str]) -> list[Path]:
+    """Expand directories (recursively) and glob patterns into book files, de-duplicated and sorted."""
+    found = set()
+    for item in inputs:
+        path = Path(item).expanduser()
+        if path.is_dir():
+            for dirpath, _dirnames, filenames in os.walk(path):
+                for name in filenames:
+                    if name.lower().endswith(BOOK_SUFFIXES) and not name.startswith("."):
+                        found.add(Path(dirpath, name).resolve())
+        elif path.is_file():
+            found.add(path.resolve())
+        else:
+            found.update(Path(p).resolve() for p in glob.glob(str(path), recursive=True) if Path(p).is_file())
+    return sorted(found)
+
+
+def load_library_manifest(library_dir: str | Path) -> dict[str, dict]:
+    """Return {source path: book record} from a library manifest, or {} if missing or unreadable."""
+    try:
+        data = json.loads((Path(library_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return dict(data["books"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_library_manifest(library_dir: str | Path, books: dict[str, dict]) -> None:
+    target = Path(library_dir) / MANIFEST_NAME
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    data = {"version": MANIFEST_VERSION, "books": dict(sorted(books.items()))}
+    tmp.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def _source_stamp(path: Path) -> list[int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _assign_outputs(sources: list[Path], books: dict[str, dict], packed: bool) -> dict[str, str]:
+    """
+    Pick each book's output name inside the library: its title, made unique
+    with -2, -3 … Names already in the manifest are kept, so reruns write to
+    the same place.
+    """
+    taken = {rec["output"] for rec in books.values() if rec.get("output")}
+    names = {}
+    for src in sources:
+        key = str(src)
+        if key in books and books[key].get("output"):
+            names[key] = books[key]["output"]
+            continue
+        base = _UNSAFE_NAME.sub("_", book_title(src)).strip(" .") or "book"
+        suffix = ".tbrpack" if packed else ""
+        name, n = f"{base}{suffix}", 1
+        while name in taken:
+            n += 1
+            name = f"{base}-{n}{suffix}"
+        taken.add(name)
+        names[key] = name
+    return names
+
+
+def _import_one(source: str, output: str, max_scene_chars: int | None = None) -> dict:
+    """Worker: split one book and return its manifest record (never raises)."""
+    started = time.perf_counter()
+    record = {"output": Path(output).name, "status": "ok", "error": None}
+    try:
+        changes = BookSplitter(verbose=False, max_scene_chars=max_scene_chars).import_book(source, output)
+        scenes = changes["added"] + changes["modified"] + changes["unchanged"]
+        record.update(
+            scenes=len(scenes),
+            chapters=len({rel.split("/", 1)[0] for rel in scenes}),
+            changed=len(changes["added"]) + len(changes["modified"]) + len(changes["removed"]),
+        )
+    except Exception as e:   # one bad book must not stop the batch
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+def import_library(inputs: list[str], library_dir: str | Path, workers: int | None = None,
+                   packed: bool = False, force: bool = False, progress=None,
+                   max_scene_chars: int | None = None) -> dict:
+    """
+    Split every book found in inputs into library_dir on `workers` processes
+    (default: one per core). Returns a summary with per-book records under
+    "books" (including "skipped" ones), counts, wall time and books/second.
+    progress(source, record) is called in this process as each book finishes.
+    max_scene_chars is passed on to `BookSplitter`; changing it needs force=True.
+    """
+    library = Path(library_dir)
+    library.mkdir(parents=True, exist_ok=True)
+    sources = collect_sources(inputs)
+    books = load_library_manifest(library)
+    outputs = _assign_outputs(sources, books, packed)
+
+    todo, results = [], {}
+    for src in sources:
+        key = str(src)
+        stamp = _source_stamp(src)
+        rec = books.get(key)
+        done = (rec is not None and rec.get("status") == "ok" and rec.get("source_stamp") == stamp
+                and (library / rec["output"]).exists())
+        if done and not force:
+            results[key] = dict(rec, status="skipped")
+        else:
+            todo.append((key, stamp))
+
+    started = time.perf_counter()
+    last_save = started
+    workers = max(1, workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=min(workers, max(1, len(todo)))) as pool:
+        pending = {
+            pool.submit(_import_one, key, str(library / outputs[key]), max_scene_chars): (key, stamp) for key, stamp in todo
+        }
+        try:
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key, stamp = pending.pop(future)
+                    record = dict(future.result(), source_stamp=stamp)
+                    books[key] = results[key] = record
+                    if progress is not None:
+                        progress(key, record)
+                if time.perf_counter() - last_save >= SAVE_INTERVAL:
+                    save_library_manifest(library, books)
+                    last_save = time.perf_counter()
+        finally:
+            # Keep what finished even if interrupted, so the next run resumes.
+            for future in pending:
+                future.cancel()
+            save_library_manifest(library, books)
+    elapsed = time.perf_counter() - started
+
+    imported = sum(1 for key, _ in todo if results.get(key, {}).get("status") == "ok")
+    failed = sum(1 for key, _ in todo if results.get(key, {}).get("status") == "error")
+    return {
+        "library": str(library.resolve()),
+        "workers": workers,
+        "books": results,
+        "imported": imported,
+        "failed": failed,
+        "skipped": len(sources) - len(todo),
+        "seconds": round(elapsed, 3),
+        "books_per_second": round(len(todo) / elapsed, 2) if todo and elapsed > 0 else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0].split("— ", 1)[-1])
+    parser.add_argument("inputs", nargs="+", help="book files, directories or glob patterns")
+    parser.add_argument("library", help="library directory to split the books into")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--packed", action="store_true", help="write each book as a single .tbrpack file")
+    parser.add_argument("--force", action="store_true", help="re-split books even if unchanged since the last run")
+    parser.add_argument("--max-scene-chars", type=int, default=None,
+                        help="cut longer scenes at paragraph breaks into numbered scenes")
+    args = parser.parse_args(argv)
+
+    def report(source, record):
+        if record["status"] == "ok":
+            print(f"  {record['seconds']:7.2f}s  {record['scenes']:5d} scenes  {Path(source).name}")
+        else:
+            print(f"  FAILED  {Path(source).name}: {record['error']}", file=sys.stderr)
+
+    summary = import_library(args.inputs, args.library, workers=args.workers, packed=args.packed,
+                             force=args.force, progress=report, max_scene_chars=args.max_scene_chars)
+    print(
+        f"Imported {summary['imported']}, failed {summary['failed']}, skipped {summary['skipped']} "
+        f"in {summary['seconds']:.1f}s ({summary['books_per_second'] or 0} books/s, {summary['workers']} workers). "
+        f"Manifest: {Path(summary['library']) / MANIFEST_NAME}"
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,195 @@
+"""
+chunk_plan.py — Precomputed whole-book chunk plan with random access by chunk id.
+
+`BookReader.get_next_chunk` walks the book one step at a time, so reaching
+chunk N means replaying every chunk before it. A ChunkPlan groups every
+scene's sentences up front, exactly as get_next_chunk would at a fixed
+max_chars, and stores the result as three `array('I')` tables:
+
+    scene_first[s]            first chunk id of scene s (len = scenes + 1)
+    starts[c], ends[c]        sentence range [start, end) of chunk c
+
+so chunk id → (scene, sentence range) is a bisect and the reverse lookup is a
+bisect within one scene. Plans are cached per max_chars in `.chunk_plan.json`
+inside the scenes folder and keyed by a signature of every scene's path, size
+and mtime, so an edited book is re-planned automatically.
+"""
+
+import hashlib
+import json
+import os
+from array import array
+from bisect import bisect_right
+from pathlib import Path
+
+try:
+    from .book_index import sidecar_path
+    from .sentences import MAX_SENTENCE_CHARS
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from book_index import sidecar_path
+    from sentences import MAX_SENTENCE_CHARS
+
+PLAN_NAME = ".chunk_plan.json"
+PLAN_VERSION = 1
+
+
+def plan_path(scenes_dir: str | Path) -> Path:
+    """Return the sidecar chunk plan location for a scenes folder or packed book file."""
+    return sidecar_path(scenes_dir, PLAN_NAME)
+
+
+def book_signature(scenes_dir: str | Path, scenes) -> str:
+    """Hash every scene's relative path, size and mtime (one stat per scene)."""
+    h = hashlib.sha1(f"{PLAN_VERSION}:{MAX_SENTENCE_CHARS}".encode())
+    for sc in scenes:
+        mtime_ns, size = sc.stamp()
+        h.update(f"\0{sc.rel}\0{size}\0{mtime_ns}".encode())
+    return h.hexdigest()
+
+
+def group_sentences(lengths, max_chars: int):
+    """
+    Yield (start, end) sentence ranges for one scene, grouped like
+    get_next_chunk: at least one sentence, joined by single spaces, ≤ max_chars.
+    """
+    n = len(lengths)
+    start = 0
+    while start < n:
+        end = start + 1
+        total = lengths[start]
+        while end < n and total + 1 + lengths[end] <= max_chars:
+            total += 1 + lengths[end]
+            end += 1
+        yield start, end
+        start = end
+
+
+class ChunkPlan:
+    """Array-backed map between chunk ids and (scene index, sentence range)."""
+
+    __slots__ = ("max_chars", "signature", "scene_first", "starts", "ends")
+
+    def __init__(self, max_chars: int, signature: str, scene_first: array, starts: array, ends: array):
+        self.max_chars = max_chars
+        self.signature = signature
+        self.scene_first = scene_first
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def build(cls, scenes, max_chars: int, signature: str = "", known: dict | None = None) -> "ChunkPlan":
+        """
+        Plan every scene, reading each scene's sentences once. `known` maps
+        relative scene paths to ranges from an earlier plan (see scene_ranges); those
+        scenes are reused without being read.
+        """
+        known = known or {}
+        scene_first, starts, ends = array("I"), array("I"), array("I")
+        for sc in scenes:
+            scene_first.append(len(starts))
+            ranges = known.get(sc.rel)
+            if ranges is None:
+                ranges = group_sentences(sc.sentences().lengths(), max_chars)
+            for s, e in ranges:
+                starts.append(s)
+                ends.append(e)
+        scene_first.append(len(starts))
+        return cls(max_chars, signature, scene_first, starts, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def scene_count(self) -> int:
+        return len(self.scene_first) - 1
+
+    def chunk(self, chunk_id: int) -> tuple[int, int, int]:
+        """Return (scene index, first sentence, end sentence) for chunk_id."""
+        if not 0 <= chunk_id < len(self.starts):
+            raise IndexError(f"chunk id {chunk_id} out of range")
+        # Empty scenes share their first id with the next scene; bisect_right
+        # lands past all of them on the scene that actually owns the chunk.
+        scene_index = bisect_right(self.scene_first, chunk_id) - 1
+        return scene_index, self.starts[chunk_id], self.ends[chunk_id]
+
+    def scene_chunks(self, scene_index: int) -> range:
+        """Return the chunk ids belonging to one scene (empty for empty scenes)."""
+        return range(self.scene_first[scene_index], self.scene_first[scene_index + 1])
+
+    def scene_ranges(self, scene_index: int) -> list[tuple[int, int]]:
+        """Return one scene's (start, end) sentence ranges, for reuse in a rebuild."""
+        r = self.scene_chunks(scene_index)
+        return list(zip(self.starts[r.start:r.stop], self.ends[r.start:r.stop]))
+
+    def locate(self, scene_index: int, sentence_index: int = 0) -> int | None:
+        """
+        Return the id of the chunk containing this position, or of the next
+        chunk after it when the position is past the end of its scene.
+        None means the position is at or past the end of the book.
+        """
+        first, last = self.scene_first[scene_index], self.scene_first[scene_index + 1]
+        if first < last and sentence_index < self.ends[last - 1]:
+            return max(first, bisect_right(self.starts, sentence_index, first, last) - 1)
+        return last if last < len(self.starts) else None
+
+    def key(self, chunk_id: int) -> str:
+        """Return a stable cache key for chunk_id's text in this book revision."""
+        return f"{self.signature}:{self.max_chars}:{chunk_id}"
+
+    def to_json(self) -> dict:
+        return {
+            "scene_first": self.scene_first.tolist(),
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist(),
+        }
+
+    @classmethod
+    def from_json(cls, max_chars: int, signature: str, data: dict) -> "ChunkPlan":
+        return cls(
+            max_chars,
+            signature,
+            array("I", data["scene_first"]),
+            array("I", data["starts"]),
+            array("I", data["ends"]),
+        )
+
+
+def load_plan(scenes_dir: str | Path, max_chars: int, signature: str) -> ChunkPlan | None:
+    """Return the cached plan for max_chars, or None if missing, corrupt or stale."""
+    try:
+        data = json.loads(plan_path(scenes_dir).read_text(encoding="utf-8"))
+        if data.get("version") != PLAN_VERSION or data.get("signature") != signature:
+            return None
+        entry = data["plans"].get(str(max_chars))
+        return None if entry is None else ChunkPlan.from_json(max_chars, signature, entry)
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_plan(scenes_dir: str | Path, plan: ChunkPlan) -> bool:
+    """
+    Add plan to the sidecar, dropping plans for older book revisions.
+    Returns False if the folder is read-only; the plan is only an optimization.
+    """
+    target = plan_path(scenes_dir)
+    plans = {}
+    try:
+        data = json.loads(target.read_text(encoding="utf-8"))
+        if data.get("version") == PLAN_VERSION and data.get("signature") == plan.signature:
+            plans = dict(data["plans"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    plans[str(plan.max_chars)] = plan.to_json()
+
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        data = {"version": PLAN_VERSION, "signature": plan.signature, "plans": plans}
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, target)
+        return True
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
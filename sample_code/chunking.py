@@ -0,0 +1,55 @@
+"""
+chunking.py — Latency-ramped chunk sizes for fast time-to-first-audio.
+
+Synthesis of a chunk has to finish before any of it can play, so a full
+500-character first chunk means a long silence after pressing Start. The
+planner makes the first chunk a single sentence and then grows the budget
+geometrically (first_chars, first_chars * growth, ...) up to a ceiling, so
+later chunks are large enough to keep the audio queue ahead of playback.
+Per-model settings live in `speaker.TTS_MODEL_CONFIGS` (see `chunk_settings`).
+"""
+
+DEFAULT_FIRST_CHARS = 120
+DEFAULT_GROWTH = 2.0
+DEFAULT_MAX_CHARS = 500
+
+
+class ChunkPlanner:
+    """Hands out per-chunk character budgets: one sentence, then a geometric ramp."""
+
+    def __init__(self, first_chars: int = DEFAULT_FIRST_CHARS, growth: float = DEFAULT_GROWTH,
+                 max_chars: int = DEFAULT_MAX_CHARS):
+        if first_chars < 1 or max_chars < 1:
+            raise ValueError("Chunk sizes must be positive.")
+        if growth < 1:
+            raise ValueError("Chunk growth must be at least 1.")
+        self.first_chars = first_chars
+        self.growth = growth
+        self.max_chars = max_chars
+        self._emitted = 0
+
+    @classmethod
+    def from_settings(cls, settings: dict | None) -> "ChunkPlanner":
+        """Build a planner from a model's `chunking` settings dict."""
+        settings = settings or {}
+        return cls(
+            first_chars=settings.get("first_chars", DEFAULT_FIRST_CHARS),
+            growth=settings.get("growth", DEFAULT_GROWTH),
+            max_chars=settings.get("max_chars", DEFAULT_MAX_CHARS),
+        )
+
+    def reset(self) -> None:
+        """Start the ramp again, e.g. after Start or a navigation jump."""
+        self._emitted = 0
+
+    def next_budget(self) -> int:
+        """Return the character budget for the next chunk and advance the ramp."""
+        n = self._emitted
+        self._emitted += 1
+        if n == 0:
+            return 0   # get_next_chunk always emits at least one sentence
+        return min(self.max_chars, int(self.first_chars * self.growth ** (n - 1)))
+
+    def next_chunk(self, reader) -> str | None:
+        """Pull the next chunk from anything with get_next_chunk(max_chars=...)."""
+        return reader.get_next_chunk(max_chars=self.next_budget())
@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
+from tkinter import filedialog, messagebox, scrolledtext, simpledialog
 import threading
 import os
 import sys
@@ -13,6 +13,9 @@ import re
 # Fix imports to find sibling files
 sys.path.insert(0, str(Path(__file__).parent))
 
+from chunking import ChunkPlanner
+from library import default_library
+from progress import PROGRESS_JOURNAL, read_json_locked
 from reader import BookReader
 from speaker import (
     DEFAULT_TTS_MODEL_ID,
@@ -20,6 +23,7 @@ from speaker import (
     BufferedSpeaker,
     available_tts_models,
     available_voices,
+    chunk_settings,
     default_voice_for_model,
     generation_kwargs,
     load_tts_model,
@@ -28,8 +32,12 @@ from speaker import (
     synthesize_audio,
 )
 from splitter import BookSplitter
+from book_watcher import BookWatcher
 
-LAST_READ_FILE = Path(__file__).parent / "last_read.json"
+LEGACY_LAST_READ_FILE = Path(__file__).parent / "last_read.json"   # read once if the library has no session
+SESSION_KEY = "gui_session"
+INDEX_POLL_MS = 250
+NOTES_SHOWN = 20
 EXPORT_MODES = ("Chapter", "Scene")
 EXPORT_BITRATES = tuple(f"{rate}k" for rate in range(32, 129, 16))
 DEFAULT_EXPORT_BITRATE = "64k"
@@ -215,6 +223,7 @@ class BookReaderGUI:
         self.root.geometry("800x800")
 
         self.reader = None
+        self.watcher = None  # polls the open book for edited scene files
         self.model = None
         self.speaker = None  # Persistent speaker engine
         self.voice = default_voice_for_model(DEFAULT_TTS_MODEL_ID)
@@ -225,6 +234,9 @@ class BookReaderGUI:
         self.testing_voice = False
         self._played_index = 0
         self._played_sentence_index = 0
+        self._search_query = None
+        self._search_hits = []
+        self._search_pos = -1
         self.splitter = BookSplitter(verbose=False)
 
         self._setup_ui()
@@ -312,6 +324,16 @@ class BookReaderGUI:
         self.btn_next_ch = tk.Button(nav_frame, text=">>|", width=5, command=self.next_chapter, state=tk.DISABLED)
         self.btn_next_ch.pack(side=tk.LEFT, padx=2)
 
+        # Search box: Enter / Find jumps to the next matching sentence
+        self.btn_find = tk.Button(nav_frame, text="Find", command=self.find_next, state=tk.DISABLED)
+        self.btn_find.pack(side=tk.RIGHT, padx=2)
+
+        self.search_var = tk.StringVar()
+        self.ent_search = tk.Entry(nav_frame, textvariable=self.search_var, width=30)
+        self.ent_search.pack(side=tk.RIGHT, padx=2)
+        self.ent_search.bind("<Return>", lambda e: self.find_next())
+        tk.Label(nav_frame, text="Search:").pack(side=tk.RIGHT, padx=(15, 2))
+
         # Labels
         self.lbl_status = tk.Label(self.root, text="Please select a book folder...")
         self.lbl_status.pack(side=tk.TOP, fill=tk.X, padx=10)
@@ -328,7 +350,7 @@ class BookReaderGUI:
         self.txt_display.config(state=tk.DISABLED)
 
         # Notes Section
-        notes_frame = tk.LabelFrame(self.root, text="Scene Notes (appended to notes.txt in book folder)")
+        notes_frame = tk.LabelFrame(self.root, text="Scene Notes (saved in the library with the current position)")
         notes_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=5)
 
         self.txt_notes = tk.Text(notes_frame, height=4, font=("Helvetica", 11))
@@ -338,7 +360,7 @@ class BookReaderGUI:
         self.btn_save_note.pack(side=tk.RIGHT, padx=5, pady=5)
 
         # Recent Notes Pane
-        recent_frame = tk.LabelFrame(self.root, text="Recent Notes (last updates from notes.txt)")
+        recent_frame = tk.LabelFrame(self.root, text="Recent Notes")
         recent_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=10, pady=5)
 
         self.txt_recent_notes = scrolledtext.ScrolledText(recent_frame, height=8, font=("Helvetica", 10), wrap=tk.WORD)
@@ -389,7 +411,7 @@ class BookReaderGUI:
         messagebox.showerror(title, msg)
 
     def save_note(self):
-        """Append user note with current position and timestamp to notes.txt."""
+        """Store the user note with the current position in the library."""
         if not self.reader: return
         
         note_text = self.txt_notes.get("1.0", tk.END).strip()
@@ -398,37 +420,35 @@ class BookReaderGUI:
             return
 
         try:
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            pos = self.reader.position_info()
-            notes_file = self.reader.scenes_dir / "notes.txt"
-            
-            with open(notes_file, "a", encoding="utf-8") as f:
-                f.write(f"\n--- {timestamp} ---\n")
-                f.write(f"Position: {pos}\n")
-                f.write(f"Note: {note_text}\n")
-                f.write("-" * 20 + "\n")
-            
+            self.reader.add_note(note_text)
             self.txt_notes.delete("1.0", tk.END)
-            self.log_status(f"Note saved to {os.path.basename(notes_file)}")
+            self.log_status(f"Note saved at {self.reader.current.label}")
             self.update_notes_display()
         except Exception as e:
             self.handle_error("Save Note Error", e)
 
     def update_notes_display(self):
-        """Reload the notes.txt file into the recent notes pane."""
+        """Show the book's most recent notes (and any notes.txt from older versions)."""
         if not self.reader: return
         try:
-            notes_file = self.reader.scenes_dir / "notes.txt"
-            if not notes_file.exists():
-                content = "(No notes yet)"
-            else:
+            parts = []
+            notes_file = self.reader.notes_file
+            if notes_file.exists():
                 # Read last 10KB to keep it snappy
                 with open(notes_file, "r", encoding="utf-8") as f:
                     if os.path.getsize(notes_file) > 10000:
                         f.seek(os.path.getsize(notes_file) - 10000)
-                        content = "... [earlier notes truncated] ...\n" + f.read()
+                        parts.append("... [earlier notes truncated] ...\n" + f.read())
                     else:
-                        content = f.read()
+                        parts.append(f.read())
+            for note in self.reader.notes(limit=NOTES_SHOWN):
+                timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(note["created_at"]))
+                parts.append(
+                    f"--- {timestamp} ---\n"
+                    f"Position: {note['label']} | Sent {note['sentence_index'] + 1}\n"
+                    f"Note: {note['text']}\n" + "-" * 20
+                )
+            content = "\n".join(parts) if parts else "(No notes yet)"
 
             self.txt_recent_notes.config(state=tk.NORMAL)
             self.txt_recent_notes.delete("1.0", tk.END)
@@ -445,6 +465,11 @@ class BookReaderGUI:
         )
         if not file_path: return
 
+        if messagebox.askyesno("Import Text Book", "Read this book directly, without writing scene files?\n\n"
+                               "Choose No to split it into a scenes folder instead."):
+            self._load_folder(file_path)   # split in memory (see virtual_book.py)
+            return
+
         # Suggest output directory
         base_dir = Path(file_path).parent
         out_dir = filedialog.askdirectory(title="Select Output Folder for Scenes", initialdir=str(base_dir))
@@ -453,14 +478,22 @@ class BookReaderGUI:
         self.log_status("Splitting book into scenes...")
         def _do_split():
             try:
-                self.splitter.split_book(file_path, out_dir)
-                self.root.after(0, lambda: self._after_import(out_dir))
+                changes = self.splitter.import_book(file_path, out_dir)
+                self.root.after(0, lambda: self._after_import(out_dir, changes))
             except Exception as e:
                 self.root.after(0, lambda: self.handle_error("Split Error", e))
         threading.Thread(target=_do_split, daemon=True).start()
 
-    def _after_import(self, folder):
-        self.log_status(f"Import complete: {os.path.basename(folder)}")
+    def _after_import(self, folder, changes):
+        self.log_status(
+            f"Import complete: {os.path.basename(folder)} ({len(changes['added'])} added, "
+            f"{len(changes['removed'])} removed, {len(changes['modified'])} modified)"
+        )
+        if self.reader and self.reader.scenes_dir.resolve() == Path(folder).resolve():
+            # Re-import of the open book: unchanged scenes kept their files, so
+            # only the changed ones are re-indexed and the position is kept.
+            self._refresh_book()
+            return
         self._load_folder(folder)
 
     def load_book(self):
@@ -469,7 +502,13 @@ class BookReaderGUI:
 
     def _load_folder(self, folder):
         try:
-            self.reader = BookReader(folder)
+            # Open the saved (or first) scene at once; the rest is indexed in the background.
+            self.reader = BookReader(folder, progressive=True)
+            if self.reader.indexing:
+                self.root.after(INDEX_POLL_MS, self._poll_index)
+            if self.watcher:
+                self.watcher.stop()
+            self.watcher = BookWatcher(self.reader, lambda: self.root.after(0, self._refresh_book)).start()
             self._mark_played_position()
             self.update_display()
             self.log_status(f"Loaded: {os.path.basename(folder)}")
@@ -484,6 +523,8 @@ class BookReaderGUI:
             self.btn_prev_sc.config(state=tk.NORMAL)
             self.btn_next_sc.config(state=tk.NORMAL)
             self.btn_next_ch.config(state=tk.NORMAL)
+            self.btn_find.config(state=tk.NORMAL)
+            self._search_query = None
             
             self.update_notes_display()
             
@@ -495,6 +536,40 @@ class BookReaderGUI:
         except Exception as e:
             self.handle_error("Load Error", e)
 
+    def _refresh_book(self):
+        """Re-index scene files edited on disk, keeping the current position."""
+        if not self.reader:
+            return
+        try:
+            changes = self.reader.refresh()
+        except Exception as e:
+            self.handle_error("Refresh Error", e)
+            return
+        if any(changes.values()):
+            self.log_status(
+                f"Book updated: {len(changes['added'])} added, "
+                f"{len(changes['removed'])} removed, {len(changes['modified'])} modified."
+            )
+            self._search_query = None   # hits may point at changed sentences
+            if not self.playing:
+                self.update_display()
+
+    def _poll_index(self):
+        """Install background indexing progress on the Tk thread until it completes."""
+        reader = self.reader
+        if reader is None or not reader.indexing:
+            return
+        if reader.update_index():
+            count = len(reader._scenes)
+            if reader.indexing:
+                self.log_status(f"Indexing... {count} scenes so far")
+            else:
+                self.log_status(f"Indexed {count} scenes across {reader._chapter_count()} chapters.")
+            if not self.playing:
+                self.update_display()
+        if reader.indexing:
+            self.root.after(INDEX_POLL_MS, self._poll_index)
+
     def update_display(self, scene=None):
         """Update display with current scene text."""
         try:
@@ -571,6 +646,11 @@ class BookReaderGUI:
         self.btn_play.config(text="Pause")
         self.btn_stop.config(state=tk.NORMAL)
         self.log_status("Reading (Buffered)...")
+        # Ramp chunk sizes from a single sentence so the first audio arrives quickly.
+        planner = ChunkPlanner.from_settings(chunk_settings(self.tts_model_var.get()))
+        # The feeder runs ahead of playback on its own cursor; the reader only
+        # moves (and saves progress) on the Tk thread as each chunk starts playing.
+        cursor = self.reader.cursor()
 
         def _feeder():
             try:
@@ -578,11 +658,15 @@ class BookReaderGUI:
                 while self.playing and not self.stop_event.is_set():
                     if self.speaker.playback_error:
                         raise RuntimeError(f"Playback failed: {self.speaker.playback_error}")
-                    scene = self.reader.current
-                    start_index = self.reader._index
-                    start_sentence_index = self.reader._sentence_index
-                    text = self.reader.get_next_chunk(max_chars=500)
+                    scene = cursor.current
+                    start_index, start_sentence_index = cursor.position
+                    text = planner.next_chunk(cursor)
                     if text is None:
+                        if self.reader.indexing:
+                            # The rest of the book is still being indexed; the cursor
+                            # moves to the fuller scene list once the Tk timer installs it.
+                            time.sleep(0.2)
+                            continue
                         self.log_status("End of Book Reached")
                         break
                     
@@ -602,9 +686,12 @@ class BookReaderGUI:
         threading.Thread(target=_feeder, daemon=True).start()
 
     def _sync_ui_to_scene(self, scene, index, sentence_index):
-        """Update UI to match what is currently playing."""
+        """Move the reader to what is currently playing and update the UI."""
         if not self.playing: return
-        self._mark_played_position(index, sentence_index)
+        if self.reader.go_to_scene(scene, sentence_index) is None:
+            self._mark_played_position(index, sentence_index)   # scene removed by a refresh
+        else:
+            self._mark_played_position()
         self.update_display(scene)
 
     def _on_stop(self):
@@ -624,28 +711,25 @@ class BookReaderGUI:
         self._on_stop()
 
     def save_session(self):
-        """Save current reading position to last_read.json."""
+        """Save the current reading position and TTS choice to the library."""
         if not self.reader: return
+        data = {
+            "scenes_dir": str(self.reader.scenes_dir.resolve()),
+            "index": self._played_index,
+            "sentence_index": self._played_sentence_index,
+            "tts_model": self.tts_model_var.get(),
+            "tts_voice": self.tts_voice_var.get(),
+        }
         try:
-            import json
-            data = {
-                "scenes_dir": str(self.reader.scenes_dir.resolve()),
-                "index": self._played_index,
-                "sentence_index": self._played_sentence_index,
-                "tts_model": self.tts_model_var.get(),
-                "tts_voice": self.tts_voice_var.get(),
-            }
-            LAST_READ_FILE.write_text(json.dumps(data, indent=2))
+            self.reader.library.set_setting(SESSION_KEY, data)
         except Exception as e:
             print(f"Error saving session: {e}")
 
     def load_session(self):
         """Load the last read session if it exists."""
-        if not LAST_READ_FILE.exists(): return
         try:
-            import json
-            data = json.loads(LAST_READ_FILE.read_text())
-            
+            data = default_library().setting(SESSION_KEY) or read_json_locked(LEGACY_LAST_READ_FILE)
+            if data is None: return
             if "tts_model" in data:
                 saved_model = data["tts_model"]
                 if saved_model not in available_tts_models():
@@ -654,11 +738,11 @@ class BookReaderGUI:
                 self._refresh_voice_options(data.get("tts_voice"))
 
             folder = data.get("scenes_dir")
-            if folder and os.path.isdir(folder):
+            if folder and os.path.exists(folder):   # a scenes folder or a single book file
                 self._load_folder(folder)
                 if self.reader:
-                    self.reader._index = data.get("index", 0)
-                    self.reader._sentence_index = data.get("sentence_index", 0)
+                    # The reader restored its own saved position (by scene path,
+                    # which stays valid while the book is still being indexed).
                     self._mark_played_position()
                     self.update_display()
         except Exception as e:
@@ -667,7 +751,11 @@ class BookReaderGUI:
     def exit_app(self):
         """Save state and close the application."""
         self.stop_playback(silent=True)
+        if self.watcher:
+            self.watcher.stop()
         self.save_session()
+        PROGRESS_JOURNAL.flush()
+        default_library().flush()
         self.root.destroy()
         sys.exit(0)
 
@@ -699,29 +787,82 @@ class BookReaderGUI:
     def prev_chapter(self):
         self._navigate(self.reader.prev_chapter)
 
+    def find_next(self):
+        """Jump to the next sentence matching the search box; a new query searches first."""
+        if not self.reader:
+            return
+        query = self.search_var.get().strip()
+        if not query:
+            return
+        if query == self._search_query:
+            if self._search_hits:
+                self._goto_search_hit(self._search_pos + 1)
+            return
+
+        self._search_query = query
+        self._search_hits = []
+        self._search_pos = -1
+        self.log_status(f"Searching for {query}...")
+        # The worker searches a read-only cursor; reader state is only updated back on the Tk thread.
+        reader = self.reader
+        index = reader.open_search_index()
+        cursor = reader.cursor()
+
+        def _run():
+            try:
+                hits, counts = cursor.search(index, query, limit=None)   # first search builds the index
+            except Exception as e:
+                self.root.after(0, lambda: self.handle_error("Search Error", e))
+                return
+            self.root.after(0, lambda: self._show_search_hits(query, hits, reader, cursor.scenes, counts))
+        threading.Thread(target=_run, daemon=True).start()
+
+    def _show_search_hits(self, query, hits, reader, scenes, counts):
+        reader.search_index_updated(scenes, counts)
+        if query != self._search_query or reader is not self.reader:
+            return   # a newer search (or book) replaced this one
+        self._search_hits = hits
+        if not hits:
+            self.log_status(f"No matches for {query}.")
+            return
+        self._goto_search_hit(0)
+
+    def _goto_search_hit(self, pos):
+        pos %= len(self._search_hits)
+        self._search_pos = pos
+        hit = self._search_hits[pos]
+        self._navigate(lambda: self.reader.go_to(hit.chapter, hit.scene, hit.sentence_index))
+        self.log_status(
+            f"Match {pos + 1}/{len(self._search_hits)}: Chapter {hit.chapter}, "
+            f"Scene {hit.scene}, sentence {hit.sentence_index + 1}"
+        )
+
     def save_bookmark_dialog(self):
         if not self.reader: return
-        filename = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[("JSON Bookmark", "*.json")],
-            title="Save Bookmark"
+        name = simpledialog.askstring(
+            "Save Bookmark", "Bookmark name:", initialvalue=self.reader.current.label, parent=self.root
         )
-        if filename:
-            self.reader.save_progress(Path(filename))
-            self.log_status(f"Bookmark saved: {os.path.basename(filename)}")
+        if name and name.strip():
+            self.reader.save_bookmark(name.strip())
+            self.log_status(f"Bookmark saved: {name.strip()}")
 
     def load_bookmark_dialog(self):
         if not self.reader: return
-        filename = filedialog.askopenfilename(
-            filetypes=[("JSON Bookmark", "*.json")],
-            title="Load Bookmark"
-        )
-        if filename:
-            if self.reader._restore_progress(Path(filename)):
-                self.update_display()
-                self.log_status(f"Bookmark loaded: {os.path.basename(filename)}")
-            else:
-                messagebox.showerror("Error", "Could not load bookmark. Path might be different.")
+        marks = self.reader.bookmarks()
+        if not marks:
+            messagebox.showinfo("Load Bookmark", "No bookmarks saved for this book.")
+            return
+        listing = "\n".join(f"{m['name']}  ({m['label']}, sentence {m['sentence_index'] + 1})" for m in marks)
+        name = simpledialog.askstring("Load Bookmark", f"{listing}\n\nBookmark name:",
+                                      initialvalue=marks[0]["name"], parent=self.root)
+        if not name:
+            return
+        if self.reader.restore_bookmark(name.strip()):
+            self._mark_played_position()
+            self.update_display()
+            self.log_status(f"Bookmark loaded: {name.strip()}")
+        else:
+            messagebox.showerror("Error", f"No bookmark named {name.strip()!r}.")
 
     def combine_audio_dialog(self):
         input_dir = filedialog.askdirectory(title="Select Directory of Exported M4A Files")
@@ -756,6 +897,9 @@ class BookReaderGUI:
         if not self.model:
             messagebox.showerror("Export Error", "Export is currently only supported with local MLX models. Please load an internal model first.")
             return
+        if self.reader.indexing:
+            messagebox.showinfo("Export", "The book is still being indexed; try again in a moment.")
+            return
 
         out_dir = filedialog.askdirectory(title="Select Output Directory for Audio Files", initialdir=str(self.reader.scenes_dir.parent))
         if not out_dir: return
@@ -775,15 +919,28 @@ class BookReaderGUI:
     def _export_worker(self, out_dir, export_mode="Chapter", export_bitrate=DEFAULT_EXPORT_BITRATE):
         try:
             export_bitrate = normalized_export_bitrate(export_bitrate)
-            export_reader = BookReader(self.reader.scenes_dir)
-            export_reader._index = self.reader._index
-            export_reader._sentence_index = self.reader._sentence_index
-            
-            remaining_scenes = export_reader._scenes[export_reader._index:]
+            max_chars = chunk_settings(self.tts_model_var.get())["max_chars"]
+            # A read-only cursor: export never moves the reader or saves progress.
+            cursor = self.reader.cursor()
+            start_index = cursor.index
+
+            remaining_scenes = cursor.scenes[start_index:]
             if not remaining_scenes:
                 self.root.after(0, lambda: self.log_status("No scenes to export."))
                 return
 
+            # Address chunks by id through the precomputed plan instead of
+            # replaying get_next_chunk.
+            plan = cursor.chunk_plan(max_chars)
+            first_chunk = cursor.current_chunk_id(plan)
+            if first_chunk is None:
+                first_chunk = len(plan)
+            # Resume from the saved sentence itself, not the start of the chunk holding it.
+            resume_at = None
+            if first_chunk < len(plan) and plan.chunk(first_chunk)[0] == start_index:
+                resume_at = cursor.sentence_index
+            scene_indices = {id(sc): i for i, sc in enumerate(remaining_scenes, start_index)}
+
             export_units = export_units_for_scenes(remaining_scenes, export_mode)
 
             sr = 24000
@@ -814,21 +971,20 @@ class BookReaderGUI:
                     for sc in sc_list:
                         if self.stop_event.is_set():
                             break
-                        sc_idx = export_reader._scenes.index(sc)
-                        if export_reader._index != sc_idx:
-                            export_reader._index = sc_idx
-                            export_reader._sentence_index = 0
-                            
-                        while export_reader._index == sc_idx and export_reader._sentence_index < len(export_reader._scenes[sc_idx].sentences()):
+                        sc_idx = scene_indices[id(sc)]
+                        total_sents = len(sc.sentences())
+
+                        for chunk_id in plan.scene_chunks(sc_idx):
+                            if chunk_id < first_chunk:
+                                continue
                             if self.stop_event.is_set():
                                 break
-                            sent_idx = export_reader._sentence_index
-                            total_sents = len(export_reader._scenes[sc_idx].sentences())
+                            sent_idx = plan.starts[chunk_id]
+                            if chunk_id == first_chunk and resume_at is not None:
+                                sent_idx = resume_at
                             self.root.after(0, lambda label=unit_label, s=sent_idx, t=total_sents: self.log_status(f"Exporting {label}... ({s}/{t} sentences)"))
                             
-                            text = export_reader.get_next_chunk(max_chars=500)
-                            if not text:
-                                break
+                            text = cursor.chunk_text(plan, chunk_id, sent_idx)
                             
                             def _update_ui(t=text, s_scene=sc):
                                 self.lbl_chapter.config(text=f"Exporting {s_scene.label}")
@@ -0,0 +1,331 @@
+"""
+library.py — Multi-book library: progress, bookmarks, notes and index metadata.
+
+One SQLite database (stdlib `sqlite3`) replaces the single-book progress JSON
+and the GUI's `last_read.json`:
+
+    books(id, path, title, scene_count, chapter_count, ...)   one row per book
+    progress(book_id, scene_index, sentence_index, ...)       latest position
+    bookmarks(book_id, name, scene_index, sentence_index, ...)
+    notes(id, book_id, label, sentence_index, text, created_at)
+    settings(key, value)                                      JSON values (GUI session)
+
+The database runs in WAL mode, so the GUI, the CLI and background exporters
+can read while another process writes, and every update touches a few rows
+instead of rewriting a whole file. Each thread gets its own connection.
+Position updates go through a write-behind `ProgressJournal`, so navigation
+never waits on the database.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+try:
+    from .progress import ProgressJournal, read_json_locked
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from progress import ProgressJournal, read_json_locked
+
+DEFAULT_LIBRARY_FILE = Path.home() / ".book_reader_library.sqlite3"
+LEGACY_PROGRESS_FILE = Path.home() / ".book_reader_progress.json"
+LIBRARY_VERSION = 1
+
+BOOK_FIELDS = ("title", "scene_count", "chapter_count", "search_indexed_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    title TEXT,
+    scene_count INTEGER,
+    chapter_count INTEGER,
+    search_indexed_at REAL,
+    added_at REAL NOT NULL,
+    opened_at REAL
+);
+CREATE INDEX IF NOT EXISTS books_opened ON books (opened_at);
+CREATE TABLE IF NOT EXISTS progress (
+    book_id INTEGER PRIMARY KEY REFERENCES books (id) ON DELETE CASCADE,
+    scene_index INTEGER NOT NULL,
+    sentence_index INTEGER NOT NULL,
+    label TEXT,
+    scene_title TEXT,
+    updated_at REAL NOT NULL,
+    scene_path TEXT
+);
+CREATE TABLE IF NOT EXISTS bookmarks (
+    book_id INTEGER NOT NULL REFERENCES books (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    scene_index INTEGER NOT NULL,
+    sentence_index INTEGER NOT NULL,
+    label TEXT,
+    scene_title TEXT,
+    created_at REAL NOT NULL,
+    scene_path TEXT,
+    PRIMARY KEY (book_id, name)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    book_id INTEGER NOT NULL REFERENCES books (id) ON DELETE CASCADE,
+    label TEXT,
+    sentence_index INTEGER,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notes_book ON notes (book_id, id);
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+class Library:
+    """Per-user store of reading state for any number of books, keyed by book path."""
+
+    def __init__(self, path: str | Path = DEFAULT_LIBRARY_FILE, delay: float = 0.5):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._conn_lock = threading.Lock()
+        self._journal = ProgressJournal(delay, writer=self._write_progress)
+        db = self._db()
+        with db:
+            db.executescript(_SCHEMA)
+            db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(LIBRARY_VERSION),))
+
+    def _db(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use."""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5.0)
+            db.execute("PRAGMA journal_mode = WAL")   # readers never block the writer
+            db.execute("PRAGMA synchronous = NORMAL")  # WAL stays consistent; fsync at checkpoints
+            db.execute("PRAGMA foreign_keys = ON")
+            db.row_factory = sqlite3.Row
+            self._local.db = db
+            with self._conn_lock:
+                self._connections.append(db)
+        return db
+
+    def close(self) -> None:
+        """Flush pending progress and close every thread's connection."""
+        self._journal.flush()
+        with self._conn_lock:
+            connections, self._connections = self._connections, []
+        for db in connections:
+            db.close()
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Books
+    # ------------------------------------------------------------------
+
+    def _book_id(self, db: sqlite3.Connection, book: str) -> int:
+        row = db.execute("SELECT id FROM books WHERE path = ?", (book,)).fetchone()
+        if row is None:
+            # Another process may add the same book between the two statements.
+            db.execute("INSERT OR IGNORE INTO books (path, added_at) VALUES (?, ?)", (book, time.time()))
+            row = db.execute("SELECT id FROM books WHERE path = ?", (book,)).fetchone()
+        return row[0]
+
+    def record_book(self, book: str, opened: bool = False, **fields: Any) -> None:
+        """Add book if new and update its metadata (see BOOK_FIELDS); opened marks it recently read."""
+        unknown = set(fields) - set(BOOK_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown book fields: {', '.join(sorted(unknown))}")
+        if opened:
+            fields["opened_at"] = time.time()
+        db = self._db()
+        with db:
+            book_id = self._book_id(db, book)
+            if fields:
+                assignments = ", ".join(f"{name} = ?" for name in fields)
+                db.execute(f"UPDATE books SET {assignments} WHERE id = ?", (*fields.values(), book_id))
+
+    def book(self, book: str) -> dict | None:
+        row = self._db().execute("SELECT * FROM books WHERE path = ?", (book,)).fetchone()
+        return None if row is None else dict(row)
+
+    def books(self, limit: int | None = None) -> list[dict]:
+        """Return books with their saved position, most recently opened first."""
+        rows = self._db().execute(
+            "SELECT b.*, p.scene_index, p.sentence_index, p.label, p.scene_title "
+            "FROM books b LEFT JOIN progress p ON p.book_id = b.id "
+            "ORDER BY b.opened_at IS NULL, b.opened_at DESC, b.id LIMIT ?",
+            (-1 if limit is None else limit,),
+        )
+        return [dict(row) for row in rows]
+
+    def forget_book(self, book: str) -> None:
+        """Remove book with its progress, bookmarks and notes."""
+        db = self._db()
+        with db:
+            db.execute("DELETE FROM books WHERE path = ?", (book,))
+
+    # ------------------------------------------------------------------
+    # Progress
+    # ------------------------------------------------------------------
+
+    def save_progress(self, data: dict) -> None:
+        """
+        Store a position payload as built by BookReader:
+        {"book", "index", "sentence_index", "label", "scene_title", "path"}.
+        """
+        db = self._db()
+        with db:
+            book_id = self._book_id(db, data["book"])
+            db.execute(
+                "INSERT OR REPLACE INTO progress (book_id, scene_index, sentence_index, label, scene_title, "
+                "updated_at, scene_path) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (book_id, int(data["index"]), int(data.get("sentence_index", 0)),
+                 data.get("label"), data.get("scene_title"), time.time(), data.get("path")),
+            )
+
+    def submit_progress(self, book: str, data) -> None:
+        """Queue a position (dict or callable) to be written behind; the newest per book wins."""
+        self._journal.submit(Path(book), data)
+
+    def _write_progress(self, _book: Path, data: dict) -> None:
+        self.save_progress(data)
+
+    def flush(self, book: str | None = None) -> None:
+        """Synchronously write queued progress (for one book, or all of them)."""
+        self._journal.flush(None if book is None else Path(book))
+
+    def progress(self, book: str) -> dict | None:
+        """Return the saved position payload for book, or None."""
+        self.flush(book)   # make sure our own pending write is visible
+        row = self._db().execute(
+            "SELECT p.scene_index, p.sentence_index, p.label, p.scene_title, p.scene_path FROM progress p "
+            "JOIN books b ON b.id = p.book_id WHERE b.path = ?",
+            (book,),
+        ).fetchone()
+        return None if row is None else _payload(book, row)
+
+    # ------------------------------------------------------------------
+    # Bookmarks and notes
+    # ------------------------------------------------------------------
+
+    def save_bookmark(self, name: str, data: dict) -> None:
+        """Store a position payload under name, replacing a bookmark of the same name."""
+        db = self._db()
+        with db:
+            book_id = self._book_id(db, data["book"])
+            db.execute(
+                "INSERT OR REPLACE INTO bookmarks (book_id, name, scene_index, sentence_index, label, "
+                "scene_title, created_at, scene_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (book_id, name, int(data["index"]), int(data.get("sentence_index", 0)),
+                 data.get("label"), data.get("scene_title"), time.time(), data.get("path")),
+            )
+
+    def bookmark(self, book: str, name: str) -> dict | None:
+        row = self._db().execute(
+            "SELECT k.scene_index, k.sentence_index, k.label, k.scene_title, k.scene_path FROM bookmarks k "
+            "JOIN books b ON b.id = k.book_id WHERE b.path = ? AND k.name = ?",
+            (book, name),
+        ).fetchone()
+        return None if row is None else _payload(book, row)
+
+    def bookmarks(self, book: str) -> list[dict]:
+        """Return book's bookmarks (name, label, scene_title, ...) in reading order."""
+        rows = self._db().execute(
+            "SELECT k.name, k.scene_index, k.sentence_index, k.label, k.scene_title, k.created_at "
+            "FROM bookmarks k JOIN books b ON b.id = k.book_id WHERE b.path = ? "
+            "ORDER BY k.scene_index, k.sentence_index, k.name",
+            (book,),
+        )
+        return [dict(row) for row in rows]
+
+    def delete_bookmark(self, book: str, name: str) -> bool:
+        db = self._db()
+        with db:
+            cur = db.execute(
+                "DELETE FROM bookmarks WHERE name = ? AND book_id = (SELECT id FROM books WHERE path = ?)",
+                (name, book),
+            )
+        return cur.rowcount > 0
+
+    def add_note(self, book: str, text: str, label: str | None = None, sentence_index: int | None = None) -> int:
+        """Append a note for book at an optional position; returns the note id."""
+        db = self._db()
+        with db:
+            book_id = self._book_id(db, book)
+            return db.execute(
+                "INSERT INTO notes (book_id, label, sentence_index, text, created_at) VALUES (?, ?, ?, ?, ?)",
+                (book_id, label, sentence_index, text, time.time()),
+            ).lastrowid
+
+    def notes(self, book: str, limit: int | None = None) -> list[dict]:
+        """Return book's notes oldest first; with limit, only the most recent ones."""
+        rows = self._db().execute(
+            "SELECT n.id, n.label, n.sentence_index, n.text, n.created_at FROM notes n "
+            "JOIN books b ON b.id = n.book_id WHERE b.path = ? ORDER BY n.id DESC LIMIT ?",
+            (book, -1 if limit is None else limit),
+        ).fetchall()
+        return [dict(row) for row in reversed(rows)]
+
+    # ------------------------------------------------------------------
+    # Settings and migration
+    # ------------------------------------------------------------------
+
+    def setting(self, key: str, default: Any = None) -> Any:
+        row = self._db().execute("SELECT value FROM settings WHERE key = ?", (key,)).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set_setting(self, key: str, value: Any) -> None:
+        db = self._db()
+        with db:
+            db.execute("INSERT OR REPLACE INTO settings VALUES (?, ?)", (key, json.dumps(value)))
+
+    def import_progress_file(self, path: str | Path) -> bool:
+        """
+        Import a legacy single-book progress JSON once. Progress already in the
+        library for that book wins. Returns True if a position was imported.
+        """
+        path = Path(path)
+        key = f"imported:{path.resolve()}"
+        db = self._db()
+        if db.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone() is not None:
+            return False
+        data = read_json_locked(path)
+        imported = False
+        with db:
+            if data is not None and isinstance(data.get("book"), str) and "index" in data:
+                book_id = self._book_id(db, data["book"])
+                imported = db.execute(
+                    "INSERT OR IGNORE INTO progress (book_id, scene_index, sentence_index, label, scene_title, "
+                    "updated_at, scene_path) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (book_id, int(data["index"]), int(data.get("sentence_index", 0)),
+                     data.get("label"), data.get("scene_title"), time.time(), data.get("path")),
+                ).rowcount > 0
+            db.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(time.time())))
+        return imported
+
+
+def _payload(book: str, row: sqlite3.Row) -> dict:
+    return {
+        "book": book,
+        "index": row["scene_index"],
+        "sentence_index": row["sentence_index"],
+        "label": row["label"],
+        "scene_title": row["scene_title"],
+        "path": row["scene_path"],
+    }
+
+
+_DEFAULT: Library | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_library() -> Library:
+    """Return the per-user library, importing the old single-book progress file on first use."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = Library(DEFAULT_LIBRARY_FILE)
+            if LEGACY_PROGRESS_FILE.exists():
+                _DEFAULT.import_progress_file(LEGACY_PROGRESS_FILE)
+        return _DEFAULT
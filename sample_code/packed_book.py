@@ -0,0 +1,113 @@
+"""
+packed_book.py — Single-file book store read through mmap.
+
+A split book is normally hundreds of small Markdown files, and every scene
+costs an open() for its title and another for its text. A packed book holds
+the same scenes, already cleaned for TTS, in one file:
+
+    MAGIC (8 bytes) | version u32 | scene count u32 | metadata length u64
+    metadata JSON   (one manifest-style entry per scene, in reading order)
+    offset table    (scene count × (offset u64, length u64), little-endian)
+    scene texts     (UTF-8, concatenated)
+
+`PackedBook` maps the file once; a scene's text is decoded straight out of
+the mapping when the shared SceneCache misses, so opening a book and seeking
+to any scene never touches more than the pages it reads.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+PACK_SUFFIX = ".tbrpack"
+PACK_MAGIC = b"TBRPACK\0"
+PACK_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQ")
+
+
+def is_packed_book(path: str | Path) -> bool:
+    """True if path names a packed book file (by suffix; the magic is checked on open)."""
+    path = Path(path)
+    return path.suffix.lower() == PACK_SUFFIX and path.is_file()
+
+
+def write_pack(target: str | Path, scenes: list[dict]) -> Path:
+    """
+    Write scenes to a packed book. Each scene dict needs `text` (cleaned) plus
+    manifest-style metadata: path, chapter, scene, name, title, sentences, words.
+    The file is written to a temp name and renamed into place.
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    blobs = [sc["text"].encode("utf-8") for sc in scenes]
+    meta = json.dumps(
+        [{k: v for k, v in sc.items() if k != "text"} for sc in scenes],
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    offsets = array("Q")
+    pos = _HEADER.size + len(meta) + 16 * len(scenes)
+    for blob in blobs:
+        offsets.extend((pos, len(blob)))
+        pos += len(blob)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(scenes), len(meta)))
+            f.write(meta)
+            f.write(offsets.tobytes())
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    return target
+
+
+class PackedBook:
+    """Read-only, memory-mapped view of a packed book file."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            self.stamp = (st.st_mtime_ns, st.st_size)
+            if st.st_size < _HEADER.size:
+                raise ValueError(f"Not a packed book: {self.path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, meta_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a packed book (or unsupported version): {self.path}")
+        meta_end = _HEADER.size + meta_len
+        self.entries: list[dict] = json.loads(self._mm[_HEADER.size:meta_end].decode("utf-8"))
+        self._offsets = array("Q", self._mm[meta_end:meta_end + 16 * count])
+        if sys.byteorder != "little":
+            self._offsets.byteswap()
+        if len(self.entries) != count or len(self._offsets) != 2 * count:
+            self._mm.close()
+            raise ValueError(f"Corrupt packed book: {self.path}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def text(self, index: int) -> str:
+        """Decode one scene's cleaned text from the mapping."""
+        offset, length = self._offsets[2 * index], self._offsets[2 * index + 1]
+        return self._mm[offset:offset + length].decode("utf-8")
+
+    def close(self) -> None:
+        self._mm.close()
@@ -0,0 +1,105 @@
+"""
+playback_events.py — Ordered playback events delivered on one dispatch thread.
+
+The audio callback must not run user code, start threads or block, so it
+only posts small PlaybackEvent tuples to an EventDispatcher. The dispatcher's
+single thread hands them, in the order they were posted, to every subscriber
+(the GUI syncing its scene view, a per-chunk callback, a status line).
+
+Posting appends to a bounded deque: `deque.append` and `popleft` are atomic
+in CPython, and when the queue is full the event is counted in `dropped`
+instead of waiting. It then sets a `threading.Event` to wake the dispatch
+thread, which sleeps on it while there is nothing to deliver.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, NamedTuple
+
+CHUNK_STARTED = "chunk_started"
+CHUNK_FINISHED = "chunk_finished"
+UNDERRUN = "underrun"
+END_OF_QUEUE = "end_of_queue"
+
+MAX_EVENTS = 256
+POLL_INTERVAL = 0.005   # wait_idle() only
+
+
+class PlaybackEvent(NamedTuple):
+    kind: str
+    chunk: Any = None   # the chunk the event is about (chunk events only)
+    position: int = 0   # playback position in samples when the event was posted
+
+
+class EventDispatcher:
+    """Single-thread, in-order delivery of PlaybackEvents to subscribers."""
+
+    def __init__(self, max_events: int = MAX_EVENTS, name: str = "playback-events"):
+        self.max_events = max_events
+        self.dropped = 0
+        self._events: deque[PlaybackEvent] = deque()
+        self._subscribers: list[tuple[Callable[[PlaybackEvent], None], frozenset | None]] = []
+        self._closed = False
+        self._idle = True
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def subscribe(self, handler: Callable[[PlaybackEvent], None], kinds=None) -> Callable[[PlaybackEvent], None]:
+        """Call handler(event) on the dispatch thread for events of the given kinds (default: all)."""
+        entry = (handler, None if kinds is None else frozenset(kinds))
+        self._subscribers = self._subscribers + [entry]   # copy on write; _run iterates a snapshot
+        return handler
+
+    def unsubscribe(self, handler: Callable[[PlaybackEvent], None]) -> None:
+        self._subscribers = [entry for entry in self._subscribers if entry[0] is not handler]
+
+    def post(self, event: PlaybackEvent) -> bool:
+        """Queue an event without blocking or locking (safe on the audio thread). False if it was dropped."""
+        if len(self._events) >= self.max_events:
+            self.dropped += 1
+            return False
+        self._events.append(event)
+        self._wake.set()
+        return True
+
+    def clear(self) -> None:
+        """Drop events not yet delivered (e.g. on stop)."""
+        self._events.clear()
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until every posted event has been delivered, or timeout expires."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._events or not self._idle:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(POLL_INTERVAL)
+        return True
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake.set()
+        self._thread.join(timeout=1)
+
+    def _run(self) -> None:
+        events = self._events
+        while True:
+            self._wake.wait()
+            self._wake.clear()   # before draining, so a post during delivery wakes the next wait
+            if self._closed:
+                return
+            self._idle = False
+            while events:
+                try:
+                    event = events.popleft()
+                except IndexError:   # cleared meanwhile
+                    break
+                for handler, kinds in self._subscribers:
+                    if kinds is not None and event.kind not in kinds:
+                        continue
+                    try:
+                        handler(event)
+                    except Exception as e:   # one bad subscriber must not stop delivery
+                        print(f"Playback event handler error: {e}")
+            self._idle = True
@@ -0,0 +1,137 @@
+"""
+progress.py — Write-behind, atomic persistence for reading progress.
+
+Navigation happens on the Tk thread and on the playback feeder thread, so it
+must never wait for the disk. `ProgressJournal.submit` only records the latest
+payload for a file and returns; a background writer coalesces bursts of
+updates (e.g. holding down ">>") into one write per file. Every write goes to
+a temp file that is renamed over the target while holding an advisory lock,
+so the GUI and the CLI can share one progress file without tearing it.
+Pending writes are flushed at interpreter exit.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: fall back to rename-only atomicity
+    fcntl = None
+
+Payload = dict[str, Any] | Callable[[], dict[str, Any]]
+
+
+@contextmanager
+def file_lock(target: Path, shared: bool = False):
+    """Hold an advisory lock on `<target>.lock` for the duration of the block."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(target.with_name(target.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)   # closing the descriptor releases the lock
+
+
+def write_json_atomic(target: str | Path, data: dict[str, Any]) -> None:
+    """Replace target with data as JSON via temp-file-and-rename under the file lock."""
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(target):
+        fd, tmp = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, indent=2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, target)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def read_json_locked(target: str | Path) -> dict[str, Any] | None:
+    """Return the JSON object in target, or None if it is missing or corrupt."""
+    target = Path(target)
+    if not target.exists():
+        return None
+    try:
+        with file_lock(target, shared=True):
+            data = json.loads(target.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class ProgressJournal:
+    """Coalescing background writer: the newest payload per target wins."""
+
+    def __init__(self, delay: float = 0.5, writer: Callable[[Path, dict], None] = write_json_atomic):
+        self.delay = delay
+        self._writer = writer
+        self._pending: dict[Path, Payload] = {}
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()   # serializes batches so older data never lands last
+        self._thread: threading.Thread | None = None
+        atexit.register(self.flush)
+
+    def submit(self, target: str | Path, data: Payload) -> None:
+        """
+        Queue data for target and return immediately. `data` may be a callable
+        that builds the payload on the writer thread (e.g. to read a title).
+        """
+        with self._cond:
+            self._pending[Path(target)] = data
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="progress-journal", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self, target: str | Path | None = None) -> None:
+        """Synchronously write pending data (for one target, or all of them)."""
+        with self._io_lock:
+            with self._cond:
+                if target is None:
+                    batch, self._pending = self._pending, {}
+                else:
+                    key = Path(target)
+                    batch = {key: self._pending.pop(key)} if key in self._pending else {}
+            self._write(batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            # Let a burst of navigation settle before touching the disk.
+            time.sleep(self.delay)
+            with self._io_lock:
+                with self._cond:
+                    batch, self._pending = self._pending, {}
+                self._write(batch)
+
+    def _write(self, batch: dict[Path, Payload]) -> None:
+        for target, data in batch.items():
+            try:
+                self._writer(target, data() if callable(data) else data)
+            except Exception as e:
+                print(f"Error saving progress to {target}: {e}")
+
+
+PROGRESS_JOURNAL = ProgressJournal()
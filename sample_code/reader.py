@@ -17,21 +17,57 @@ Scene files may be Markdown or plain text.
 """
 
 import json
+import os
 import re
 import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    from .book_index import load_manifest, write_manifest
+    from .chunk_plan import ChunkPlan, book_signature, load_plan, save_plan
+    from .library import Library, default_library
+    from .packed_book import PackedBook, is_packed_book
+    from .progress import PROGRESS_JOURNAL, read_json_locked, write_json_atomic
+    from .scene_cache import SCENE_CACHE, SceneCache
+    from .search_index import SearchIndex, tokenize
+    from .sentences import SentenceSpans, segment_sentences
+    from .tts_stream import TTSStream
+    from .virtual_book import VirtualBook, is_text_book
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from book_index import load_manifest, write_manifest
+    from chunk_plan import ChunkPlan, book_signature, load_plan, save_plan
+    from library import Library, default_library
+    from packed_book import PackedBook, is_packed_book
+    from progress import PROGRESS_JOURNAL, read_json_locked, write_json_atomic
+    from scene_cache import SCENE_CACHE, SceneCache
+    from search_index import SearchIndex, tokenize
+    from sentences import SentenceSpans, segment_sentences
+    from tts_stream import TTSStream
+    from virtual_book import VirtualBook, is_text_book
 
 
 # ---------------------------------------------------------------------------
 # Text cleaning
 # ---------------------------------------------------------------------------
 
-_MD_HEADING     = re.compile(r"^#{1,6}\s+")          # # Heading
-_MD_ITALIC_BOLD = re.compile(r"(\*{1,3}|_{1,3})(.*?)\1")  # *italic* / **bold**
+# The cleaner works on the whole text at once: each pattern runs one C-level
+# pass over the scene instead of once per line. Patterns that could otherwise
+# cross a line break are restricted with [^\n] so the output is byte-identical
+# to cleaning line by line, and patterns whose trigger character does not occur
+# in the text are skipped entirely. Every pattern starts with a literal so the
+# regex engine can jump between candidates instead of trying each position.
+_MD_HEADING     = re.compile(r"#(?<![^\n]#)#{0,5}[^\S\n]+")   # # Heading (at line start)
+_MD_ITALIC_BOLD = re.compile(r"(([*_])\2{0,2})(.*?)\1")       # *italic* / **bold**
 _GUTENBERG_TAG  = re.compile(r"\[Illustration.*?\]", re.IGNORECASE)
-_UNDERSCORE_EM  = re.compile(r"_([^_]+)_")           # _emphasis_  →  emphasis
-_STAGE_DIR      = re.compile(r"_\[.*?\]_", re.DOTALL) # _[stage directions]_
-_PAREN_MEM      = re.compile(r"\(_Mem\._.*?\)", re.IGNORECASE)
+_UNDERSCORE_EM  = re.compile(r"_([^_\n]+)_")                  # _emphasis_  →  emphasis
+_STAGE_DIR      = re.compile(r"_\[[^\n]*?\]_")                 # _[stage directions]_
+_PAREN_MEM      = re.compile(r"\(_(?i:mem)\._.*?\)")
+_DASH_RUN       = re.compile(r"--+")
+_BLANK_RUN      = re.compile(r"\n\n\n+")
 
 
 def _clean_text(raw: str) -> str:
@@ -39,24 +75,32 @@ def _clean_text(raw: str) -> str:
     Strip markdown and Gutenberg formatting artefacts, returning plain prose
     suitable for TTS.
     """
-    lines = []
-    for line in raw.splitlines():
-        line = _MD_HEADING.sub("", line)
-        line = _GUTENBERG_TAG.sub("", line)
-        line = _STAGE_DIR.sub("", line)
-        line = _PAREN_MEM.sub("", line)
-        line = _MD_ITALIC_BOLD.sub(r"\2", line)
-        line = _UNDERSCORE_EM.sub(r"\1", line)
-        # Collapse em-dash markers like "_3 May. Bistritz._--" into clean text
-        line = re.sub(r"--+", " — ", line)
-        # Remove leftover underscores
-        line = line.replace("_", "")
-        lines.append(line)
-
-    text = "\n".join(lines)
+    # splitlines() treats \r\n, \r, \x0b, \u2028 etc. as breaks; normalising
+    # them to \n keeps every later pattern confined to a single line.
+    text = "\n".join(raw.splitlines())
+
+    if "#" in text:
+        text = _MD_HEADING.sub("", text)
+    if "[" in text:
+        text = _GUTENBERG_TAG.sub("", text)
+        if "_[" in text:
+            text = _STAGE_DIR.sub("", text)
+    if "(_" in text:
+        text = _PAREN_MEM.sub("", text)
+    if "*" in text or "_" in text:
+        text = _MD_ITALIC_BOLD.sub(r"\3", text)
+    if "_" in text:
+        text = _UNDERSCORE_EM.sub(r"\1", text)
+    # Collapse em-dash markers like "_3 May. Bistritz._--" into clean text
+    if "--" in text:
+        text = _DASH_RUN.sub(" — ", text)
+    # Remove leftover underscores
+    text = text.replace("_", "")
+
     # Collapse excessive blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
-    return text
+    if "\n\n\n" in text:
+        text = _BLANK_RUN.sub("\n\n", text)
+    return text.strip()
 
 
 # ---------------------------------------------------------------------------
@@ -64,12 +108,89 @@ def _clean_text(raw: str) -> str:
 # ---------------------------------------------------------------------------
 
 class Scene:
-    def __init__(self, path: Path, chapter: int, scene: int, title: str | None = None):
-        self.path    = path
+    """
+    One scene of a book, addressed by its path relative to the book folder.
+
+    A large library holds hundreds of thousands of these, so the class uses
+    __slots__ and keeps the folder as one interned string shared by every
+    scene of the book; `path` builds the full Path only when asked for.
+    """
+
+    __slots__ = (
+        "_root", "rel", "chapter", "scene", "_title", "_heading",
+        "_mtime_ns", "_size", "sentence_count", "word_count",
+    )
+
+    # Cleaned text and sentences are shared across all scenes through a
+    # byte-bounded LRU (see scene_cache.py) rather than memoized per object.
+    cache: SceneCache = SCENE_CACHE
+
+    def __init__(self, path: Path, chapter: int, scene: int, title: str | None = None, root: Path | None = None):
+        path = Path(path)
+        root = path.parent if root is None else root
+        self._setup(str(root), path.relative_to(root).as_posix(), chapter, scene, title)
+
+    def _setup(self, root: str, rel: str, chapter: int, scene: int, title: str | None) -> None:
+        self._root   = sys.intern(root)
+        self.rel     = rel   # posix path relative to the book folder; the scene's identity
         self.chapter = chapter
         self.scene   = scene
-        self._title  = title
-        self._sentences: list[str] = []
+        self._title  = None if title is None else sys.intern(title)   # titles repeat across a library
+        self._heading: str | None = None   # resolved title(), memoized
+        self._mtime_ns: int | None = None   # file stamp when last indexed (see indexed_stamp)
+        self._size: int | None = None
+        self.sentence_count: int | None = None
+        self.word_count: int | None = None
+
+    @classmethod
+    def from_index_entry(cls, scenes_dir: Path, entry: dict) -> "Scene":
+        """Rebuild a Scene from a sidecar index entry without touching the file."""
+        sc = cls.__new__(cls)
+        sc._setup(str(scenes_dir), entry["path"], entry["chapter"], entry["scene"], entry.get("name"))
+        sc._heading = sys.intern(entry["title"])
+        sc._mtime_ns, sc._size = entry["mtime_ns"], entry["size"]
+        sc.sentence_count = entry.get("sentences")
+        sc.word_count = entry.get("words")
+        return sc
+
+    @property
+    def path(self) -> Path:
+        return Path(self._root, self.rel)
+
+    @property
+    def filename(self) -> str:
+        """Full path as a string; cheaper than `path` for stat(), open() and cache keys."""
+        return os.path.join(self._root, self.rel)
+
+    def indexed_stamp(self) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) as of the last indexing, or None if never indexed."""
+        return None if self._mtime_ns is None else (self._mtime_ns, self._size)
+
+    def index_entry(self, scenes_dir: Path) -> dict:
+        """Return the sidecar index entry for this scene, reading the file only if needed."""
+        if self._mtime_ns is None or self.sentence_count is None or self.word_count is None:
+            self._mtime_ns, self._size = self.stamp()
+            self.word_count = len(self.text().split())
+            self.sentence_count = len(self.sentences())
+        return {
+            "path": self.rel,
+            "chapter": self.chapter,
+            "scene": self.scene,
+            "name": self._title,
+            "title": self.title(),
+            "size": self._size,
+            "mtime_ns": self._mtime_ns,
+            "sentences": self.sentence_count,
+            "words": self.word_count,
+        }
+
+    def forget(self) -> None:
+        """Drop everything derived from the file after it changed on disk."""
+        self.cache.invalidate(self.filename)
+        self._heading = None
+        self._mtime_ns = self._size = None
+        self.sentence_count = None
+        self.word_count = None
 
     @property
     def label(self) -> str:
@@ -77,38 +198,360 @@ class Scene:
 
     def title(self) -> str:
         """Return the file heading, filename title, or chapter/scene label."""
-        with open(self.path, encoding="utf-8") as f:
-            first = f.readline().strip()
-        if first.startswith("#"):
-            return first.lstrip("#").strip() or self._title or self.label
-        return self._title or self.label
+        if self._heading is None:
+            with open(self.filename, encoding="utf-8") as f:
+                first = f.readline().strip()
+            if first.startswith("#"):
+                self._heading = first.lstrip("#").strip() or self._title or self.label
+            else:
+                self._heading = self._title or self.label
+        return self._heading
+
+    def stamp(self) -> tuple[int, int]:
+        """Return (mtime_ns, size) of the file backing this scene."""
+        st = os.stat(self.filename)
+        return st.st_mtime_ns, st.st_size
+
+    def _load_text(self) -> str:
+        with open(self.filename, encoding="utf-8") as f:
+            return _clean_text(f.read())
+
+    def _cached(self):
+        """Return this scene's cache entry, reloading it if the file changed."""
+        key = self.filename
+        stamp = self.stamp()
+        entry = self.cache.get(key, stamp)
+        if entry is None:
+            entry = self.cache.put(key, stamp, self._load_text())
+        return key, entry
 
     def text(self) -> str:
         """Return clean plain-text content suitable for TTS."""
-        raw = self.path.read_text(encoding="utf-8")
-        return _clean_text(raw)
+        return self._cached()[1].text
 
-    def sentences(self) -> list[str]:
+    def sentences(self) -> SentenceSpans:
         """Return the scene text split into sentences, filtering non-alphanumeric noise."""
-        if not self._sentences:
-            text = self.text()
-            # Split on . ! ? followed by whitespace/newline, OR on multiple newlines
-            raw_sents = re.split(r'(?<=[.!?])\s+|\n+', text)
-            
-            cleaned = []
-            for s in raw_sents:
-                s = s.strip()
-                if not s:
-                    continue
-                # Skip strings that contain no alphanumeric characters (e.g. just "---" or "...")
-                if not any(c.isalnum() for c in s):
-                    continue
-                cleaned.append(s)
-            self._sentences = cleaned
-        return self._sentences
+        key, entry = self._cached()
+        if entry.sentences is None:
+            self.cache.set_sentences(key, entry, segment_sentences(entry.text))
+        return entry.sentences
 
     def __repr__(self):
-        return f"Scene(ch={self.chapter}, sc={self.scene}, path={self.path.name})"
+        return f"Scene(ch={self.chapter}, sc={self.scene}, path={self.rel.rsplit('/', 1)[-1]})"
+
+
+class StreamedScene(Scene):
+    """
+    A scene file the splitter also stored pre-cleaned and segmented (see
+    `tts_stream.py`). The stream is used only while the file still has the
+    stamp it was made from; after an edit the file is read as usual.
+    """
+
+    __slots__ = ("_stream",)
+
+    @classmethod
+    def from_stream(cls, scenes_dir: Path, entry: dict, stream: TTSStream) -> "StreamedScene":
+        sc = cls.from_index_entry(scenes_dir, entry)
+        sc._stream = stream
+        return sc
+
+    def _cached(self):
+        key = self.filename
+        stamp = self.stamp()
+        entry = self.cache.get(key, stamp)
+        if entry is None:
+            index = self._stream.find(self.rel, stamp)
+            if index is None:
+                entry = self.cache.put(key, stamp, self._load_text())
+            else:
+                text = self._stream.text(index)
+                entry = self.cache.put(key, stamp, text)
+                self.cache.set_sentences(key, entry, self._stream.sentences(index, text))
+        return key, entry
+
+
+class PackedScene(Scene):
+    """A scene stored in a packed book; text comes pre-cleaned from the mapping."""
+
+    __slots__ = ("_book", "_book_index")
+
+    def __init__(self, book: PackedBook, index: int, entry: dict):
+        self._setup(str(book.path), entry["path"], entry["chapter"], entry["scene"], entry.get("name"))
+        self._book = book
+        self._book_index = index
+        self._heading = sys.intern(entry["title"])
+        self.sentence_count = entry.get("sentences")
+        self.word_count = entry.get("words")
+
+    def stamp(self) -> tuple[int, int]:
+        return self._book.stamp   # the whole pack is immutable once written
+
+    def _load_text(self) -> str:
+        return self._book.text(self._book_index)
+
+
+class VirtualScene(PackedScene):
+    """A byte range of a plain-text book (see `virtual_book.py`), cleaned when loaded."""
+
+    __slots__ = ()
+
+    def _load_text(self) -> str:
+        return _clean_text(self._book.text(self._book_index))
+
+
+# ---------------------------------------------------------------------------
+# Filename parsing
+# ---------------------------------------------------------------------------
+
+_RE_FILE_CHAPTER   = re.compile(r"\bchapter\s+(\d+|[IVXLCDM]+)\b", re.IGNORECASE)
+_RE_DIR_CHAPTER    = re.compile(r"(?:\bch(?:apter)?\s*)?(\d+|[IVXLCDM]+)\b", re.IGNORECASE)
+_RE_FILE_SCENE     = re.compile(r"\bscene\s+(\d+|[IVXLCDM]+)\b", re.IGNORECASE)
+_RE_DIGITS         = re.compile(r"(\d+)")
+_RE_TITLE_CH_SC    = re.compile(r"^\s*chapter\s+\d+\s+scene\s+\d+\s*[-–—:]?\s*", re.IGNORECASE)
+_RE_TITLE_SC       = re.compile(r"^\s*scene\s+\d+\s*[-–—:]?\s*", re.IGNORECASE)
+_SCENE_SUFFIXES    = {".md", ".txt"}
+_SIDECAR_NAMES     = {"notes.txt"}
+
+
+def _book_scene_changed(old_book, old: PackedScene, book, new: PackedScene) -> bool:
+    """Compare a scene across two revisions of a single-file book."""
+    if isinstance(book, VirtualBook):
+        # A plain-text book may have been rewritten in place, so its old mapping
+        # is not safe to read; compare the checksums taken when it was indexed.
+        # (A heading is not part of the checksummed range, so compare titles too.)
+        old_entry = old_book.entries[old._book_index] if isinstance(old_book, VirtualBook) else {}
+        entry = book.entries[new._book_index]
+        return (old_entry.get("crc"), old_entry.get("title")) != (entry["crc"], entry["title"])
+    return old_book.text(old._book_index) != book.text(new._book_index)
+
+
+def _scene_sort_key(sc: Scene) -> tuple[int, int, str]:
+    return sc.chapter, sc.scene, sc.rel.lower()
+
+
+def _natural_key(name: str) -> list[tuple[int, int | str]]:
+    """Sort key that orders "ch2" before "ch10"."""
+    return [(0, int(part)) if part.isdigit() else (1, part.lower()) for part in _RE_DIGITS.split(name) if part]
+
+
+def _directory_mtimes(dirs) -> dict[Path, int]:
+    stamps = {}
+    for d in dirs:
+        try:
+            stamps[d] = os.stat(d).st_mtime_ns
+        except OSError:
+            stamps[d] = -1
+    return stamps
+
+
+def _stamp_or_none(sc: Scene) -> tuple[int, int] | None:
+    try:
+        return sc.stamp()
+    except OSError:
+        return None
+
+
+def _contains_run(words: list[str], run: list[str]) -> bool:
+    """True when run occurs in words as consecutive whole words."""
+    n = len(run)
+    return any(words[i:i + n] == run for i in range(len(words) - n + 1))
+
+
+def _search_hits(index: SearchIndex, scenes: list[Scene], rel_index: dict[str, int],
+                 query: str, limit: int | None) -> list["SearchHit"]:
+    """Look query up in index and return the matching sentences of scenes in reading order."""
+    query = query.strip()
+    phrase = None
+    if len(query) > 1 and query.startswith('"') and query.endswith('"'):
+        phrase = tokenize(query)
+
+    found = index.lookup(query)
+    order = sorted((rel_index[rel], rel) for rel in found if rel in rel_index)
+
+    hits = []
+    for i, rel in order:
+        sc = scenes[i]
+        for n in found[rel]:
+            if phrase is not None and not _contains_run(tokenize(sc.sentences()[n]), phrase):
+                continue
+            hits.append(SearchHit(sc.chapter, sc.scene, n))
+            if limit is not None and len(hits) >= limit:
+                return hits
+    return hits
+
+
+# ---------------------------------------------------------------------------
+# Navigation index
+# ---------------------------------------------------------------------------
+
+class SceneIndex:
+    """
+    Precomputed lookup tables over a sorted scene list.
+
+    Scenes are sorted by chapter, so every chapter is one contiguous run.
+    `chapter_starts` holds the flat index where each run begins, which lets
+    chapter jumps use bisect instead of scanning the scene list.
+    """
+
+    __slots__ = ("positions", "chapter_starts", "chapter_first", "chapter_count")
+
+    def __init__(self, scenes: list[Scene]):
+        self.positions: dict[tuple[int, int], int] = {}    # (chapter, scene) → first flat index
+        self.chapter_starts: list[int] = []                # flat index of each chapter's first scene
+        self.chapter_first: dict[int, int] = {}            # chapter number → flat index
+        prev_ch = None
+        for i, sc in enumerate(scenes):
+            self.positions.setdefault((sc.chapter, sc.scene), i)
+            if sc.chapter != prev_ch:
+                self.chapter_starts.append(i)
+                self.chapter_first.setdefault(sc.chapter, i)
+                prev_ch = sc.chapter
+        self.chapter_count = len(self.chapter_first)
+
+    def chapter_start(self, index: int) -> int:
+        """Return the flat index of the first scene in index's chapter."""
+        return self.chapter_starts[bisect_right(self.chapter_starts, index) - 1]
+
+    def next_chapter_start(self, index: int) -> int | None:
+        """Return the flat index of the next chapter's first scene, if any."""
+        k = bisect_right(self.chapter_starts, index)
+        return self.chapter_starts[k] if k < len(self.chapter_starts) else None
+
+
+class SearchHit(NamedTuple):
+    """One search result: a sentence position that go_to() accepts."""
+    chapter: int
+    scene: int
+    sentence_index: int
+
+
+# ---------------------------------------------------------------------------
+# Chunk walking and read-only cursors
+# ---------------------------------------------------------------------------
+
+def _take_chunk(scenes: list[Scene], index: int, sentence_index: int, max_chars: int):
+    """
+    Collect the chunk starting at (index, sentence_index), grouped like
+    ChunkPlan: at least one sentence, joined by single spaces, ≤ max_chars,
+    never crossing a scene. Returns (text or None at end of book, index,
+    sentence_index) with the position just past the chunk.
+    """
+    sentences = scenes[index].sentences()
+    last = len(scenes) - 1
+
+    # Past the end of this scene (or an empty scene): move to the next non-empty one.
+    while sentence_index >= len(sentences):
+        if index >= last:
+            return None, index, sentence_index
+        index += 1
+        sentence_index = 0
+        sentences = scenes[index].sentences()
+
+    chunk_parts = []
+    current_len = 0
+    for i in range(sentence_index, len(sentences)):
+        sent = sentences[i]
+        # If adding this sentence (and its joining space) would exceed max, and we already have content, stop
+        if chunk_parts and (current_len + 1 + len(sent) > max_chars):
+            break
+        current_len += len(sent) + (1 if chunk_parts else 0)
+        chunk_parts.append(sent)
+        sentence_index += 1
+    return " ".join(chunk_parts), index, sentence_index
+
+
+class ReadingCursor:
+    """
+    An independent, read-only position over one BookReader's scene list.
+
+    Playback, export and prefetch each take their own cursor instead of
+    moving the reader: a cursor never saves progress or touches the reader's
+    position. It keeps the scene list that was current when it was created;
+    refresh() installs a new list instead of editing the old one, so that
+    snapshot cannot change underneath a cursor running on another thread.
+    A cursor taken while the book is still being indexed in the background
+    moves to each fuller list that update_index() installs, keeping its scene.
+    """
+
+    __slots__ = ("_reader", "scenes", "_plans", "index", "sentence_index", "_growing")
+
+    def __init__(self, reader: "BookReader", scenes: list[Scene], plans: dict, index: int = 0, sentence_index: int = 0):
+        self._reader = reader
+        self._growing = reader.indexing   # follow update_index() until the book is fully indexed
+        self.scenes = scenes
+        self._plans = plans   # the reader's chunk plans for this scene list
+        self.index = index
+        self.sentence_index = sentence_index
+
+    def _follow_index(self) -> None:
+        """Switch to the reader's newer scene list while background indexing fills it in."""
+        if not self._growing:
+            return
+        reader = self._reader
+        self._growing = reader.indexing
+        scenes = reader._scenes
+        if scenes is self.scenes:
+            return
+        rel = self.scenes[self.index].rel
+        index = next((i for i, sc in enumerate(scenes) if sc.rel == rel), None)
+        if index is None:
+            return   # not installed yet; keep the snapshot
+        self.scenes, self._plans, self.index = scenes, {}, index
+
+    @property
+    def current(self) -> Scene:
+        self._follow_index()
+        return self.scenes[self.index]
+
+    @property
+    def position(self) -> tuple[int, int]:
+        self._follow_index()
+        return self.index, self.sentence_index
+
+    def copy(self) -> "ReadingCursor":
+        return ReadingCursor(self._reader, self.scenes, self._plans, self.index, self.sentence_index)
+
+    def get_next_chunk(self, max_chars: int = 500) -> str | None:
+        """Return the next chunk (as BookReader.get_next_chunk) and advance; None at end of book."""
+        self._follow_index()
+        text, self.index, self.sentence_index = _take_chunk(self.scenes, self.index, self.sentence_index, max_chars)
+        return text
+
+    def chunk_plan(self, max_chars: int = 500) -> ChunkPlan:
+        """Return the chunk plan for this cursor's scene list (shared with the reader while current)."""
+        plan = self._plans.get(max_chars)
+        if plan is None:
+            reader = self._reader
+            if reader._plans is self._plans:
+                plan = reader.chunk_plan(max_chars)
+            else:   # the reader was refreshed since: plan the snapshot without caching it on disk
+                plan = ChunkPlan.build(self.scenes, max_chars, book_signature(reader.scenes_dir, self.scenes))
+                self._plans[max_chars] = plan
+        return plan
+
+    def chunk_text(self, plan: ChunkPlan, chunk_id: int, start: int | None = None) -> str:
+        """Return a chunk's text, optionally from sentence start of its scene (e.g. a resume point inside it)."""
+        scene_index, first, end = plan.chunk(chunk_id)
+        return " ".join(self.scenes[scene_index].sentences()[first if start is None else start:end])
+
+    def current_chunk_id(self, plan: ChunkPlan) -> int | None:
+        return plan.locate(self.index, self.sentence_index)
+
+    def seek_chunk(self, plan: ChunkPlan, chunk_id: int) -> Scene:
+        self.index, self.sentence_index, _end = plan.chunk(chunk_id)
+        return self.current
+
+    def search(self, index: SearchIndex, query: str, limit: int | None = 100) -> tuple[list["SearchHit"], dict[str, int]]:
+        """
+        Bring index up to date for this cursor's scene list and search it, as
+        BookReader.search does. No reader state is touched, so this can run on
+        a worker thread; hand the returned update counts to
+        BookReader.search_index_updated() on the reader's own thread.
+        """
+        self._follow_index()
+        counts = index.update(self.scenes)
+        rel_index = {sc.rel: i for i, sc in enumerate(self.scenes)}
+        return _search_hits(index, self.scenes, rel_index, query, limit), counts
 
 
 # ---------------------------------------------------------------------------
@@ -126,73 +569,201 @@ class BookReader:
     - Lazy Sentence Chunking: Reads and parses markdown scenes on demand, grouping sentences 
       into ~500 character chunks (`get_next_chunk`) specifically optimized for TTS ingestion limits.
     - Persistent State: Automatically tracks the user's `_index` (scene) and `_sentence_index` (position within scene).
-                        These are flushed to `target` json files regularly to prevent loss of progress during a crash.
+                        Progress, bookmarks and notes live in the per-user SQLite library shared by every
+                        book (see `library.py`); passing `progress_file` keeps progress in that JSON file
+                        instead. Navigation hands progress to a write-behind journal, so it never blocks on disk.
     - Directory Scanning: Recursively seeks all `*.md` files in a structured `scenes/` layout, 
                           ordering them numerically regardless of exact directory name strings.
+    - Sidecar Index: The scan result is cached in `.book_index.json` inside the scenes folder and
+                     reused while the folder's directory mtimes are unchanged (see `book_index.py`).
+    - Progressive Loading: with `progressive=True` and no sidecar index yet, the saved (or first)
+                           scene opens at once while the tree is indexed on a background thread;
+                           `update_index()` installs each partial result.
+    - Packed Books: `scenes_dir` may instead be a single `.tbrpack` file written by `BookSplitter`;
+                    its pre-cleaned scene texts are read through mmap (see `packed_book.py`).
+    - Virtual Books: `scenes_dir` may also be the original `.txt`; it is split in memory with the
+                     splitter's heuristics and scenes are read from it through mmap (see `virtual_book.py`).
+                     `max_scene_chars` cuts long scenes into parts, as `BookSplitter` does.
+    - Search: `search()` looks words up in an incrementally updated inverted index stored next to
+              the book (see `search_index.py`) and returns positions that `go_to` accepts.
+    - Change Tracking: `refresh()` re-indexes only scene files added, removed or modified on disk
+                       while keeping the reading position; `book_watcher.py` polls `has_changes()`.
+    - Cursors: `cursor()` hands background consumers (playback, export) their own read-only
+               position over the same scene list, so they never move the reader or save progress.
     """
 
-    DEFAULT_PROGRESS_FILE = Path.home() / ".book_reader_progress.json"
+    # How often the background indexer hands a partial scene list to update_index().
+    PUBLISH_INTERVAL = 0.25
 
-    def __init__(self, scenes_dir: str | Path, progress_file: Path | None = None):
+    def __init__(self, scenes_dir: str | Path, progress_file: Path | None = None, library: Library | None = None,
+                 progressive: bool = False, max_scene_chars: int | None = None):
         self.scenes_dir    = Path(scenes_dir)
-        self.progress_file = progress_file or self.DEFAULT_PROGRESS_FILE
+        self.progress_file = progress_file   # None: progress is kept in the library
+        self._library      = library
+        self._book_key     = str(self.scenes_dir.resolve())
+        self.max_scene_chars = max_scene_chars   # cuts long scenes of a virtual (.txt) book
         self._scenes: list[Scene] = []
+        self._nav = SceneIndex([])
+        self._plans: dict[int, ChunkPlan] = {}   # max_chars → whole-book chunk plan
+        self._dir_stamps: dict[Path, int] | None = None   # directory mtimes at the last scan
+        self._packed: PackedBook | VirtualBook | None = None   # single-file book, if any
+        self._search: SearchIndex | None = None
+        self._search_fresh = False   # index matches the current scene list
+        self._rel_index: dict[str, int] | None = None   # relative path → flat index
         self._index: int = 0   # current position in the flat scene list
         self._sentence_index: int = 0  # position within the current scene
+        self._indexer: threading.Thread | None = None   # progressive mode: background scan
+        self._index_lock = threading.Lock()
+        self._pending: tuple[list[Scene], dict[Path, int] | None, bool] | None = None
 
-        self._load_scenes()
+        self._load_scenes(progressive)
         self._restore_progress()
+        if self.progress_file is None:
+            self._record_book(opened=True)
+
+    def _record_book(self, opened: bool = False) -> None:
+        self.library.record_book(
+            self._book_key,
+            opened=opened,
+            title=self.scenes_dir.stem if self.scenes_dir.is_file() else self.scenes_dir.name,
+            scene_count=len(self._scenes),
+            chapter_count=self._chapter_count(),
+        )
+
+    @property
+    def library(self) -> Library:
+        """The library holding this book's bookmarks and notes (the per-user one unless given)."""
+        if self._library is None:
+            self._library = default_library()
+        return self._library
 
     # ------------------------------------------------------------------
     # Scene discovery
     # ------------------------------------------------------------------
 
-    def _load_scenes(self) -> None:
-        """Scan scenes_dir recursively and build a sorted flat list of Scene objects."""
+    def _load_scenes(self, progressive: bool = False) -> None:
+        """
+        Scan scenes_dir recursively and build a sorted flat list of Scene objects.
+        With progressive=True and no sidecar index, only the saved (or first)
+        scene is resolved now and the rest is indexed in the background.
+        """
         if not self.scenes_dir.exists():
             raise FileNotFoundError(f"Scenes directory not found: {self.scenes_dir}")
 
-        scenes: list[Scene] = []
-        for sc_file in self._scene_files():
-            ch_num = self._chapter_num(sc_file)
-            if ch_num is None:
-                continue
-            sc_num = self._scene_num(sc_file)
-            title = self._title_from_filename(sc_file)
-            scenes.append(Scene(sc_file, ch_num, sc_num, title=title))
+        if is_packed_book(self.scenes_dir) or is_text_book(self.scenes_dir):
+            self._load_packed()
+            return
+
+        entries = load_manifest(self.scenes_dir)
+        if entries is not None:
+            self._set_scenes(self._scenes_from_index(entries))
+            print(f"Loaded {len(self._scenes)} scenes across {self._chapter_count()} chapters (index).")
+            return
+
+        if progressive and self._start_progressive():
+            return
 
+        files, dirs = self._walk_scene_tree()
+        scenes = [sc for sc in map(self._scene_for_file, files) if sc is not None]
         if not scenes:
             raise ValueError(
                 f"No scene files found in {self.scenes_dir}. "
                 "Expected .md or .txt files inside chapter folders."
             )
 
-        self._scenes = sorted(scenes, key=lambda s: (s.chapter, s.scene, str(s.path).lower()))
+        self._set_scenes(sorted(scenes, key=_scene_sort_key))
+        self._write_index(dirs)
         print(f"Loaded {len(scenes)} scenes across {self._chapter_count()} chapters.")
 
+    def _scenes_from_index(self, entries: list[dict]) -> list[Scene]:
+        """Rebuild scenes from the sidecar index, reading text from the splitter's stream if there is one."""
+        stream = TTSStream.open(self.scenes_dir)
+        if stream is None:
+            return [Scene.from_index_entry(self.scenes_dir, e) for e in entries]
+        return [StreamedScene.from_stream(self.scenes_dir, e, stream) for e in entries]
+
+    def _scene_for_file(self, sc_file: Path) -> Scene | None:
+        """Build a Scene from a file path, or None if no chapter number can be found."""
+        ch_num = self._chapter_num(sc_file)
+        if ch_num is None:
+            return None
+        return Scene(sc_file, ch_num, self._scene_num(sc_file), title=self._title_from_filename(sc_file),
+                     root=self.scenes_dir)
+
+    def _load_packed(self) -> None:
+        """Open a packed or plain-text single-file book; its scenes come in reading order."""
+        book, scenes = self._open_book_file()
+        if not scenes:
+            raise ValueError(f"No scenes found in book file {self.scenes_dir}.")
+        self._packed = book
+        self._set_scenes(scenes)
+        kind = "virtual" if isinstance(book, VirtualBook) else "packed"
+        print(f"Loaded {len(self._scenes)} scenes across {self._chapter_count()} chapters ({kind}).")
+
+    def _open_book_file(self) -> tuple[PackedBook | VirtualBook, list[Scene]]:
+        """Map scenes_dir as a packed book, or split a plain-text one in memory."""
+        if is_text_book(self.scenes_dir):
+            book = VirtualBook(self.scenes_dir, self.max_scene_chars)
+            return book, [VirtualScene(book, i, e) for i, e in enumerate(book.entries)]
+        book = PackedBook(self.scenes_dir)
+        return book, [PackedScene(book, i, e) for i, e in enumerate(book.entries)]
+
+    def _set_scenes(self, scenes: list[Scene]) -> None:
+        """Install a sorted scene list and rebuild the navigation index for it."""
+        self._scenes = scenes
+        self._nav = SceneIndex(scenes)
+        self._plans = {}
+        self._search_fresh = False
+        self._rel_index = None
+
+    def _write_index(self, dirs: list[Path]) -> None:
+        """Cache the scan result so the next open skips scanning and reading files."""
+        try:
+            entries = [sc.index_entry(self.scenes_dir) for sc in self._scenes]
+        except (OSError, UnicodeDecodeError):
+            return
+        write_manifest(self.scenes_dir, entries, dirs)
+        # Stamp directories after writing, since the sidecar itself touches the root.
+        self._dir_stamps = _directory_mtimes(dirs)
+
+    def _iter_scene_dirs(self):
+        """Yield (folder, scene files) beneath scenes_dir, visiting folders in natural name order."""
+        for dirpath, dirnames, filenames in os.walk(self.scenes_dir):
+            dirnames.sort(key=_natural_key)   # os.walk descends in this order
+            folder = Path(dirpath)
+            files = []
+            for name in sorted(filenames, key=_natural_key):
+                if name.startswith("."):
+                    continue
+                if os.path.splitext(name)[1].lower() not in _SCENE_SUFFIXES:
+                    continue
+                if name.lower() in _SIDECAR_NAMES:
+                    continue
+                path = folder / name
+                if path.is_file():
+                    files.append(path)
+            yield folder, files
+
+    def _walk_scene_tree(self) -> tuple[list[Path], list[Path]]:
+        """Return (scene files, directories visited) beneath scenes_dir."""
+        files, dirs = [], []
+        for folder, found in self._iter_scene_dirs():
+            dirs.append(folder)
+            files.extend(found)
+        return files, dirs
+
     def _scene_files(self) -> list[Path]:
         """Return supported scene files beneath scenes_dir, excluding sidecar files."""
-        files = []
-        for path in self.scenes_dir.rglob("*"):
-            if not path.is_file():
-                continue
-            if path.name.startswith("."):
-                continue
-            if path.suffix.lower() not in {".md", ".txt"}:
-                continue
-            if path.name.lower() in {"notes.txt"}:
-                continue
-            files.append(path)
-        return files
+        return self._walk_scene_tree()[0]
 
     def _chapter_num(self, path: Path) -> int | None:
         """Find the chapter number from the filename first, then parent folders."""
-        m = re.search(r"\bchapter\s+(\d+|[IVXLCDM]+)\b", path.stem, re.IGNORECASE)
+        m = _RE_FILE_CHAPTER.search(path.stem)
         if m:
             return self._parse_num(m.group(1))
 
         for part in reversed(path.relative_to(self.scenes_dir).parts[:-1]):
-            m = re.search(r"(?:\bch(?:apter)?\s*)?(\d+|[IVXLCDM]+)\b", part, re.IGNORECASE)
+            m = _RE_DIR_CHAPTER.search(part)
             if m:
                 return self._parse_num(m.group(1))
         return None
@@ -200,11 +771,11 @@ class BookReader:
     def _scene_num(self, path: Path) -> int:
         """Find the scene number from common scene filename patterns."""
         stem = path.stem
-        m = re.search(r"\bscene\s+(\d+|[IVXLCDM]+)\b", stem, re.IGNORECASE)
+        m = _RE_FILE_SCENE.search(stem)
         if m:
             return self._parse_num(m.group(1))
 
-        nums = re.findall(r"(\d+)", stem)
+        nums = _RE_DIGITS.findall(stem)
         if len(nums) >= 2:
             return int(nums[1])
         if len(nums) == 1:
@@ -214,8 +785,8 @@ class BookReader:
     def _title_from_filename(self, path: Path) -> str | None:
         """Convert a scene filename into a readable title fallback."""
         stem = path.stem
-        stem = re.sub(r"^\s*chapter\s+\d+\s+scene\s+\d+\s*[-–—:]?\s*", "", stem, flags=re.IGNORECASE)
-        stem = re.sub(r"^\s*scene\s+\d+\s*[-–—:]?\s*", "", stem, flags=re.IGNORECASE)
+        stem = _RE_TITLE_CH_SC.sub("", stem)
+        stem = _RE_TITLE_SC.sub("", stem)
         return stem.strip(" -–—_:") or None
 
     def _parse_num(self, value: str) -> int:
@@ -234,45 +805,357 @@ class BookReader:
         return total or 1
 
     def _chapter_count(self) -> int:
-        return len({s.chapter for s in self._scenes})
+        return self._nav.chapter_count
+
+    # ------------------------------------------------------------------
+    # Progressive (background) indexing
+    # ------------------------------------------------------------------
+
+    def _start_progressive(self) -> bool:
+        """Install just the saved or first scene and index the rest on a background thread."""
+        first = None
+        data = self._saved_progress()
+        if data is not None and data.get("book") == self._book_key and isinstance(data.get("path"), str):
+            saved = self.scenes_dir / data["path"]
+            if saved.is_file():
+                first = self._scene_for_file(saved)
+        if first is None:
+            # Folders are walked in natural order, so the first one holding a
+            # scene usually holds the book's first scene.
+            for _folder, files in self._iter_scene_dirs():
+                found = [sc for sc in map(self._scene_for_file, files) if sc is not None]
+                if found:
+                    first = min(found, key=_scene_sort_key)
+                    break
+        if first is None:
+            return False   # let the full scan report the empty folder
+
+        self._set_scenes([first])
+        self._indexer = threading.Thread(target=self._index_in_background, name="book-indexer", daemon=True)
+        self._indexer.start()
+        print(f"Opened {first.label}; indexing the rest of the book in the background.")
+        return True
+
+    def _index_in_background(self) -> None:
+        """Walk the whole tree, publishing sorted partial scene lists as it goes."""
+        found: list[Scene] = []
+        dirs: list[Path] = []
+        stamps = None
+        published = time.monotonic()
+        try:
+            for folder, files in self._iter_scene_dirs():
+                dirs.append(folder)
+                found.extend(sc for sc in map(self._scene_for_file, files) if sc is not None)
+                if found and time.monotonic() - published >= self.PUBLISH_INTERVAL:
+                    self._publish(sorted(found, key=_scene_sort_key), None, False)
+                    published = time.monotonic()
+            found.sort(key=_scene_sort_key)
+            try:
+                write_manifest(self.scenes_dir, [sc.index_entry(self.scenes_dir) for sc in found], dirs)
+                stamps = _directory_mtimes(dirs)
+            except (OSError, UnicodeDecodeError):
+                pass   # no sidecar: the next open scans again
+        except Exception as e:
+            print(f"Background indexing of {self.scenes_dir} stopped: {e}")
+        self._publish(found, stamps, True)
+
+    def _publish(self, scenes: list[Scene], stamps: dict[Path, int] | None, done: bool) -> None:
+        with self._index_lock:
+            self._pending = (scenes, stamps, done)
+
+    @property
+    def indexing(self) -> bool:
+        """True until the background index has been completed and installed by update_index()."""
+        return self._indexer is not None
+
+    def update_index(self) -> bool:
+        """
+        Install the newest scene list from the background indexer, keeping the
+        reading position. Call it from the thread that navigates (e.g. a Tk
+        timer); returns True if the scene list changed.
+        """
+        with self._index_lock:
+            pending, self._pending = self._pending, None
+        if pending is None:
+            return False
+        scenes, stamps, done = pending
+        current = self.current
+        if not any(sc.rel == current.rel for sc in scenes):
+            # Not reached by the walk yet (or unreadable): keep it in the list.
+            scenes = sorted([*scenes, current], key=_scene_sort_key)
+        self._apply_scene_changes(scenes, set())
+        if done:
+            self._indexer = None
+            self._dir_stamps = stamps
+            print(f"Indexed {len(self._scenes)} scenes across {self._chapter_count()} chapters.")
+            if self.progress_file is None:
+                self._record_book()
+        return True
+
+    def wait_for_index(self, timeout: float | None = None) -> bool:
+        """Block until background indexing finishes and install the result; False on timeout."""
+        indexer = self._indexer
+        if indexer is not None:
+            indexer.join(timeout)
+            if indexer.is_alive():
+                return False
+        self.update_index()
+        return True
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def _scan_changes(self) -> tuple[list[Path] | None, list[Path] | None, list[Scene]]:
+        """
+        Return (files, dirs, modified scenes). files and dirs are None when no
+        directory mtime changed, i.e. no scene can have been added or removed.
+        """
+        files = dirs = None
+        if self._dir_stamps is None or _directory_mtimes(self._dir_stamps) != self._dir_stamps:
+            files, dirs = self._walk_scene_tree()
+        modified = [
+            sc for sc in self._scenes
+            if (known := sc.indexed_stamp()) is not None and _stamp_or_none(sc) not in (known, None)
+        ]
+        return files, dirs, modified
+
+    def has_changes(self) -> bool:
+        """
+        Cheap check (directory stats plus one stat per scene) for whether
+        refresh() would find anything. Safe to call from a watcher thread.
+        """
+        if self.indexing:
+            return False   # the background indexer is still discovering the tree
+        if self._packed is not None:
+            try:
+                st = os.stat(self.scenes_dir)
+            except OSError:
+                return False
+            return (st.st_mtime_ns, st.st_size) != self._packed.stamp
+
+        files, dirs, modified = self._scan_changes()
+        if modified:
+            return True
+        if files is None:
+            return False
+        known = {sc.rel for sc in self._scenes}
+        present = set()
+        for f in files:
+            rel = f.relative_to(self.scenes_dir).as_posix()
+            if rel in known or self._chapter_num(f) is not None:
+                present.add(rel)
+        if present != known:
+            return True
+        self._dir_stamps = _directory_mtimes(dirs)   # e.g. only notes.txt was saved
+        return False
+
+    def refresh(self) -> dict[str, list[str]]:
+        """
+        Re-index only the scene files added, removed or modified since the last
+        scan. Cached text/sentences are dropped for those scenes alone, chunk
+        plans reuse the rows of unchanged scenes, and the reading position stays
+        on the same scene (or the next surviving one if it was removed).
+        Returns the relative paths under "added", "removed" and "modified".
+        """
+        if self._packed is not None:
+            return self._refresh_packed()
+        if self.indexing:
+            return self._change_report([], [], [])
+
+        files, dirs, modified = self._scan_changes()
+        added: list[Scene] = []
+        removed: list[Scene] = []
+        if files is not None:
+            present = {f.relative_to(self.scenes_dir).as_posix(): f for f in files}
+            known = {sc.rel for sc in self._scenes}
+            removed = [sc for sc in self._scenes if sc.rel not in present]
+            added = [
+                sc for sc in map(self._scene_for_file, (f for rel, f in present.items() if rel not in known))
+                if sc is not None
+            ]
+        else:
+            dirs = list(self._dir_stamps)
+
+        report = self._change_report(added, removed, modified)
+        if not (added or removed or modified):
+            self._dir_stamps = _directory_mtimes(dirs)
+            return report
+
+        gone = {sc.rel for sc in removed}
+        scenes = [sc for sc in self._scenes if sc.rel not in gone] + added
+        if not scenes:
+            raise ValueError(f"No scene files left in {self.scenes_dir}.")
+        for sc in removed:
+            sc.cache.invalidate(sc.filename)
+        for sc in modified:
+            sc.forget()
+
+        self._apply_scene_changes(sorted(scenes, key=_scene_sort_key), {sc.rel for sc in modified})
+        self._write_index(dirs)
+        return report
+
+    def _refresh_packed(self) -> dict[str, list[str]]:
+        """Reopen a packed or plain-text book that was rewritten, diffing scenes by path and text."""
+        if not self.has_changes():
+            return self._change_report([], [], [])
+        old_book, old_scenes = self._packed, self._scenes
+        book, scenes = self._open_book_file()
+        if not scenes:
+            raise ValueError(f"No scenes found in book file {self.scenes_dir}.")
+        old_by_rel = {sc.rel: sc for sc in old_scenes}
+        new_rels = {sc.rel for sc in scenes}
+
+        added = [sc for sc in scenes if sc.rel not in old_by_rel]
+        removed = [sc for sc in old_scenes if sc.rel not in new_rels]
+        modified = [
+            sc for sc in scenes
+            if sc.rel in old_by_rel and _book_scene_changed(old_book, old_by_rel[sc.rel], book, sc)
+        ]
+        self._packed = book
+        self._apply_scene_changes(scenes, {sc.rel for sc in modified})
+        return self._change_report(added, removed, modified)
+
+    def _change_report(self, added, removed, modified) -> dict[str, list[str]]:
+        return {
+            kind: [sc.rel for sc in group]
+            for kind, group in (("added", added), ("removed", removed), ("modified", modified))
+        }
+
+    def _apply_scene_changes(self, scenes: list[Scene], changed: set[str]) -> None:
+        """Install a re-indexed scene list, keeping the position and unchanged plan rows."""
+        old_scenes, old_plans = self._scenes, self._plans
+        current, sentence = self.current, self._sentence_index
+        self._set_scenes(scenes)
+
+        index = {sc.rel: i for i, sc in enumerate(scenes)}.get(current.rel)
+        if index is None:
+            # The current scene was removed: continue with the scene that follows it.
+            keys = [_scene_sort_key(sc) for sc in scenes]
+            index = min(bisect_left(keys, _scene_sort_key(current)), len(scenes) - 1)
+            sentence = 0
+        elif current.rel in changed:
+            sentence = min(sentence, len(scenes[index].sentences()))
+
+        if old_plans:
+            signature = book_signature(self.scenes_dir, scenes)
+            for max_chars, plan in old_plans.items():
+                known = {
+                    sc.rel: plan.scene_ranges(i)
+                    for i, sc in enumerate(old_scenes) if sc.rel not in changed
+                }
+                self._plans[max_chars] = ChunkPlan.build(scenes, max_chars, signature, known=known)
+                save_plan(self.scenes_dir, self._plans[max_chars])
+
+        if (index, sentence) != (self._index, self._sentence_index):
+            self._index, self._sentence_index = index, sentence
+            self.save_progress()
 
     # ------------------------------------------------------------------
     # Progress persistence
     # ------------------------------------------------------------------
 
-    def _restore_progress(self, file_path: Path | None = None) -> bool:
-        """Load saved position from JSON if it exists."""
+    def _saved_progress(self, file_path: Path | None = None) -> dict | None:
+        """Return the saved position from the library, or from a JSON progress/bookmark file."""
         target = file_path or self.progress_file
-        if not target.exists():
+        if target is None:
+            return self.library.progress(self._book_key)
+        PROGRESS_JOURNAL.flush(target)   # make sure our own pending write is visible
+        return read_json_locked(target)
+
+    def _restore_progress(self, file_path: Path | None = None) -> bool:
+        return self._apply_position(self._saved_progress(file_path))
+
+    def _apply_position(self, data: dict | None) -> bool:
+        if data is None:
             return False
         try:
-            data = json.loads(target.read_text())
-            book_key = str(self.scenes_dir.resolve())
-            if data.get("book") == book_key and "index" in data:
-                self._index = max(0, min(int(data["index"]), len(self._scenes) - 1))
+            if data.get("book") == self._book_key and "index" in data:
+                # The scene's path survives scenes being added before it; the index is a fallback.
+                index = self._rel_positions().get(data.get("path"))
+                if index is None:
+                    index = max(0, min(int(data["index"]), len(self._scenes) - 1))
+                self._index = index
                 self._sentence_index = max(0, int(data.get("sentence_index", 0)))
                 print(f"Resuming from: {self.current.label} — {self.current.title()} (Sentence {self._sentence_index})")
                 return True
         except Exception:
-            pass  # corrupt progress file — start from beginning
+            pass  # corrupt progress record — start from beginning
         return False
 
+    def _progress_payload(self):
+        """Capture the position now; the title is resolved later on the writer thread."""
+        book, index, sentence_index, scene = self._book_key, self._index, self._sentence_index, self.current
+
+        def build() -> dict:
+            return {
+                "book":  book,
+                "index": index,
+                "sentence_index": sentence_index,
+                "label": scene.label,
+                "scene_title": scene.title(),
+                "path": scene.rel,
+            }
+        return build
+
     def save_progress(self, file_path: Path | None = None) -> None:
-        """Persist current position to JSON."""
-        target = file_path or self.progress_file
-        data = {
-            "book":  str(self.scenes_dir.resolve()),
-            "index": self._index,
-            "sentence_index": self._sentence_index,
-            "label": self.current.label,
-            "scene_title": self.current.title(),
-        }
-        target.write_text(json.dumps(data, indent=2))
+        """
+        Persist the current position. The default store (library or progress
+        file) is written behind (coalesced, off-thread); an explicit file_path
+        such as an exported bookmark is written synchronously as JSON.
+        """
+        payload = self._progress_payload()
+        if file_path is not None:
+            write_json_atomic(file_path, payload())
+        elif self.progress_file is None:
+            self.library.submit_progress(self._book_key, payload)
+        else:
+            PROGRESS_JOURNAL.submit(self.progress_file, payload)
+
+    def flush_progress(self) -> None:
+        """Block until the default store reflects the latest save_progress()."""
+        if self.progress_file is None:
+            self.library.flush(self._book_key)
+        else:
+            PROGRESS_JOURNAL.flush(self.progress_file)
+
+    # ------------------------------------------------------------------
+    # Bookmarks and notes
+    # ------------------------------------------------------------------
+
+    def save_bookmark(self, name: str) -> None:
+        """Store the current position in the library under name."""
+        self.library.save_bookmark(name, self._progress_payload()())
+
+    def restore_bookmark(self, name: str) -> bool:
+        """Jump to a named bookmark; False if it does not exist."""
+        if not self._apply_position(self.library.bookmark(self._book_key, name)):
+            return False
+        self.save_progress()
+        return True
+
+    def bookmarks(self) -> list[dict]:
+        return self.library.bookmarks(self._book_key)
+
+    def add_note(self, text: str) -> int:
+        """Attach a note to the current position; returns its id."""
+        return self.library.add_note(self._book_key, text, self.current.label, self._sentence_index)
+
+    def notes(self, limit: int | None = None) -> list[dict]:
+        """Return this book's notes, oldest first (only the latest `limit` if given)."""
+        return self.library.notes(self._book_key, limit)
 
     # ------------------------------------------------------------------
     # Navigation
     # ------------------------------------------------------------------
 
+    @property
+    def notes_file(self) -> Path:
+        """Return where notes for this book are kept (beside a packed book file)."""
+        if self.scenes_dir.is_file():
+            return self.scenes_dir.with_name(self.scenes_dir.stem + ".notes.txt")
+        return self.scenes_dir / "notes.txt"
+
     @property
     def current(self) -> Scene:
         return self._scenes[self._index]
@@ -311,47 +1194,21 @@ class BookReader:
 
     def get_next_chunk(self, max_chars: int = 500) -> str | None:
         """
-        Returns a string containing one or more sentences, grouped to be ~max_chars.
-        Always stops at a sentence boundary. Returns None at end of book.
-        Updates internal indices.
+        Returns a string containing one or more sentences, grouped to be at most
+        max_chars (including the joining spaces). Always stops at a sentence
+        boundary; a single sentence is never longer than sentences.MAX_SENTENCE_CHARS.
+        Returns None at end of book. Updates internal indices (and saves progress
+        on reaching a new scene); use cursor() to walk chunks without either.
         """
-        sentences = self.current.sentences()
-        
-        # If the index is already at the end of the current scene, advance to next scene
-        if self._sentence_index >= len(sentences):
-            if self.has_next_scene():
-                self.next_scene()
-                sentences = self.current.sentences()
-            else:
-                return None
-
-        while not sentences and self.has_next_scene():
-            self.next_scene()
-            sentences = self.current.sentences()
+        text, index, self._sentence_index = _take_chunk(self._scenes, self._index, self._sentence_index, max_chars)
+        if index != self._index:
+            self._index = index
+            self.save_progress()
+        return text
 
-        if not sentences:
-            return None
-
-        chunk_parts = []
-        current_len = 0
-        
-        # Collect sentences until we hit max_chars or end of scene
-        start_idx = self._sentence_index
-        for i in range(start_idx, len(sentences)):
-            sent = sentences[i]
-            # If adding this sentence would exceed max, and we already have content, stop
-            if chunk_parts and (current_len + len(sent) > max_chars):
-                break
-            
-            chunk_parts.append(sent)
-            current_len += len(sent)
-            self._sentence_index += 1
-            
-            # If we just reached the end of the scene, stop and let the next call handle scene transition
-            if self._sentence_index >= len(sentences):
-                break
-        
-        return " ".join(chunk_parts)
+    def cursor(self) -> ReadingCursor:
+        """Return a read-only cursor starting at the current position."""
+        return ReadingCursor(self, self._scenes, self._plans, self._index, self._sentence_index)
 
     def has_next_scene(self) -> bool:
         return self._index < len(self._scenes) - 1
@@ -374,26 +1231,18 @@ class BookReader:
 
     def next_chapter(self) -> Scene | None:
         """Jump to the first scene of the next chapter."""
-        current_ch = self.current.chapter
-        for i, s in enumerate(self._scenes):
-            if s.chapter > current_ch:
-                self._index = i
-                self._sentence_index = 0
-                self.save_progress()
-                return self.current
-        return None
+        target = self._nav.next_chapter_start(self._index)
+        if target is None:
+            return None
+        self._index = target
+        self._sentence_index = 0
+        self.save_progress()
+        return self.current
 
     def prev_chapter(self) -> Scene | None:
         """Jump to the first scene of the previous chapter (or the start of current if already at start)."""
-        current_ch = self.current.chapter
-        
         # If we are not at the first scene of the current chapter, go to it first
-        first_scene_of_current = -1
-        for i, s in enumerate(self._scenes):
-            if s.chapter == current_ch:
-                first_scene_of_current = i
-                break
-        
+        first_scene_of_current = self._nav.chapter_start(self._index)
         if self._index > first_scene_of_current:
             self._index = first_scene_of_current
             self._sentence_index = 0
@@ -401,33 +1250,113 @@ class BookReader:
             return self.current
 
         # Otherwise go to the first scene of the previous chapter
-        target_ch = current_ch - 1
+        target_ch = self.current.chapter - 1
         if target_ch < 1:
             return None
-            
-        first_scene_of_prev = -1
-        for i, s in enumerate(self._scenes):
-            if s.chapter == target_ch:
-                first_scene_of_prev = i
-                break
-        
-        if first_scene_of_prev != -1:
-            self._index = first_scene_of_prev
-            self._sentence_index = 0
-            self.save_progress()
-            return self.current
-            
-        return None
+
+        first_scene_of_prev = self._nav.chapter_first.get(target_ch)
+        if first_scene_of_prev is None:
+            return None
+        self._index = first_scene_of_prev
+        self._sentence_index = 0
+        self.save_progress()
+        return self.current
 
     def go_to(self, chapter: int, scene: int, sentence: int = 0) -> Scene | None:
         """Jump to a specific chapter/scene/sentence. Returns the Scene or None if not found."""
-        for i, s in enumerate(self._scenes):
-            if s.chapter == chapter and s.scene == scene:
-                self._index = i
-                self._sentence_index = sentence
-                self.save_progress()
-                return self.current
-        return None
+        i = self._nav.positions.get((chapter, scene))
+        if i is None:
+            return None
+        self._index = i
+        self._sentence_index = sentence
+        self.save_progress()
+        return self.current
+
+    def go_to_scene(self, scene: Scene, sentence: int = 0) -> Scene | None:
+        """Jump to a Scene object (e.g. one reported by a cursor), matched by its relative path."""
+        i = self._rel_positions().get(scene.rel)
+        if i is None:
+            return None
+        self._index = i
+        self._sentence_index = sentence
+        self.save_progress()
+        return self.current
+
+    def _rel_positions(self) -> dict[str, int]:
+        if self._rel_index is None:
+            self._rel_index = {sc.rel: i for i, sc in enumerate(self._scenes)}
+        return self._rel_index
+
+    # ------------------------------------------------------------------
+    # Chunk plan (random access by chunk id)
+    # ------------------------------------------------------------------
+
+    def chunk_plan(self, max_chars: int = 500) -> ChunkPlan:
+        """
+        Return the whole-book chunk plan for max_chars, loading it from the
+        `.chunk_plan.json` sidecar when the book is unchanged and building
+        (and caching) it otherwise.
+        """
+        plan = self._plans.get(max_chars)
+        if plan is None:
+            signature = book_signature(self.scenes_dir, self._scenes)
+            plan = load_plan(self.scenes_dir, max_chars, signature)
+            if plan is None:
+                plan = ChunkPlan.build(self._scenes, max_chars, signature)
+                save_plan(self.scenes_dir, plan)
+            self._plans[max_chars] = plan
+        return plan
+
+    def chunk_text(self, plan: ChunkPlan, chunk_id: int) -> str:
+        """Return the text of one planned chunk without moving the reading position."""
+        scene_index, start, end = plan.chunk(chunk_id)
+        return " ".join(self._scenes[scene_index].sentences()[start:end])
+
+    def current_chunk_id(self, plan: ChunkPlan) -> int | None:
+        """Return the planned chunk containing the reading position (None at end of book)."""
+        return plan.locate(self._index, self._sentence_index)
+
+    def seek_chunk(self, plan: ChunkPlan, chunk_id: int) -> Scene:
+        """Move the reading position to the start of a planned chunk."""
+        scene_index, start, _end = plan.chunk(chunk_id)
+        self._index = scene_index
+        self._sentence_index = start
+        self.save_progress()
+        return self.current
+
+    # ------------------------------------------------------------------
+    # Full-text search
+    # ------------------------------------------------------------------
+
+    def open_search_index(self) -> SearchIndex:
+        """Return the book's on-disk inverted index without bringing it up to date."""
+        if self._search is None:
+            self._search = SearchIndex(self.scenes_dir)
+        return self._search
+
+    def search_index(self) -> SearchIndex:
+        """
+        Return the book's on-disk inverted index, first re-indexing any scene
+        added, removed or changed since it was last brought up to date.
+        """
+        index = self.open_search_index()
+        if not self._search_fresh:
+            self.search_index_updated(self._scenes, index.update(self._scenes))
+        return index
+
+    def search_index_updated(self, scenes: list[Scene], counts: dict[str, int]) -> None:
+        """Record an index update made for scenes (e.g. by ReadingCursor.search on a worker thread)."""
+        if scenes is self._scenes:
+            self._search_fresh = True
+        if self.progress_file is None and any(counts.values()):
+            self.library.record_book(self._book_key, search_indexed_at=time.time())
+
+    def search(self, query: str, limit: int | None = 100) -> list[SearchHit]:
+        """
+        Return sentences containing every word of query, in reading order.
+        A query wrapped in double quotes must also appear as a phrase.
+        """
+        return _search_hits(self.search_index(), self._scenes, self._rel_positions(), query, limit)
 
     def position_info(self) -> str:
         total_sc = len(self._scenes)
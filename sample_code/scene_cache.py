@@ -0,0 +1,130 @@
+"""
+scene_cache.py — Shared, byte-bounded LRU cache for cleaned scene text and sentences.
+
+Every Scene looks up its cleaned text and sentence list here instead of keeping
+a private memo, so a long listening session holds at most `max_bytes` of book
+text in memory no matter how many scenes have been visited. Entries carry a
+stamp (file mtime and size); a lookup with a different stamp is a miss and
+drops the stale entry, so edited files are re-read automatically.
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class CachedScene:
+    """Cleaned text for one scene plus its sentence list once segmented."""
+
+    __slots__ = ("stamp", "text", "sentences", "nbytes")
+
+    def __init__(self, stamp: Any, text: str):
+        self.stamp = stamp
+        self.text = text
+        self.sentences = None   # SentenceSpans once segmented
+        self.nbytes = sys.getsizeof(text)
+
+
+def _sentences_nbytes(sentences) -> int:
+    # Span tables report their own size; plain lists are charged per string.
+    nbytes = getattr(sentences, "nbytes", None)
+    if nbytes is not None:
+        return nbytes
+    return sys.getsizeof(sentences) + sum(sys.getsizeof(s) for s in sentences)
+
+
+class SceneCache:
+    """Thread-safe LRU keyed by scene, evicting least-recently-used entries past max_bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, CachedScene] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable, stamp: Any) -> CachedScene | None:
+        """Return the entry for key if its stamp still matches, counting a hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp != stamp:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Hashable, stamp: Any, text: str) -> CachedScene:
+        """Store cleaned text for key, replacing any older entry."""
+        entry = CachedScene(stamp, text)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self._bytes += entry.nbytes
+            self._evict()
+        return entry
+
+    def set_sentences(self, key: Hashable, entry: CachedScene, sentences) -> None:
+        """Attach a sentence list to an entry and charge its size to the budget."""
+        with self._lock:
+            if entry.sentences is not None:
+                return
+            entry.sentences = sentences
+            extra = _sentences_nbytes(sentences)
+            entry.nbytes += extra
+            if self._entries.get(key) is entry:
+                self._bytes += extra
+                self._evict()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget one scene, e.g. after its file changed on disk."""
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return counters for status display and benchmarks."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.nbytes
+
+    def _evict(self) -> None:
+        # Always keep the newest entry, even if it alone exceeds the budget.
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._drop(key)
+            self.evictions += 1
+
+
+SCENE_CACHE = SceneCache()
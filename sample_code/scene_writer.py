@@ -0,0 +1,264 @@
+"""
+scene_writer.py — Idempotent scene-file output for the splitter.
+
+Re-splitting a book used to rewrite every scene file, moving every mtime and
+with it everything keyed on them: the reader's sidecar index, chunk plans,
+the search index and audio exported per scene. A SceneWriter compares each
+scene's SHA-1 with the file already on disk and writes only scenes whose
+content changed; scene files left over from an earlier split that this split
+no longer produces are removed. Digests are cached in `.split_hashes.json`
+with each file's (mtime_ns, size), so an untouched file is recognised from a
+stat instead of a read.
+
+Changed scenes are written to temporary files beside their targets and only
+moved into place by `finish()`, so a pass that `begin()` abandons (a book
+split again in the other format) leaves the folder as it was.
+
+`finish()` returns a change report shaped like `BookReader.refresh()`'s:
+relative scene paths under "added", "removed", "modified" and "unchanged".
+
+While it has each scene's text in hand the writer also cleans and segments
+it, and at the end writes the reader's sidecar index (`.book_index.json`)
+and the pre-cleaned sentence stream (`.tts_stream.bin`, see `tts_stream.py`),
+so the first open of a freshly split book neither scans nor cleans anything.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable
+
+try:
+    from .book_index import load_manifest, write_manifest
+    from .reader import _clean_text
+    from .sentences import segment_sentences
+    from .tts_stream import StreamWriter
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from book_index import load_manifest, write_manifest
+    from reader import _clean_text
+    from sentences import segment_sentences
+    from tts_stream import StreamWriter
+
+HASHES_NAME = ".split_hashes.json"
+HASHES_VERSION = 1
+
+_RE_CHAPTER_DIR = re.compile(r"ch\d+")
+_RE_SCENE_FILE = re.compile(r"scene\d+\.md")
+_READER_SUFFIXES = (".md", ".txt")   # files BookReader's folder scan picks up
+
+
+def scene_rel(ch_num: int, sc_num: int) -> str:
+    """Relative path of a split scene file (the layout `BookReader` reads)."""
+    return f"ch{ch_num:02d}/scene{sc_num}.md"
+
+
+def existing_scene_files(out_dir: str | Path) -> set[str]:
+    """Return the relative paths of split-style `chNN/sceneN.md` files already in out_dir."""
+    found = set()
+    try:
+        chapters = [e for e in os.scandir(out_dir) if e.is_dir() and _RE_CHAPTER_DIR.fullmatch(e.name)]
+    except OSError:
+        return found
+    for ch in chapters:
+        for e in os.scandir(ch.path):
+            if _RE_SCENE_FILE.fullmatch(e.name) and e.is_file():
+                found.add(f"{ch.name}/{e.name}")
+    return found
+
+
+def _scene_pieces(title: str, lines: Iterable[str]):
+    """Yield a scene file's text in pieces; same as `# title`, blank line, clean_block(lines)."""
+    yield f"# {title}\n\n"
+    wrote, blank_run = False, 0
+    for line in lines:
+        if not line.strip():
+            blank_run += wrote   # leading blank lines are dropped, trailing ones held back
+            continue
+        yield "\n" * blank_run + line + "\n"
+        wrote, blank_run = True, 0
+    if not wrote:
+        yield "\n"
+
+
+class SceneWriter:
+    """Writes one split's scene files into a folder, touching only scenes that changed."""
+
+    def __init__(self, out_dir: str | Path):
+        self.out_dir = Path(out_dir)
+        self._stored = _load_hashes(self.out_dir)   # rel → [mtime_ns, size, sha1] from the last split
+        self._before = existing_scene_files(self.out_dir)
+        self._hashes: dict[str, list] = {}   # rel → [mtime_ns, size, sha1] for this split
+        self._touched: set[str] = set()      # rels written (or seen) in any pass
+        self._changed: set[str] = set()      # rels whose content is replaced by this split
+        self._staged: dict[str, Path] = {}   # rel → temporary file moved over it by finish()
+        self._entries: list[dict] = []        # reader index entries for this split
+        self._stream = StreamWriter(self.out_dir)
+
+    def begin(self) -> None:
+        """Start the split over, e.g. when the book is split again in another format."""
+        for tmp in self._staged.values():
+            tmp.unlink(missing_ok=True)
+        self._staged = {}
+        self._changed = set()
+        self._hashes = {}
+        self._entries = []
+        self._stream.reset()
+
+    def write(self, ch_num: int, sc_num: int, title: str, lines: Iterable[str]) -> bool:
+        """
+        Write one scene from its (right-stripped, untrimmed) lines unless the
+        file already holds exactly this text. Returns True if the file changed.
+        """
+        rel = scene_rel(ch_num, sc_num)
+        path = self.out_dir / rel
+        self._touched.add(rel)
+        on_disk = self._digest_on_disk(rel, path)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        text = None
+        if isinstance(lines, list):
+            text = "".join(_scene_pieces(title, lines))
+            data = text.encode("utf-8")
+            digest = hashlib.sha1(data).hexdigest()
+            changed = on_disk is None or on_disk[2] != digest
+            if changed:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(data)
+        else:
+            # A very large scene (a book with no headings): hash while streaming it to a temp file.
+            path.parent.mkdir(parents=True, exist_ok=True)
+            h = hashlib.sha1()
+            with open(tmp, "wb") as f:
+                for piece in _scene_pieces(title, lines):
+                    blob = piece.encode("utf-8")
+                    h.update(blob)
+                    f.write(blob)
+            digest = h.hexdigest()
+            changed = on_disk is None or on_disk[2] != digest
+            if not changed:
+                tmp.unlink()
+
+        if changed:
+            self._changed.add(rel)
+            self._staged[rel] = tmp
+            st = os.stat(tmp)   # renaming it into place keeps its mtime and size
+            on_disk = [st.st_mtime_ns, st.st_size, digest]
+        self._hashes[rel] = on_disk
+        self._index_scene(rel, ch_num, sc_num, title, on_disk, text)
+        return changed
+
+    def _index_scene(self, rel: str, ch_num: int, sc_num: int, title: str, on_disk: list, text: str | None) -> None:
+        """Record the scene's reader index entry and, given its text, its cleaned sentences."""
+        name = f"scene{sc_num}"   # what BookReader makes of the file name as a title fallback
+        entry = {
+            "path": rel,
+            "chapter": ch_num,
+            "scene": sc_num,
+            "name": name,
+            "title": f"# {title}".strip().lstrip("#").strip() or name,   # as Scene.title() reads it back
+            "size": on_disk[1],
+            "mtime_ns": on_disk[0],
+            "sentences": None,
+            "words": None,
+        }
+        if text is not None:
+            # A streamed scene (a book without headings) is counted by the reader when first read.
+            spans = segment_sentences(_clean_text(text))
+            entry["sentences"], entry["words"] = len(spans), len(spans.text.split())
+            self._stream.append(rel, (on_disk[0], on_disk[1]), spans)
+        self._entries.append(entry)
+
+    def _digest_on_disk(self, rel: str, path: Path) -> list | None:
+        """Return [mtime_ns, size, sha1] of the file at path, or None if there is none."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        known = self._stored.get(rel)
+        if known is not None and known[:2] == [st.st_mtime_ns, st.st_size]:
+            return known
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        return [st.st_mtime_ns, st.st_size, digest]
+
+    def finish(self) -> dict[str, list[str]]:
+        """
+        Move changed scenes into place, remove scene files this split did not
+        produce, save the digests and report changes.
+        """
+        for rel, tmp in self._staged.items():
+            os.replace(tmp, self.out_dir / rel)
+        self._staged = {}
+        produced = set(self._hashes)
+        for rel in sorted((self._before | self._touched) - produced):
+            path = self.out_dir / rel
+            path.unlink(missing_ok=True)
+            try:
+                path.parent.rmdir()   # only succeeds once the chapter folder is empty
+            except OSError:
+                pass
+
+        if self._hashes != self._stored:
+            _save_hashes(self.out_dir, self._hashes)
+        self._stream.commit()
+        self._write_reader_index()
+        return {
+            "added": sorted(produced - self._before),
+            "removed": sorted(self._before - produced),
+            "modified": sorted(produced & self._before & self._changed),
+            "unchanged": sorted((produced & self._before) - self._changed),
+        }
+
+    def _write_reader_index(self) -> None:
+        """
+        Write the reader's sidecar index for the split, unless the folder holds
+        other scene files or folders the reader would also pick up (then it
+        scans, as before), or the index on disk already says the same.
+        """
+        ours = {rel.split("/", 1)[0] for rel in self._hashes}
+        dirs = [self.out_dir]
+        for dirpath, dirnames, filenames in os.walk(self.out_dir):
+            folder = Path(dirpath)
+            rel_dir = folder.relative_to(self.out_dir).as_posix()
+            if folder != self.out_dir:
+                if rel_dir not in ours:
+                    return
+                dirs.append(folder)
+            for name in filenames:
+                if name.startswith(".") or name.lower() == "notes.txt":
+                    continue
+                if name.lower().endswith(_READER_SUFFIXES) and f"{rel_dir}/{name}" not in self._hashes:
+                    return
+        entries = sorted(self._entries, key=lambda e: (e["chapter"], e["scene"], e["path"].lower()))
+        if entries and load_manifest(self.out_dir) != entries:
+            write_manifest(self.out_dir, entries, dirs)
+
+
+def _load_hashes(out_dir: Path) -> dict[str, list]:
+    try:
+        data = json.loads((out_dir / HASHES_NAME).read_text(encoding="utf-8"))
+        if data.get("version") != HASHES_VERSION:
+            return {}
+        return dict(data["scenes"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _save_hashes(out_dir: Path, hashes: dict[str, list]) -> bool:
+    """Write the digest cache; returns False if the folder is read-only (it is only a cache)."""
+    target = out_dir / HASHES_NAME
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        data = {"version": HASHES_VERSION, "scenes": dict(sorted(hashes.items()))}
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, target)
+        return True
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
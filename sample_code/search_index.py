@@ -0,0 +1,240 @@
+"""
+search_index.py — On-disk inverted index over cleaned scene text.
+
+The index is a small SQLite database stored next to the book (see
+`book_index.sidecar_path`). Each posting row holds one (term, scene) pair
+and the sentence numbers the term occurs in, packed as an `array('I')` blob,
+so a query reads one row per scene per term instead of one row per
+occurrence:
+
+    scenes(id, path, mtime_ns, size)       one row per indexed scene file
+    terms(id, term)                        lowercase word vocabulary
+    postings(term_id, scene_id, sentences) sentence numbers as a uint32 blob
+
+Updates are incremental: only scenes whose (mtime_ns, size) stamp changed,
+or that were added or removed, are re-tokenized. A lookup returns every
+sentence containing all of the query's words; `BookReader.search` orders the
+hits in reading order and checks quoted queries as phrases.
+"""
+
+import re
+import sqlite3
+import threading
+from array import array
+from collections import defaultdict
+from pathlib import Path
+
+try:
+    from .book_index import sidecar_path
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from book_index import sidecar_path
+
+SEARCH_INDEX_NAME = ".search_index.sqlite"
+SEARCH_INDEX_VERSION = 1
+
+_BATCH_ROWS = 100_000   # postings buffered and inserted in term order
+
+_WORD = re.compile(r"[^\W_]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS scenes (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    terms BLOB NOT NULL            -- term ids with postings for this scene, for deletes
+);
+CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, term TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    scene_id INTEGER NOT NULL,
+    sentences BLOB NOT NULL,
+    PRIMARY KEY (term_id, scene_id)
+) WITHOUT ROWID;
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Return the lowercase words of text (letters and digits only)."""
+    return _WORD.findall(text.lower())
+
+
+def search_index_path(scenes_dir: str | Path) -> Path:
+    return sidecar_path(scenes_dir, SEARCH_INDEX_NAME)
+
+
+class SearchIndex:
+    """Incrementally maintained inverted index for one book."""
+
+    def __init__(self, scenes_dir: str | Path, path: str | Path | None = None):
+        self.scenes_dir = Path(scenes_dir)
+        self.path = Path(path) if path is not None else search_index_path(scenes_dir)
+        self._lock = threading.Lock()
+        self._paths: dict[int, str] | None = None   # scene id → relative path
+        try:
+            self._db = self._open(str(self.path))
+        except sqlite3.Error:
+            # Read-only or unsupported volume: keep the index in memory instead.
+            self._db = self._open(":memory:")
+
+    def _open(self, target: str) -> sqlite3.Connection:
+        db = sqlite3.connect(target, check_same_thread=False)
+        try:
+            db.execute("PRAGMA cache_size = -32768")   # 32 MiB keeps bulk inserts off the disk
+            db.executescript(_SCHEMA)
+            row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or int(row[0]) != SEARCH_INDEX_VERSION:
+                db.executescript("DELETE FROM postings; DELETE FROM terms; DELETE FROM scenes;")
+                db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(SEARCH_INDEX_VERSION),))
+            db.commit()
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def update(self, scenes) -> dict[str, int]:
+        """
+        Bring the index in line with scenes (objects with rel, stamp() and
+        sentences()), re-tokenizing only new or changed ones. Returns counts of
+        scenes "indexed" and "removed".
+        """
+        with self._lock:
+            db = self._db
+            stored = {path: (sid, (m, s)) for sid, path, m, s in db.execute("SELECT id, path, mtime_ns, size FROM scenes")}
+            live = {}
+            stale = []
+            for sc in scenes:
+                rel = sc.rel
+                stamp = sc.stamp()
+                live[rel] = sc
+                known = stored.get(rel)
+                if known is None or known[1] != stamp:
+                    stale.append((rel, sc, stamp))
+            removed = [sid for rel, (sid, _stamp) in stored.items() if rel not in live]
+            if not stale and not removed:
+                return {"indexed": 0, "removed": 0}
+
+            self._paths = None
+            with db:
+                for sid in removed:
+                    self._delete_postings(sid)
+                    db.execute("DELETE FROM scenes WHERE id = ?", (sid,))
+                term_ids = dict(db.execute("SELECT term, id FROM terms")) if stale else {}
+                batch = []
+                for rel, sc, (mtime_ns, size) in stale:
+                    rows = [
+                        (self._term_id(term_ids, term), sents.tobytes())
+                        for term, sents in _scene_postings(sc.sentences()).items()
+                    ]
+                    terms = array("I", (tid for tid, _blob in rows)).tobytes()
+                    known = stored.get(rel)
+                    if known is not None:
+                        sid = known[0]
+                        self._delete_postings(sid)
+                        db.execute(
+                            "UPDATE scenes SET mtime_ns = ?, size = ?, terms = ? WHERE id = ?",
+                            (mtime_ns, size, terms, sid),
+                        )
+                    else:
+                        sid = db.execute(
+                            "INSERT INTO scenes (path, mtime_ns, size, terms) VALUES (?, ?, ?, ?)",
+                            (rel, mtime_ns, size, terms),
+                        ).lastrowid
+                    batch.extend((tid, sid, blob) for tid, blob in rows)
+                    if len(batch) >= _BATCH_ROWS:
+                        self._insert_postings(batch)
+                self._insert_postings(batch)
+            return {"indexed": len(stale), "removed": len(removed)}
+
+    def _insert_postings(self, batch: list[tuple[int, int, bytes]]) -> None:
+        # Inserting in primary-key order touches each B-tree page once.
+        batch.sort()
+        self._db.executemany("INSERT INTO postings VALUES (?, ?, ?)", batch)
+        batch.clear()
+
+    def _delete_postings(self, sid: int) -> None:
+        (blob,) = self._db.execute("SELECT terms FROM scenes WHERE id = ?", (sid,)).fetchone()
+        terms = array("I")
+        terms.frombytes(blob)
+        self._db.executemany(
+            "DELETE FROM postings WHERE term_id = ? AND scene_id = ?", ((tid, sid) for tid in terms)
+        )
+
+    def _term_id(self, term_ids: dict[str, int], term: str) -> int:
+        tid = term_ids.get(term)
+        if tid is None:
+            tid = self._db.execute("INSERT INTO terms (term) VALUES (?)", (term,)).lastrowid
+            term_ids[term] = tid
+        return tid
+
+    def lookup(self, query: str) -> dict[str, list[int]]:
+        """
+        Return {relative scene path: sorted sentence indexes} for every sentence
+        that contains all words of query.
+        """
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words:
+            return {}
+        with self._lock:
+            db = self._db
+            rows = db.execute(
+                f"SELECT id, term FROM terms WHERE term IN ({','.join('?' * len(words))})", words
+            ).fetchall()
+            if len(rows) < len(words):
+                return {}   # some word never occurs in the book
+            postings = [
+                dict(db.execute("SELECT scene_id, sentences FROM postings WHERE term_id = ?", (tid,)))
+                for tid, _term in rows
+            ]
+            if self._paths is None:
+                self._paths = dict(db.execute("SELECT id, path FROM scenes"))
+            paths = self._paths
+
+        # Intersect starting from the rarest term so the working sets stay small.
+        postings.sort(key=len)
+        first, rest = postings[0], postings[1:]
+        hits = {}
+        for sid, blob in first.items():
+            sents = array("I")
+            sents.frombytes(blob)
+            if rest:
+                common = set(sents)
+                for p in rest:
+                    other = p.get(sid)
+                    if other is None:
+                        common = None
+                        break
+                    more = array("I")
+                    more.frombytes(other)
+                    common.intersection_update(more)
+                    if not common:
+                        break
+                if not common:
+                    continue
+                hits[paths[sid]] = sorted(common)
+            else:
+                hits[paths[sid]] = sents.tolist()
+        return hits
+
+
+def _scene_postings(sentences) -> dict[str, array]:
+    """Map each term in a scene to the sorted sentence numbers it occurs in."""
+    text = sentences.text
+    low = text.lower()
+    findall = _WORD.findall
+    if len(low) == len(text):
+        # Lower-case the scene once and tokenize each sentence span in place.
+        words = (findall(low, *sentences.span(n)) for n in range(len(sentences)))
+    else:   # lower() changed some lengths, so spans no longer line up
+        words = (tokenize(sentence) for sentence in sentences)
+
+    postings: defaultdict[str, list[int]] = defaultdict(list)
+    for n, terms in enumerate(words):
+        for term in set(terms):
+            postings[term].append(n)
+    return {term: array("I", sents) for term, sents in postings.items()}
@@ -0,0 +1,132 @@
+"""
+sentences.py — Span-based sentence segmentation over cleaned scene text.
+
+A scene's sentences are stored as two compact `array('I')` offset tables into
+the cleaned text rather than as a list of separate strings. Only the offsets
+(8 bytes per sentence) are kept alive; a sentence string is sliced out of the
+shared text when it is actually accessed.
+
+No sentence is longer than `MAX_SENTENCE_CHARS`. A run-on paragraph or a
+table of contents without terminal punctuation is cut at the last clause
+break (; : or a dash) in the window, else the last comma, else the last space,
+and only as a last resort in the middle of a word. Chunks are built from whole
+sentences, so this bound also bounds how long a single TTS call can take.
+"""
+
+import re
+from array import array
+from collections.abc import Sequence
+
+# A sentence is a run of non-space "words" joined by horizontal whitespace,
+# stopping at a newline or at whitespace that follows . ! or ?. This is the
+# same segmentation as re.split(r'(?<=[.!?])\s+|\n+') followed by strip(),
+# but it yields already-trimmed spans without building any strings.
+_SENTENCE = re.compile(r"\S+(?:(?<![.!?])[^\S\n]+\S+)*")
+_ALNUM    = re.compile(r"[^\W_]")   # str.isalnum() as a character class
+
+MAX_SENTENCE_CHARS = 250
+
+# Fallback break points for over-long sentences, best first. Each match ends
+# where the piece should end; the following whitespace is skipped.
+_BREAKS = (
+    re.compile(r"[;:](?=\s)|[\u2013\u2014]"),
+    re.compile(r",(?=\s)"),
+    re.compile(r"\S(?=\s)"),
+)
+
+
+class SentenceSpans(Sequence):
+    """Immutable sequence of sentences, each a (start, end) slice of one text."""
+
+    __slots__ = ("text", "_starts", "_ends")
+
+    def __init__(self, text: str, starts: array, ends: array):
+        self.text = text
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.text[s:e] for s, e in zip(self._starts[index], self._ends[index])]
+        return self.text[self._starts[index]:self._ends[index]]
+
+    def __iter__(self):
+        text = self.text
+        for s, e in zip(self._starts, self._ends):
+            yield text[s:e]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SentenceSpans):
+            return list(self) == list(other)
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def span(self, index: int) -> tuple[int, int]:
+        """Return the (start, end) offsets of sentence `index` in `text`."""
+        return self._starts[index], self._ends[index]
+
+    def offsets(self) -> tuple[array, array]:
+        """Return the start and end offset arrays themselves (shared, not copied)."""
+        return self._starts, self._ends
+
+    def lengths(self) -> list[int]:
+        """Return every sentence's character length without slicing the text."""
+        return [e - s for s, e in zip(self._starts, self._ends)]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the offset tables (the text itself is cached separately)."""
+        return self._starts.itemsize * (len(self._starts) + len(self._ends))
+
+    def __repr__(self):
+        return f"SentenceSpans({len(self)} sentences)"
+
+
+def _split_long(text: str, start: int, end: int, limit: int):
+    """Yield (start, end) pieces of text[start:end], none longer than limit."""
+    while end - start > limit:
+        window_end = start + limit
+        # Don't accept a break in the first third; tiny pieces sound choppy.
+        window_start = start + limit // 3
+        cut = None
+        for pattern in _BREAKS:
+            for m in pattern.finditer(text, window_start, window_end):
+                cut = m.end()
+            if cut is not None:
+                break
+        if cut is None:
+            cut = window_end   # one unbroken "word" longer than the window
+        yield start, cut
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+    if start < end:
+        yield start, end
+
+
+def segment_sentences(text: str, max_chars: int = MAX_SENTENCE_CHARS) -> SentenceSpans:
+    """
+    Split cleaned text into sentence spans, skipping spans with no alphanumerics.
+    Sentences longer than max_chars are split at clause, comma or word boundaries.
+    """
+    starts, ends = array("I"), array("I")
+    add_start, add_end = starts.append, ends.append
+    has_alnum = _ALNUM.search
+    for m in _SENTENCE.finditer(text):
+        s, e = m.span()
+        if e - s > max_chars:
+            for ps, pe in _split_long(text, s, e, max_chars):
+                if has_alnum(text, ps, pe):
+                    add_start(ps)
+                    add_end(pe)
+        # Skip spans that contain no alphanumeric characters (e.g. just "---" or "...")
+        elif has_alnum(text, s, e):
+            add_start(s)
+            add_end(e)
+    return SentenceSpans(text, starts, ends)
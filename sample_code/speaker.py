@@ -4,10 +4,24 @@ import threading
 import queue
 import time
 import os
-from typing import Any, Callable
+from collections import deque
+from typing import Any, Callable, NamedTuple
 
 import numpy as np
 
+try:
+    from .audio_ring import AudioRing
+    from .chunking import DEFAULT_FIRST_CHARS, DEFAULT_GROWTH, DEFAULT_MAX_CHARS
+    from .playback_events import (
+        CHUNK_FINISHED, CHUNK_STARTED, END_OF_QUEUE, UNDERRUN, EventDispatcher, PlaybackEvent,
+    )
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from audio_ring import AudioRing
+    from chunking import DEFAULT_FIRST_CHARS, DEFAULT_GROWTH, DEFAULT_MAX_CHARS
+    from playback_events import (
+        CHUNK_FINISHED, CHUNK_STARTED, END_OF_QUEUE, UNDERRUN, EventDispatcher, PlaybackEvent,
+    )
+
 TTS_CACHE_ROOT = "/Volumes/NVME/Source/tts"
 HF_HOME = os.path.join(TTS_CACHE_ROOT, "huggingface")
 HF_HUB_CACHE = os.path.join(HF_HOME, "hub")
@@ -36,6 +50,7 @@ TTS_MODEL_CONFIGS: dict[str, dict[str, Any]] = {
             "Sky": {"voice": "af_sky", "lang_code": "a", "speed": 1.0},
         },
         "default_voice": "Heart",
+        "chunking": {"first_chars": 160, "growth": 2.0, "max_chars": 500},
     },
     "mlx-community/Qwen3-TTS-12Hz-0.6B-Base-bf16": {
         "label": "Qwen3 0.6B Base",
@@ -45,6 +60,7 @@ TTS_MODEL_CONFIGS: dict[str, dict[str, Any]] = {
             "Ethan": {"voice": "Ethan", "lang_code": "English"},
         },
         "default_voice": "Chelsie",
+        "chunking": {"first_chars": 120, "growth": 2.0, "max_chars": 400},
     },
     "mlx-community/Qwen3-TTS-12Hz-1.7B-Base-bf16": {
         "label": "Qwen3 1.7B Base",
@@ -54,6 +70,7 @@ TTS_MODEL_CONFIGS: dict[str, dict[str, Any]] = {
             "Ethan": {"voice": "Ethan", "lang_code": "English"},
         },
         "default_voice": "Chelsie",
+        "chunking": {"first_chars": 80, "growth": 1.5, "max_chars": 300},
     },
     "mlx-community/Qwen3-TTS-12Hz-0.6B-CustomVoice-bf16": {
         "label": "Qwen3 0.6B Custom Voice",
@@ -75,15 +92,18 @@ TTS_MODEL_CONFIGS: dict[str, dict[str, Any]] = {
             },
         },
         "default_voice": "Chelsie",
+        "chunking": {"first_chars": 120, "growth": 2.0, "max_chars": 400},
     },
     "mlx-community/chatterbox-turbo-fp16": {
         "label": "Chatterbox Turbo",
         "voices": {"Default": {}},
         "default_voice": "Default",
+        "chunking": {"first_chars": 120, "growth": 2.0, "max_chars": 400},
     },
 }
 
 DEFAULT_TTS_MODEL_ID = "mlx-community/Kokoro-82M-bf16"
+DEFAULT_CHUNKING = {"first_chars": DEFAULT_FIRST_CHARS, "growth": DEFAULT_GROWTH, "max_chars": DEFAULT_MAX_CHARS}
 
 
 def available_tts_models() -> list[str]:
@@ -124,6 +144,12 @@ def generation_kwargs(model_id: str, voice_name: str | None = None) -> dict[str,
     return dict(voices[voice])
 
 
+def chunk_settings(model_id: str) -> dict[str, Any]:
+    """Return the chunk ramp (first_chars, growth, max_chars) for a model."""
+    config = TTS_MODEL_CONFIGS.get(model_id, {})
+    return {**DEFAULT_CHUNKING, **config.get("chunking", {})}
+
+
 def _audio_to_float32(audio: Any) -> np.ndarray:
     chunk = np.asarray(audio, dtype=np.float32).reshape(-1)
     if chunk.size == 0:
@@ -182,9 +208,33 @@ def load_tts_model(model_id: str = DEFAULT_TTS_MODEL_ID):
         
     return load_model(model_id, **kwargs)
 
+class SpeechChunk(NamedTuple):
+    """One piece of text fed to BufferedSpeaker; playback events refer to it."""
+    text: str
+    callback: Callable | None = None
+
+
+PLAYBACK_BLOCKSIZE = 2048
+RING_SECONDS = 4.0        # audio held ready for the device callback
+FEED_INTERVAL = 0.01      # how often the playback thread tops up the ring
+
+
 class BufferedSpeaker:
-    """Manage background MLX TTS synthesis and audio playback with buffering."""
-    def __init__(self, model=None, voice: str = "Heart", sr: int = 24000, max_buffers: int = 4, model_id: str = ""):
+    """
+    Manage background MLX TTS synthesis and audio playback with buffering.
+
+    Synthesized chunks wait in `audio_queue`; the playback thread copies them
+    into a lock-free AudioRing and the sounddevice callback (`_audio_callback`)
+    only copies samples out of the ring: no locks, buffer allocations, threads
+    or printing on the real-time audio thread. Blocks it could not fill while
+    more audio was on its way are counted in `underruns`.
+
+    The callback posts what it played as ordered PlaybackEvents (chunk
+    started / finished, underrun, end of queue) to `events`, whose single
+    thread runs subscribers and each chunk's feed() callback.
+    """
+    def __init__(self, model=None, voice: str = "Heart", sr: int = 24000, max_buffers: int = 4, model_id: str = "",
+                 ring_seconds: float = RING_SECONDS):
         self.model = model
         self.voice = voice
         self.sr = sr
@@ -194,11 +244,20 @@ class BufferedSpeaker:
         self.text_queue = queue.Queue()
         self.audio_queue = queue.Queue(maxsize=max_buffers)
         self.stop_event = threading.Event()
-        self._state = self._State()
+        self._ring = AudioRing(max(1, int(sr * ring_seconds)))
+        self._spans: deque = deque()           # [start, end or None, chunk, started] per chunk not yet played out
+        self._pending_audio = None             # chunk being copied into the ring: [samples, offset]
+        self._end_pending = False              # a chunk has started since the last END_OF_QUEUE
+        self._expecting = False                # more audio is on its way (an empty block is an underrun)
+        self.underruns = 0                     # written by the audio callback only
+        self.device_status = 0                 # callbacks that reported a status flag (xruns)
+        self.blocks = 0
         self._lock = threading.Lock()
         self._active_synth = 0
         self._pending_text = 0
         self._playback_error: Exception | None = None
+        self.events = EventDispatcher()
+        self.events.subscribe(self._run_chunk_callback, kinds=(CHUNK_STARTED,))
 
         self._synth_thread = threading.Thread(target=self._synthesis_loop, daemon=True)
         self._play_thread = threading.Thread(target=self._playback_loop, daemon=True)
@@ -206,15 +265,23 @@ class BufferedSpeaker:
         self._synth_thread.start()
         self._play_thread.start()
 
-    class _State:
-        def __init__(self):
-            self.buf = np.zeros((0,), dtype=np.float32)
-            self.fully_drained = False
-
     @property
     def playback_error(self) -> Exception | None:
         return self._playback_error
 
+    def playback_stats(self) -> dict[str, float]:
+        """Return underrun and device status counts plus the seconds of audio buffered."""
+        return {
+            "underruns": self.underruns,
+            "device_status": self.device_status,
+            "blocks": self.blocks,
+            "buffered_seconds": self._ring.readable() / self.sr,
+        }
+
+    def subscribe(self, handler: Callable[[PlaybackEvent], None], kinds=None):
+        """Receive playback events (optionally only the given kinds) on the event thread."""
+        return self.events.subscribe(handler, kinds)
+
     def set_model(self, model, model_id: str = "", voice: str | None = None):
         """Swap the active MLX model without recreating worker threads."""
         self.model = model
@@ -227,10 +294,13 @@ class BufferedSpeaker:
         self.voice = voice
 
     def feed(self, text: str, callback: Callable | None = None):
-        """Add text to the synthesis queue with an optional callback when playback starts."""
+        """
+        Add text to the synthesis queue. The optional callback runs on the event
+        thread when its audio starts playing, in the order the texts were fed.
+        """
         with self._lock:
             self._pending_text += 1
-        self.text_queue.put((text, callback))
+        self.text_queue.put(SpeechChunk(text, callback))
 
     def stop(self):
         """Abort all current work and clear queues."""
@@ -243,18 +313,26 @@ class BufferedSpeaker:
             try: self.audio_queue.get_nowait()
             except queue.Empty: break
         
+        self._expecting = False   # the silence that follows is not an underrun
+        self._end_pending = False
+        self._spans.clear()       # before discarding, or the callback sees their audio as played
+        self._ring.discard()      # silence from the next audio block on
+        self.events.clear()
+
         # Give threads a moment to catch the stop signal
         time.sleep(0.1)
+        self._spans.clear()
+        self._ring.discard()   # anything copied in before the playback thread noticed
+        self.events.clear()
         self.stop_event.clear()
         with self._lock:
-            self._state.buf = np.zeros((0,), dtype=np.float32)
             self._active_synth = 0
             self._pending_text = 0
 
     def is_idle(self) -> bool:
         """Return True when synthesis queues and playback buffer are drained."""
+        has_buffer = self._ring.readable() > 0 or self._pending_audio is not None
         with self._lock:
-            has_buffer = self._state.buf.size > 0
             active_synth = self._active_synth
             pending_text = self._pending_text
         return pending_text == 0 and self.audio_queue.empty() and active_synth == 0 and not has_buffer
@@ -273,10 +351,9 @@ class BufferedSpeaker:
 
     def _synthesis_loop(self):
         while True:
-            item = self.text_queue.get()
-            if item is None: break
-            text, callback = item
-            
+            chunk = self.text_queue.get()
+            if chunk is None: break
+
             try:
                 if not self.model:
                     print("TTS model is not loaded.")
@@ -284,8 +361,9 @@ class BufferedSpeaker:
                 with self._lock:
                     self._active_synth += 1
                 try:
-                    self._internal_synth(text, callback)
+                    self._internal_synth(chunk)
                 finally:
+                    self._put_audio(None, chunk)   # end marker: the chunk's audio is complete
                     with self._lock:
                         self._active_synth = max(0, self._active_synth - 1)
             except Exception as e:
@@ -294,81 +372,138 @@ class BufferedSpeaker:
                 with self._lock:
                     self._pending_text = max(0, self._pending_text - 1)
 
-    def _internal_synth(self, text, callback):
-        first_chunk = True
-        for result in self.model.generate(text, **generation_kwargs(self.model_id, self.voice)):
+    def _internal_synth(self, chunk: SpeechChunk):
+        for result in self.model.generate(chunk.text, **generation_kwargs(self.model_id, self.voice)):
             if self.stop_event.is_set():
                 break
+            self._put_audio(_audio_to_float32(result.audio), chunk)
 
-            chunk = _audio_to_float32(result.audio)
-
-            while not self.stop_event.is_set():
+    def _put_audio(self, samples: np.ndarray | None, chunk: SpeechChunk) -> None:
+        while not self.stop_event.is_set():
+            try:
+                self.audio_queue.put((samples, chunk), timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+    def _audio_callback(self, outdata, frames, time_info, status):
+        """sounddevice callback: runs on the real-time audio thread, so it only copies and posts events."""
+        if status:
+            self.device_status += 1
+        got = self._ring.read_into(outdata[:, 0] if outdata.ndim == 2 else outdata)
+        self.blocks += 1
+        pos = self._ring.consumed
+        discarded = self._ring.discarded
+
+        spans = self._spans
+        while spans:
+            try:
+                span = spans[0]
+            except IndexError:   # cleared by stop()
+                break
+            start, end, chunk, started = span
+            if start < discarded and (end is None or end <= discarded):
+                # Its audio was discarded by stop(), not played: drop it without events.
                 try:
-                    cb = callback if first_chunk else None
-                    self.audio_queue.put((chunk, cb), timeout=0.1)
-                    first_chunk = False
+                    spans.popleft()
+                except IndexError:
                     break
-                except queue.Full:
-                    continue
-
-    def _playback_loop(self):
-        if not INTERNAL_TTS_SUPPORTED:
-            print("Sounddevice not available. Playback loop disabled.")
+                continue
+            done = end is not None and pos >= end
+            if not started and (pos > start or done):
+                span[3] = True
+                self._end_pending = True
+                self.events.post(PlaybackEvent(CHUNK_STARTED, chunk, start))
+            if not done:
+                break
+            try:
+                spans.popleft()
+            except IndexError:
+                break
+            self.events.post(PlaybackEvent(CHUNK_FINISHED, chunk, end))
+
+        if got < frames:
+            if self._expecting:
+                self.underruns += 1
+                self.events.post(PlaybackEvent(UNDERRUN, None, pos))
+            elif self._end_pending and not spans:
+                self._end_pending = False
+                self.events.post(PlaybackEvent(END_OF_QUEUE, None, pos))
+
+    def _run_chunk_callback(self, event: PlaybackEvent) -> None:
+        if event.chunk is not None and event.chunk.callback is not None:
+            event.chunk.callback()
+
+    def _feed_ring(self) -> None:
+        """Top up the ring from audio_queue, recording where each chunk's audio starts and ends."""
+        if self.stop_event.is_set():
+            self._pending_audio = None
+            self._expecting = False
             return
-
-        finished_event = threading.Event()
-        
-        def callback(outdata, frames, time_info, status):
-            if status:
-                print(f"Playback status: {status}")
-
-            out = np.zeros((frames,), dtype=np.float32)
-
-            while not self.stop_event.is_set():
-                with self._lock:
-                    needs_audio = self._state.buf.size < frames
-                if not needs_audio:
-                    break
+        spans = self._spans
+        while True:
+            if self._pending_audio is None:
                 try:
-                    data, cb = self.audio_queue.get_nowait()
-                    if cb:
-                        threading.Thread(target=cb, daemon=True).start()
-                    
-                    with self._lock:
-                        self._state.buf = np.concatenate([self._state.buf, np.asarray(data, dtype=np.float32).reshape(-1)])
+                    data, chunk = self.audio_queue.get_nowait()
                 except queue.Empty:
                     break
+                tail = spans[-1] if spans else None
+                if tail is None or tail[2] is not chunk or tail[1] is not None:
+                    tail = [self._ring.written, None, chunk, False]
+                    spans.append(tail)
+                if data is None:
+                    tail[1] = self._ring.written   # publish the end once all its audio is in the ring
+                    continue
+                self._pending_audio = [np.asarray(data, dtype=np.float32).reshape(-1), 0]
+            samples, offset = self._pending_audio
+            offset += self._ring.write(samples[offset:])
+            if offset < samples.size:
+                self._pending_audio[1] = offset
+                break   # ring full; continue once the callback has played some of it
+            self._pending_audio = None
+        with self._lock:
+            busy = self._active_synth > 0 or self._pending_text > 0
+        self._expecting = busy or self._pending_audio is not None or not self.audio_queue.empty()
 
-            with self._lock:
-                n = min(frames, self._state.buf.size)
-                if n > 0:
-                    out[:n] = self._state.buf[:n]
-                    self._state.buf = self._state.buf[n:]
-            
-            outdata[:, 0] = out
-
-            if self.stop_event.is_set():
-                raise sd.CallbackStop()
-
+    def _drain_without_device(self, scratch: np.ndarray) -> None:
+        """With no output device, play the ring into scratch so events still fire and is_idle() is reached."""
         while True:
+            more = self._ring.readable() > 0
+            if not (more or (self._end_pending and not self._expecting)):
+                return
+            self._audio_callback(scratch, len(scratch), None, None)   # an empty block posts END_OF_QUEUE
+            if not more:
+                return
+
+    def _playback_loop(self):
+        stream = None
+        scratch = np.empty((PLAYBACK_BLOCKSIZE, 1), dtype=np.float32)
+        if not INTERNAL_TTS_SUPPORTED:
+            print("Sounddevice not available. Audio will be dropped instead of played.")
+        else:
             try:
-                with sd.OutputStream(
+                stream = sd.OutputStream(
                     samplerate=self.sr,
                     channels=1,
                     dtype="float32",
-                    blocksize=2048,
-                    callback=callback,
-                    finished_callback=finished_event.set
-                ):
-                    while not self.stop_event.is_set():
-                        finished_event.wait(0.1)
+                    blocksize=PLAYBACK_BLOCKSIZE,
+                    callback=self._audio_callback,
+                )
+                stream.start()
             except Exception as e:
                 self._playback_error = e
                 print(f"Playback Error: {e}")
                 return
-            
-            if self.stop_event.is_set():
-                time.sleep(0.1)
+
+        try:
+            while True:
+                self._feed_ring()
+                if stream is None:
+                    self._drain_without_device(scratch)
+                time.sleep(FEED_INTERVAL)
+        finally:
+            if stream is not None:
+                stream.close()
 
 def speak_text(model, text, voice="Heart", sr=24000, stop_event=None, model_id=DEFAULT_TTS_MODEL_ID):
     """Legacy one-shot wrapper. Blocks until done."""
@@ -1,66 +1,46 @@
 #!/usr/bin/env python3
 """
 book_splitter.py — Split a plain-text Project Gutenberg book into per-scene Markdown files.
+
+The structure heuristics live in `book_structure.py` (re-exported here), so
+`VirtualBook` finds exactly the same chapters and scenes without writing files.
+Books are read in a single streaming pass (see `SceneStream`): `.gz` input is
+decompressed on the fly, `-` reads standard input, and each chapter's scenes
+are written as soon as the next heading closes it. Splitting a book again is
+idempotent: unchanged scene files are left untouched and scenes the book no
+longer has are removed (see `scene_writer.py`).
 """
 
-import re
+import gzip
 import sys
 from pathlib import Path
-from typing import Optional
-
-# ---------------------------------------------------------------------------
-# Regex patterns
-# These regexes map out structural heuristics for Project Gutenberg files.
-# Project Gutenberg books follow loose but mostly predictable patterns for
-# marking chapters and starting/ending the actual text block.
-# ---------------------------------------------------------------------------
-
-RE_CHAPTER = re.compile(r"^CHAPTER\s+([IVXLCDM]+|\d+)\s*$", re.IGNORECASE)
-RE_CHAPTER_TOC = re.compile(r"^CHAPTER\s+([IVXLCDM]+|\d+)\s*[.\-—]", re.IGNORECASE)
-RE_ACT = re.compile(r"^ACT\s+([IVXLCDM]+|\d+)\s*$", re.IGNORECASE)
-RE_ACT_TOC = re.compile(r"^\s+ACT\s|^ACT\s+([IVXLCDM]+|\d+)\s*\.", re.IGNORECASE)
-# Journal date format often appears in epistolary novels like Dracula directly before a scene break (e.g., _3 May_)
-RE_JOURNAL_DATE = re.compile(r"^_\d")
-RE_START = re.compile(r"\*{3}\s*START OF THE PROJECT GUTENBERG", re.IGNORECASE)
-RE_END   = re.compile(r"\*{3}\s*END OF THE PROJECT GUTENBERG",   re.IGNORECASE)
+from typing import Iterable, TextIO
+
+try:
+    from .book_structure import (
+        RE_ACT, RE_ACT_TOC, RE_CHAPTER, RE_CHAPTER_TOC, RE_END, RE_JOURNAL_DATE, RE_START,
+        SceneStream, clean_block, detect_format, parse_num, plan_scenes, roman_to_int,
+        scene_content, split_into_scenes, strip_gutenberg,
+    )
+    from .packed_book import PACK_SUFFIX, PackedBook, write_pack
+    from .reader import _clean_text
+    from .scene_writer import SceneWriter, scene_rel
+    from .sentences import segment_sentences
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from book_structure import (
+        RE_ACT, RE_ACT_TOC, RE_CHAPTER, RE_CHAPTER_TOC, RE_END, RE_JOURNAL_DATE, RE_START,
+        SceneStream, clean_block, detect_format, parse_num, plan_scenes, roman_to_int,
+        scene_content, split_into_scenes, strip_gutenberg,
+    )
+    from packed_book import PACK_SUFFIX, PackedBook, write_pack
+    from reader import _clean_text
+    from scene_writer import SceneWriter, scene_rel
+    from sentences import segment_sentences
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def roman_to_int(s: str) -> Optional[int]:
-    vals = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
-    s = s.strip().upper()
-    if not all(c in vals for c in s): return None
-    total, prev = 0, 0
-    for ch in reversed(s):
-        cur = vals[ch]
-        total += cur if cur >= prev else -cur
-        prev = cur
-    return total
-
-def parse_num(s: str) -> int:
-    s = s.strip()
-    if s.isdigit(): return int(s)
-    return roman_to_int(s) or 1
-
-def strip_gutenberg(lines: list[str]) -> list[str]:
-    start_idx, end_idx = 0, len(lines)
-    for i, line in enumerate(lines):
-        if RE_START.search(line):
-            start_idx = i + 1
-            break
-    for i in range(len(lines) - 1, start_idx, -1):
-        if RE_END.search(lines[i]):
-            end_idx = i
-            break
-    return lines[start_idx:end_idx]
-
-def clean_block(lines: list[str]) -> str:
-    while lines and not lines[0].strip(): lines.pop(0)
-    while lines and not lines[-1].strip(): lines.pop()
-    return "\n".join(lines)
-
 def write_scene(path: Path, title: str, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with open(path, "w", encoding="utf-8") as f:
@@ -68,35 +48,73 @@ def write_scene(path: Path, title: str, content: str) -> None:
         f.write(content)
         f.write("\n")
 
-def detect_format(lines: list[str]) -> str:
-    chapters = sum(1 for l in lines if RE_CHAPTER.match(l.rstrip()) and not RE_CHAPTER_TOC.match(l.rstrip()))
-    acts     = sum(1 for l in lines if RE_ACT.match(l.rstrip()) and not RE_ACT_TOC.match(l.rstrip()))
-    if chapters >= acts and chapters > 0: return "chapter"
-    if acts > 0: return "act"
-    return "unknown"
-
-def split_into_scenes(ch_num: int, ch_title: str, lines: list[str]) -> list[tuple[str, list[str]]]:
-    scenes: list[tuple[str, list[str]]] = []
-    current_title = ch_title
-    current_lines: list[str] = []
-
-    for line in lines:
-        raw = line.rstrip()
-        if RE_JOURNAL_DATE.match(raw):
-            if current_lines:
-                scenes.append((current_title, list(current_lines)))
-            title_text = raw.lstrip("_").split("_")[0].rstrip(".").strip()
-            current_title = f"{ch_title} — {title_text}" if title_text else ch_title
-            current_lines = [raw]
-        else:
-            current_lines.append(raw)
-
-    if current_lines:
-        scenes.append((current_title, list(current_lines)))
-
-    if not scenes or (len(scenes) == 1 and scenes[0][0] == ch_title and not RE_JOURNAL_DATE.match(lines[0].rstrip() if lines else "")):
-        return [(ch_title, [l.rstrip() for l in lines])]
-    return scenes
+def open_book_lines(book_path: str | Path) -> TextIO:
+    """Open a book for reading line by line: `-` is stdin and `*.gz` is decompressed."""
+    if str(book_path) == "-":
+        return open(sys.stdin.fileno(), encoding="utf-8", errors="replace", closefd=False)
+    if str(book_path).lower().endswith(".gz"):
+        return gzip.open(book_path, "rt", encoding="utf-8", errors="replace")
+    return open(book_path, encoding="utf-8", errors="replace")
+
+def book_title(book_path: str | Path) -> str:
+    """Return the title used for a book with no recognisable structure (its file stem)."""
+    path = Path(book_path)
+    if path.suffix.lower() == ".gz":
+        path = path.with_suffix("")
+    return path.stem
+
+def packed_entry(ch_num: int, sc_num: int, title: str, content: str) -> dict:
+    """Build a packed-book scene: the cleaned text plus its manifest-style metadata."""
+    text = _clean_text(f"# {title}\n\n{content}\n")
+    return {
+        "path": scene_rel(ch_num, sc_num),
+        "chapter": ch_num,
+        "scene": sc_num,
+        "name": None,
+        "title": title.strip() or f"Chapter {ch_num}, Scene {sc_num}",
+        "sentences": len(segment_sentences(text)),
+        "words": len(text.split()),
+        "text": text,
+    }
+
+class _PackWriter:
+    """Collects a packed book's scenes and rewrites the pack only if any of them changed."""
+
+    def __init__(self, target: Path):
+        self.target = target
+        self._scenes: list[dict] = []
+
+    def begin(self) -> None:
+        self._scenes = []
+
+    def write(self, ch_num: int, sc_num: int, title: str, lines) -> None:
+        self._scenes.append(packed_entry(ch_num, sc_num, title, clean_block(list(lines))))
+
+    def finish(self) -> dict[str, list[str]]:
+        # A pack stores every scene's cleaned text, so it is assembled at the end.
+        self._scenes.sort(key=lambda e: (e["chapter"], e["scene"]))
+        old: list[tuple[dict, str]] = []
+        try:
+            book = PackedBook(self.target)
+            try:
+                old = [(e, book.text(i)) for i, e in enumerate(book.entries)]
+            finally:
+                book.close()
+        except (OSError, ValueError):
+            pass
+        new = [({k: v for k, v in e.items() if k != "text"}, e["text"]) for e in self._scenes]
+        if new != old:
+            write_pack(self.target, self._scenes)
+
+        old_texts = {e["path"]: (e["title"], text) for e, text in old}
+        new_texts = {e["path"]: (e["title"], text) for e, text in new}
+        both = new_texts.keys() & old_texts.keys()
+        return {
+            "added": sorted(new_texts.keys() - old_texts.keys()),
+            "removed": sorted(old_texts.keys() - new_texts.keys()),
+            "modified": sorted(rel for rel in both if new_texts[rel] != old_texts[rel]),
+            "unchanged": sorted(rel for rel in both if new_texts[rel] == old_texts[rel]),
+        }
 
 # ---------------------------------------------------------------------------
 # BookSplitter Class
@@ -110,87 +128,101 @@ class BookSplitter:
     This class ingests a full Project Gutenberg `.txt` book, strips the licensing preamble/postamble, 
     heuristically detects the structure (Chapters vs Acts), and splits it into discrete `.md` files
     organized into `scenes/ch01/scene1.md` type directory structures.
+
+    When the output path ends in `.tbrpack` (or `packed=True`), the scenes are written
+    pre-cleaned into a single packed book file instead (see `packed_book.py`).
+
+    With max_scene_chars, scenes longer than that (whole acts, undivided chapters)
+    are cut at paragraph breaks into consecutively numbered scenes.
     """
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, max_scene_chars: int | None = None):
         self.verbose = verbose
+        self.max_scene_chars = max_scene_chars
 
     def _log(self, msg: str):
         if self.verbose: print(msg)
 
-    def split_book(self, book_path: str | Path, output_dir: str | Path) -> Path:
+    def split_book(self, book_path: str | Path, output_dir: str | Path, packed: bool | None = None) -> Path:
+        """Split a book into output_dir (see import_book) and return the resolved output path."""
+        self.import_book(book_path, output_dir, packed)
+        return Path(output_dir).resolve()
+
+    def import_book(self, book_path: str | Path, output_dir: str | Path,
+                    packed: bool | None = None) -> dict[str, list[str]]:
+        """
+        Split a `.txt` (or `.txt.gz`, or `-` for stdin) book into output_dir in
+        one streaming pass. Only when a book mixes chapter and act headings and
+        the kind met second turns out to be the more common one is a file read
+        a second time; stdin cannot be, so it keeps the first split.
+
+        Scene files whose content is unchanged keep their mtimes, and scenes
+        from an earlier split that are gone are removed. Returns the relative
+        scene paths "added", "removed", "modified" and "unchanged", so readers
+        and exporters can invalidate only what changed.
+        """
+        stdin = str(book_path) == "-"
         book_file = Path(book_path)
         out_dir = Path(output_dir)
-
-        if not book_file.exists():
+        if not stdin and not book_file.exists():
             raise FileNotFoundError(f"Book file not found: {book_file}")
 
-        self._log(f"Reading: {book_file}")
-        with open(book_file, encoding="utf-8", errors="replace") as f:
-            raw_lines = f.readlines()
-
-        lines = strip_gutenberg(raw_lines)
-        if not lines:
-            self._log("WARNING: No Gutenberg markers found — using full file.")
-            lines = [l.rstrip("\n") for l in raw_lines]
-
-        fmt = detect_format(lines)
+        title = out_dir.stem if stdin else book_title(book_file)
+        sink = self._sink(out_dir, packed)
+        self._log(f"Reading: {'<stdin>' if stdin else book_file}")
+        with open_book_lines(book_path) as f:
+            stream = self._split_stream(SceneStream(title, max_scene_chars=self.max_scene_chars), f, sink)
+
+        if stream.format is not None and stream.detected != stream.format:
+            if stdin:
+                self._log(f"WARNING: Mostly {stream.detected} headings, but stdin cannot be re-read — "
+                          f"kept the split by {stream.format}.")
+            else:
+                self._log(f"Mostly {stream.detected} headings — splitting again by {stream.detected}.")
+                sink.begin()
+                with open_book_lines(book_path) as f:
+                    self._split_stream(SceneStream(title, stream.detected, self.max_scene_chars), f, sink)
+        return self._finish(sink, out_dir)
+
+    def split_lines(self, lines: Iterable[str], output_dir: str | Path, title: str = "book",
+                    packed: bool | None = None) -> dict[str, list[str]]:
+        """Split a book given as any line iterator in a single pass (see import_book)."""
+        out_dir = Path(output_dir)
+        sink = self._sink(out_dir, packed)
+        stream = self._split_stream(SceneStream(title, max_scene_chars=self.max_scene_chars), lines, sink)
+        if stream.format is not None and stream.detected != stream.format:
+            self._log(f"WARNING: Mostly {stream.detected} headings; kept the split by {stream.format}.")
+        return self._finish(sink, out_dir)
+
+    def _sink(self, out_dir: Path, packed: bool | None) -> "SceneWriter | _PackWriter":
+        if packed is None:
+            packed = out_dir.suffix.lower() == PACK_SUFFIX
+        return _PackWriter(out_dir) if packed else SceneWriter(out_dir)
+
+    def _finish(self, sink, out_dir: Path) -> dict[str, list[str]]:
+        report = sink.finish()
+        self._log(f"Done! Scenes written to {out_dir} ({len(report['added'])} added, {len(report['removed'])} "
+                  f"removed, {len(report['modified'])} modified, {len(report['unchanged'])} unchanged)")
+        return report
+
+    def _split_stream(self, stream: SceneStream, lines: Iterable[str], sink) -> SceneStream:
+        """Hand each scene to sink as the stream produces it."""
+        chapters: set[int] = set()
+        for ch, sc, title, scene_lines in stream.scenes(lines):
+            chapters.add(ch)
+            sink.write(ch, sc, title, scene_lines)
+
+        fmt = stream.format or "unknown"
         self._log(f"Detected format : {fmt}")
-
-        if fmt == "chapter":
-            self._split_chapters(lines, out_dir)
-        elif fmt == "act":
-            self._split_acts(lines, out_dir)
-        else:
+        if fmt == "unknown":
             self._log("Unknown format — writing as ch01/scene1.md")
-            content = clean_block([l.rstrip() for l in lines])
-            write_scene(out_dir / "ch01" / "scene1.md", book_file.stem, content)
-
-        self._log(f"Done! Scenes written to {out_dir}")
-        return out_dir.resolve()
-
-    def _split_chapters(self, lines: list[str], output_dir: Path) -> None:
-        chapters: list[tuple[int, str, list[str]]] = []
-        current_lines, current_num, current_title, in_chapter = [], 0, "", False
-
-        for line in lines:
-            raw = line.rstrip(); stripped = raw.strip()
-            m = RE_CHAPTER.match(stripped)
-            if m and not RE_CHAPTER_TOC.match(stripped):
-                if in_chapter: chapters.append((current_num, current_title, current_lines))
-                current_num, current_title, current_lines, in_chapter = parse_num(m.group(1)), stripped, [], True
-            elif in_chapter:
-                current_lines.append(raw)
-
-        if in_chapter and current_lines: chapters.append((current_num, current_title, current_lines))
-        self._log(f"Found {len(chapters)} chapters.")
-
-        for ch_num, ch_title, ch_lines in chapters:
-            ch_dir = output_dir / f"ch{ch_num:02d}"
-            scenes = split_into_scenes(ch_num, ch_title, ch_lines)
-            for sc_idx, (sc_title, sc_lines) in enumerate(scenes, start=1):
-                write_scene(ch_dir / f"scene{sc_idx}.md", sc_title or ch_title, clean_block(list(sc_lines)))
-
-    def _split_acts(self, lines: list[str], output_dir: Path) -> None:
-        acts: list[tuple[int, str, list[str]]] = []
-        current_lines, current_num, current_title, in_act = [], 0, "", False
-
-        for line in lines:
-            raw = line.rstrip(); stripped = raw.strip()
-            m = RE_ACT.match(stripped)
-            if m and not RE_ACT_TOC.match(raw):
-                if in_act: acts.append((current_num, current_title, current_lines))
-                current_num, current_title, current_lines, in_act = parse_num(m.group(1)), stripped, [], True
-            elif in_act:
-                current_lines.append(raw)
-
-        if in_act and current_lines: acts.append((current_num, current_title, current_lines))
-        self._log(f"Found {len(acts)} acts.")
-
-        for act_num, act_title, act_lines in acts:
-            write_scene(output_dir / f"ch{act_num:02d}" / "scene1.md", act_title, clean_block(list(act_lines)))
+        else:
+            self._log(f"Found {len(chapters)} {'chapters' if fmt == 'chapter' else 'acts'}.")
+        return stream
 
 if __name__ == "__main__":
     import sys
+    # python splitter.py [book.txt | book.txt.gz | -] [scenes_dir | book.tbrpack] [max scene chars]
     book = sys.argv[1] if len(sys.argv) > 1 else "sample_book/dracula.txt"
     dest = sys.argv[2] if len(sys.argv) > 2 else "sample_book/scenes"
-    BookSplitter().split_book(book, dest)
\ No newline at end of file
+    max_chars = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    BookSplitter(max_scene_chars=max_chars).split_book(book, dest)
\ No newline at end of file
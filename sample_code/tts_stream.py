@@ -0,0 +1,215 @@
+"""
+tts_stream.py — Pre-cleaned, sentence-segmented scene text written by the splitter.
+
+When `BookSplitter` writes a scenes folder it already has every scene's text
+in hand, so it also runs `_clean_text` and `segment_sentences` once and
+stores the result in `.tts_stream.bin` inside the folder. `BookReader` then
+serves a scene's text and sentences straight from this file instead of
+re-reading, re-cleaning and re-segmenting the Markdown. Each record carries
+the (mtime_ns, size) of the scene file it was made from; a scene edited
+after the split no longer matches and is read from its file as before.
+
+The file is written front to back while the splitter streams, so its index
+sits at the end:
+
+    scene records   UTF-8 text, then sentence starts and ends (uint32 each,
+                    offsets into the decoded text), scene after scene
+    metadata JSON   one {path, mtime_ns, size} per record
+    offset table    records × (text offset, text length, spans offset, sentences) u64
+    footer          MAGIC (8 bytes) | version u32 | records u32 | metadata offset u64 | length u64
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from pathlib import Path
+
+try:
+    from .sentences import SentenceSpans
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from sentences import SentenceSpans
+
+STREAM_NAME = ".tts_stream.bin"
+STREAM_MAGIC = b"TBRTTS\0\0"
+STREAM_VERSION = 1
+
+_FOOTER = struct.Struct("<8sIIQQ")
+
+
+def stream_path(scenes_dir: str | Path) -> Path:
+    return Path(scenes_dir) / STREAM_NAME
+
+
+def _le(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class StreamWriter:
+    """Appends scene records to a temporary file; `commit()` moves it into place."""
+
+    def __init__(self, scenes_dir: str | Path):
+        self.target = stream_path(scenes_dir)
+        self._tmp = self.target.with_name(f"{self.target.name}.{os.getpid()}.tmp")
+        self._file = None
+        self._meta: list[dict] = []
+        self._offsets = array("Q")
+
+    def reset(self) -> None:
+        """Drop everything appended so far (the book is being split again)."""
+        self.discard()
+        self._meta, self._offsets = [], array("Q")
+
+    def append(self, rel: str, stamp: tuple[int, int], spans: SentenceSpans) -> None:
+        if self._file is None:
+            self.target.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._tmp, "wb")
+        f = self._file
+        blob = spans.text.encode("utf-8")
+        text_at = f.tell()
+        f.write(blob)
+        starts, ends = (array("I", a) for a in spans.offsets())
+        spans_at = f.tell()
+        f.write(_le(starts))
+        f.write(_le(ends))
+        self._meta.append({"path": rel, "mtime_ns": stamp[0], "size": stamp[1]})
+        self._offsets.extend((text_at, len(blob), spans_at, len(spans)))
+
+    def commit(self) -> bool:
+        """
+        Finish the file and replace the old stream unless it is byte-identical.
+        Returns True if the stream on disk changed. Failures leave no stream
+        (the reader falls back to the scene files), never an exception.
+        """
+        if self._file is None:
+            return False
+        f, self._file = self._file, None
+        try:
+            with f:
+                meta = json.dumps(self._meta, separators=(",", ":")).encode("utf-8")
+                meta_at = f.tell()
+                f.write(meta)
+                f.write(_le(self._offsets))
+                f.write(_FOOTER.pack(STREAM_MAGIC, STREAM_VERSION, len(self._meta), meta_at, len(meta)))
+            if _same_file(self._tmp, self.target):
+                self._tmp.unlink()
+                return False
+            os.replace(self._tmp, self.target)
+            return True
+        except OSError:
+            self.discard()
+            return False
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            self._tmp.unlink()
+        except OSError:
+            pass
+
+
+def _same_file(a: Path, b: Path) -> bool:
+    try:
+        if os.path.getsize(a) != os.path.getsize(b):
+            return False
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            while True:
+                block = fa.read(1 << 20)
+                if block != fb.read(1 << 20):
+                    return False
+                if not block:
+                    return True
+    except OSError:
+        return False
+
+
+class TTSStream:
+    """
+    Read-only, memory-mapped view of a scenes folder's `.tts_stream.bin`.
+
+    Opening a book only notes that the stream exists; the file is mapped and
+    its index parsed on the first lookup, so reopening a book still touches
+    nothing but its sidecar index.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._mm: mmap.mmap | None = None
+        self._index: dict[str, int] | None = None   # rel → record, {} if the file is unusable
+        self._stamps: list[tuple[int, int]] = []
+        self._offsets = array("Q")
+
+    @classmethod
+    def open(cls, scenes_dir: str | Path) -> "TTSStream | None":
+        """Return the folder's stream, or None if there is none."""
+        path = stream_path(scenes_dir)
+        return cls(path) if path.is_file() else None
+
+    def _load(self) -> dict[str, int]:
+        with self._lock:
+            if self._index is None:
+                try:
+                    self._map()
+                except (OSError, ValueError, KeyError, TypeError, struct.error):
+                    self._index = {}   # fall back to the scene files
+            return self._index
+
+    def _map(self) -> None:
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _FOOTER.size:
+                raise ValueError(f"Not a TTS stream: {self.path}")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, count, meta_at, meta_len = _FOOTER.unpack_from(mm, size - _FOOTER.size)
+            if magic != STREAM_MAGIC or version != STREAM_VERSION:
+                raise ValueError(f"Not a TTS stream (or unsupported version): {self.path}")
+            meta = json.loads(mm[meta_at:meta_at + meta_len].decode("utf-8"))
+            table_at = meta_at + meta_len
+            offsets = array("Q", mm[table_at:table_at + 32 * count])
+            if sys.byteorder != "little":
+                offsets.byteswap()
+            if len(meta) != count or len(offsets) != 4 * count:
+                raise ValueError(f"Corrupt TTS stream: {self.path}")
+            stamps = [(m["mtime_ns"], m["size"]) for m in meta]
+            index = {m["path"]: i for i, m in enumerate(meta)}
+        except Exception:
+            mm.close()
+            raise
+        self._mm, self._offsets, self._stamps, self._index = mm, offsets, stamps, index
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def find(self, rel: str, stamp: tuple[int, int]) -> int | None:
+        """Return the record for a scene file if it was made from exactly this revision."""
+        index = self._load().get(rel)
+        if index is None or self._stamps[index] != stamp:
+            return None
+        return index
+
+    def stamp(self, index: int) -> tuple[int, int]:
+        return self._stamps[index]
+
+    def text(self, index: int) -> str:
+        text_at, length = self._offsets[4 * index], self._offsets[4 * index + 1]
+        return self._mm[text_at:text_at + length].decode("utf-8")
+
+    def sentences(self, index: int, text: str) -> SentenceSpans:
+        """Return the stored sentence spans over text (this record's cleaned text)."""
+        spans_at, count = self._offsets[4 * index + 2], self._offsets[4 * index + 3]
+        starts = array("I", self._mm[spans_at:spans_at + 4 * count])
+        ends = array("I", self._mm[spans_at + 4 * count:spans_at + 8 * count])
+        if sys.byteorder != "little":
+            starts.byteswap()
+            ends.byteswap()
+        return SentenceSpans(text, starts, ends)
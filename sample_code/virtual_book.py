@@ -0,0 +1,93 @@
+"""
+virtual_book.py — Read a monolithic plain-text book in place, split into virtual scenes.
+
+Splitting a book with `BookSplitter` writes hundreds of scene files that are
+then read straight back. A VirtualBook skips that round trip: it maps the
+`.txt` once, runs the splitter's heuristics (see `book_structure.py`) over its
+lines, and keeps each scene as a byte range into the mapping:
+
+    entries     manifest-style metadata per scene (path, chapter, scene, title)
+    offsets     scene count × (start, end) byte offsets, as an `array('Q')`
+
+A scene's text is decoded from its range only when the shared SceneCache
+misses, and matches what the splitter would have written for it. Scene paths
+are the ones `split_book` would use (`ch01/scene2.md`), so progress, bookmarks
+and search hits carry over between a virtual and a split copy of a book.
+Books are expected to be UTF-8 with `\\n` or `\\r\\n` line endings; save edits to
+a new file rather than truncating the book in place while it is open.
+"""
+
+import mmap
+import os
+import zlib
+from array import array
+from pathlib import Path
+
+try:
+    from .book_structure import clean_block, plan_scenes
+except ImportError:  # imported as a top-level module by the GUI/CLI scripts
+    from book_structure import clean_block, plan_scenes
+
+TEXT_SUFFIX = ".txt"
+
+
+def is_text_book(path: str | Path) -> bool:
+    """True if path names a single plain-text book file (rather than a scenes folder)."""
+    path = Path(path)
+    return path.suffix.lower() == TEXT_SUFFIX and path.is_file()
+
+
+class VirtualBook:
+    """Read-only, memory-mapped plain-text book with a virtual chapter/scene index."""
+
+    def __init__(self, path: str | Path, max_scene_chars: int | None = None):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            self.stamp = (st.st_mtime_ns, st.st_size)
+            if not st.st_size:
+                raise ValueError(f"Empty book: {self.path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # One pass over the mapping: decoded lines for the heuristics plus the
+        # byte offset of every line start. Only the offsets are kept.
+        lines: list[str] = []
+        line_starts = array("Q", [0])
+        pos = 0
+        for raw in iter(self._mm.readline, b""):
+            lines.append(raw.decode("utf-8", errors="replace"))
+            pos += len(raw)
+            line_starts.append(pos)
+
+        self.format, plans = plan_scenes(lines, self.path.stem, max_scene_chars)
+        self.entries: list[dict] = []
+        self._headings: list[str] = []
+        self._offsets = array("Q")
+        for p in plans:
+            start, end = line_starts[p.start], line_starts[p.end]
+            self.entries.append({
+                "path": f"ch{p.chapter:02d}/scene{p.scene}.md",
+                "chapter": p.chapter,
+                "scene": p.scene,
+                "name": None,
+                "title": p.title.strip() or f"Chapter {p.chapter}, Scene {p.scene}",
+                "crc": zlib.crc32(self._mm[start:end]),
+            })
+            self._headings.append(p.title)
+            self._offsets.extend((start, end))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def text(self, index: int) -> str:
+        """
+        Decode one scene from the mapping as the Markdown `split_book` writes
+        for it (a `# title` heading and the trimmed body); not yet cleaned.
+        """
+        start, end = self._offsets[2 * index], self._offsets[2 * index + 1]
+        body = self._mm[start:end].decode("utf-8", errors="replace")
+        content = clean_block([line.rstrip() for line in body.split("\n")])
+        return f"# {self._headings[index]}\n\n{content}\n"
+
+    def close(self) -> None:
+        self._mm.close()
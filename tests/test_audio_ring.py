@@ -0,0 +1,160 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from sample_code.audio_ring import AudioRing
+from sample_code.playback_events import CHUNK_FINISHED, CHUNK_STARTED, END_OF_QUEUE, UNDERRUN
+from sample_code.speaker import BufferedSpeaker
+
+
+def test_ring_wraps_and_pads_with_silence():
+    ring = AudioRing(8)
+    out = np.ones(5, dtype=np.float32)
+
+    assert ring.write(np.arange(1, 7, dtype=np.float32)) == 6
+    assert ring.read_into(out) == 5 and out.tolist() == [1, 2, 3, 4, 5]
+    assert ring.write(np.arange(7, 17, dtype=np.float32)) == 7   # wraps; only 7 slots free
+    assert ring.read_into(out) == 5 and out.tolist() == [6, 7, 8, 9, 10]
+    assert ring.read_into(out) == 3 and out.tolist() == [11, 12, 13, 0, 0]
+
+
+def test_discard_drops_buffered_audio_from_any_thread():
+    ring = AudioRing(8)
+    ring.write(np.ones(6, dtype=np.float32))
+    threading.Thread(target=ring.discard).start()
+    time.sleep(0.05)
+
+    out = np.empty(4, dtype=np.float32)
+    assert ring.readable() == 0 and ring.writable() == 8
+    assert ring.read_into(out) == 0 and not out.any()
+    ring.write(np.full(3, 2, dtype=np.float32))
+    assert ring.read_into(out) == 3 and out.tolist() == [2, 2, 2, 0]
+
+
+def test_concurrent_producer_and_consumer_keep_every_sample_in_order():
+    total = 50_000
+    ring = AudioRing(1031)
+    source = np.arange(total, dtype=np.float32)   # exact in float32 below 2**24
+    received = np.empty(total, dtype=np.float32)
+
+    def produce():
+        rng = np.random.default_rng(0)
+        at = 0
+        while at < total:
+            n = ring.write(source[at:at + int(rng.integers(1, 300))])
+            at += n
+            if not n:
+                time.sleep(0)   # ring full: let the consumer run
+
+    def consume():
+        got, blocks = 0, [1, 7, 32, 64]
+        out = np.empty(64, dtype=np.float32)
+        i = 0
+        while got < total:
+            view = out[:blocks[i % len(blocks)]]
+            n = ring.read_into(view)
+            received[got:got + n] = view[:n]
+            got += n
+            i += 1
+            if not n:
+                time.sleep(0)
+
+    threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=30)
+    assert not any(t.is_alive() for t in threads)
+    assert np.array_equal(received, source)
+
+
+class StubResult:
+    def __init__(self, audio):
+        self.audio = audio
+
+
+class StubModel:
+    """Yields three ramps per text, slowly enough to starve a fast consumer."""
+
+    def __init__(self):
+        self.next_value = 1
+
+    def generate(self, text, **kwargs):
+        for _ in range(3):
+            time.sleep(0.02)
+            ramp = np.arange(self.next_value, self.next_value + 500, dtype=np.float32) / 1e4
+            self.next_value += 500
+            yield StubResult(ramp)
+
+
+@pytest.fixture
+def no_device_drain(monkeypatch):
+    """The test plays the part of the audio device, so the playback thread must not drain the ring."""
+    monkeypatch.setattr(BufferedSpeaker, "_drain_without_device", lambda self, scratch: None)
+
+
+def test_callback_at_small_blocks_plays_everything_and_counts_underruns(no_device_drain):
+    speaker = BufferedSpeaker(model=StubModel(), ring_seconds=0.01, sr=24000)
+    out = np.empty((32, 1), dtype=np.float32)
+
+    speaker._audio_callback(out, 32, None, None)
+    assert speaker.underruns == 0   # nothing was expected yet
+
+    started, events = [], []
+    speaker.subscribe(lambda e: events.append(e) if e.kind != UNDERRUN else None)
+    speaker.feed("one", callback=lambda: started.append("one"))
+    speaker.feed("two", callback=lambda: started.append("two"))
+    played = []
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline and not (events and events[-1].kind == END_OF_QUEUE):
+        speaker._audio_callback(out, 32, None, None)
+        played.extend(out[out[:, 0] != 0, 0].tolist())
+        time.sleep(0.0005)
+    assert speaker.events.wait_idle(timeout=1)
+
+    expected = (np.arange(1, 3001, dtype=np.float32) / 1e4).tolist()
+    assert played == expected
+    assert started == ["one", "two"]
+    assert [(e.kind, e.chunk and e.chunk.text) for e in events] == [
+        (CHUNK_STARTED, "one"), (CHUNK_FINISHED, "one"),
+        (CHUNK_STARTED, "two"), (CHUNK_FINISHED, "two"),
+        (END_OF_QUEUE, None),
+    ]
+    assert [e.position for e in events[:4]] == [0, 1500, 1500, 3000]
+    stats = speaker.playback_stats()
+    assert stats["underruns"] > 0 and stats["blocks"] > len(expected) // 32
+    assert stats["buffered_seconds"] == 0
+
+
+def test_discarded_chunks_post_no_events(no_device_drain):
+    speaker = BufferedSpeaker(model=StubModel(), ring_seconds=1.0, sr=24000)
+    events = []
+    speaker.subscribe(events.append)
+    speaker.feed("one", callback=lambda: events.append("callback"))
+    deadline = time.monotonic() + 5
+    while not (speaker._spans and speaker._spans[-1][1] is not None) and time.monotonic() < deadline:
+        time.sleep(0.01)   # wait until all of "one" is in the ring
+
+    speaker._ring.discard()   # as stop() does, with the callback running before the spans are cleared
+    out = np.empty((32, 1), dtype=np.float32)
+    speaker._audio_callback(out, 32, None, None)
+    assert speaker.events.wait_idle(timeout=1)
+    assert events == [] and not speaker._spans and not out.any()
+
+
+def test_without_a_device_audio_is_dropped_and_playback_goes_idle():
+    speaker = BufferedSpeaker(model=StubModel(), sr=24000)
+    kinds, started = [], []
+    speaker.subscribe(lambda e: kinds.append(e.kind))
+    speaker.feed("one", callback=lambda: started.append("one"))
+    speaker.feed("two", callback=lambda: started.append("two"))
+
+    assert speaker.wait_until_idle(timeout=5)
+    deadline = time.monotonic() + 5
+    while END_OF_QUEUE not in kinds and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert speaker.events.wait_idle(timeout=1)
+    assert started == ["one", "two"]
+    assert [k for k in kinds if k != UNDERRUN] == [CHUNK_STARTED, CHUNK_FINISHED] * 2 + [END_OF_QUEUE]
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from sample_code.book_index import MANIFEST_NAME, load_manifest
+from sample_code.reader import BookReader
+
+
+def make_book(root):
+    scenes_dir = root / "scenes"
+    for ch in (1, 2):
+        ch_dir = scenes_dir / f"ch{ch:02d}"
+        ch_dir.mkdir(parents=True)
+        for sc in (1, 2):
+            (ch_dir / f"scene{sc}.md").write_text(
+                f"# Title {ch}-{sc}\nFirst sentence here. Second one!", encoding="utf-8"
+            )
+    return scenes_dir
+
+
+def test_first_open_writes_index(tmp_path):
+    scenes_dir = make_book(tmp_path)
+
+    BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+    data = json.loads((scenes_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    first = data["scenes"][0]
+    assert first["path"] == "ch01/scene1.md"
+    assert (first["chapter"], first["scene"], first["title"]) == (1, 1, "Title 1-1")
+    assert first["sentences"] == 3
+    assert first["words"] == 7
+    assert first["size"] == (scenes_dir / "ch01" / "scene1.md").stat().st_size
+
+
+def test_reopen_uses_index_without_scanning_or_opening_scenes(tmp_path, monkeypatch):
+    scenes_dir = make_book(tmp_path)
+    progress = tmp_path / "progress.json"
+    reader = BookReader(scenes_dir, progress_file=progress)
+    reader.go_to(2, 2)
+    reader.flush_progress()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("scene tree should not be rescanned")
+
+    monkeypatch.setattr(BookReader, "_walk_scene_tree", fail)
+    monkeypatch.setattr("builtins.open", fail)
+    reopened = BookReader(scenes_dir, progress_file=progress)
+
+    assert [(s.chapter, s.scene) for s in reopened._scenes] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+    assert reopened.current.title() == "Title 2-2"
+    assert reopened.current.sentence_count == 3
+
+
+def test_added_scene_invalidates_index(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+    (scenes_dir / "ch02" / "scene3.md").write_text("# Late\nAdded later.", encoding="utf-8")
+
+    assert load_manifest(scenes_dir) is None
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+    assert len(reader._scenes) == 5
+    assert load_manifest(scenes_dir) is not None
+
+
+def test_new_chapter_folder_invalidates_index(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+    (scenes_dir / "ch03").mkdir()
+
+    assert load_manifest(scenes_dir) is None
+
+
+@pytest.mark.parametrize("content", ["not json", '{"version": 0}'])
+def test_corrupt_index_falls_back_to_scan(tmp_path, content):
+    scenes_dir = make_book(tmp_path)
+    (scenes_dir / MANIFEST_NAME).write_text(content, encoding="utf-8")
+
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+    assert len(reader._scenes) == 4
@@ -0,0 +1,61 @@
+import json
+
+from sample_code.bulk_import import MANIFEST_NAME, collect_sources, import_library
+from sample_code.reader import BookReader
+
+
+def book(title, chapters):
+    body = "".join(f"CHAPTER {n}\n\n{title} chapter {n} text.\n\n" for n in range(1, chapters + 1))
+    return f"*** START OF THE PROJECT GUTENBERG EBOOK {title} ***\n\n{body}*** END OF THE PROJECT GUTENBERG EBOOK ***\n"
+
+
+def make_books(root):
+    (root / "a").mkdir(parents=True)
+    (root / "b").mkdir()
+    (root / "a" / "alpha.txt").write_text(book("Alpha", 2), encoding="utf-8")
+    (root / "a" / "beta.txt").write_text(book("Beta", 3), encoding="utf-8")
+    (root / "b" / "alpha.txt").write_text(book("Other alpha", 1), encoding="utf-8")
+    (root / "b" / "broken.txt.gz").write_bytes(b"not gzip data")
+    (root / "b" / "notes.md").write_text("not a book", encoding="utf-8")
+
+
+def test_collects_books_from_directories_and_globs(tmp_path):
+    make_books(tmp_path / "src")
+
+    from_dir = collect_sources([str(tmp_path / "src")])
+    from_glob = collect_sources([str(tmp_path / "src" / "*" / "alpha.txt"), str(tmp_path / "src" / "a")])
+
+    assert [p.name for p in from_dir] == ["alpha.txt", "beta.txt", "alpha.txt", "broken.txt.gz"]
+    assert [p.name for p in from_glob] == ["alpha.txt", "beta.txt", "alpha.txt"]
+
+
+def test_imports_in_parallel_and_records_failures(tmp_path):
+    make_books(tmp_path / "src")
+    library = tmp_path / "library"
+
+    summary = import_library([str(tmp_path / "src")], library, workers=2)
+
+    assert (summary["imported"], summary["failed"], summary["skipped"]) == (3, 1, 0)
+    manifest = json.loads((library / MANIFEST_NAME).read_text(encoding="utf-8"))["books"]
+    by_output = {rec["output"]: rec for rec in manifest.values()}
+    assert sorted(by_output) == ["alpha", "alpha-2", "beta", "broken"]
+    assert by_output["beta"]["scenes"] == by_output["beta"]["chapters"] == 3
+    assert by_output["broken"]["status"] == "error" and "gzip" in by_output["broken"]["error"].lower()
+    assert all(rec["seconds"] >= 0 for rec in manifest.values())
+
+    reader = BookReader(library / "beta", progress_file=tmp_path / "progress.json")
+    assert "Beta chapter 1 text." in reader.current.text()
+
+
+def test_rerun_resumes_with_only_new_or_changed_books(tmp_path):
+    make_books(tmp_path / "src")
+    library = tmp_path / "library"
+    import_library([str(tmp_path / "src")], library, workers=1)
+
+    (tmp_path / "src" / "a" / "beta.txt").write_text(book("Beta", 4), encoding="utf-8")
+    (tmp_path / "src" / "a" / "gamma.txt").write_text(book("Gamma", 1), encoding="utf-8")
+    summary = import_library([str(tmp_path / "src")], library, workers=1)
+
+    statuses = {rec["output"]: rec["status"] for rec in summary["books"].values()}
+    assert statuses == {"alpha": "skipped", "alpha-2": "skipped", "beta": "ok", "gamma": "ok", "broken": "error"}
+    assert summary["books"][str((tmp_path / "src" / "a" / "beta.txt").resolve())]["scenes"] == 4
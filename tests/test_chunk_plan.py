@@ -0,0 +1,101 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from sample_code.chunk_plan import PLAN_NAME, ChunkPlan, group_sentences, load_plan
+from sample_code.reader import BookReader, Scene
+
+SAMPLE_SCENES = Path(__file__).resolve().parents[1] / "sample_book" / "scenes"
+
+
+def make_book(root):
+    scenes_dir = root / "scenes"
+    texts = {
+        (1, 1): "Alpha sentence. Beta sentence. Gamma sentence.",
+        (1, 2): "---",   # no speakable sentences
+        (2, 1): "Delta sentence.",
+    }
+    for (ch, sc), text in texts.items():
+        ch_dir = scenes_dir / f"ch{ch:02d}"
+        ch_dir.mkdir(parents=True, exist_ok=True)
+        (ch_dir / f"scene{sc}.md").write_text(text, encoding="utf-8")
+    return scenes_dir
+
+
+def walk_chunks(reader, max_chars):
+    chunks = []
+    while (chunk := reader.get_next_chunk(max_chars=max_chars)) is not None:
+        chunks.append(chunk)
+    return chunks
+
+
+def test_group_sentences_counts_joining_spaces():
+    assert list(group_sentences([5, 5, 5], 11)) == [(0, 2), (2, 3)]
+    assert list(group_sentences([5, 5, 5], 10)) == [(0, 1), (1, 2), (2, 3)]
+    assert list(group_sentences([50], 10)) == [(0, 1)]
+    assert list(group_sentences([], 10)) == []
+
+
+def test_plan_matches_sequential_chunking_on_sample_book(tmp_path):
+    scenes_dir = tmp_path / "scenes"
+    shutil.copytree(SAMPLE_SCENES, scenes_dir)
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+    plan = reader.chunk_plan(300)
+
+    walker = BookReader(scenes_dir, progress_file=tmp_path / "other.json")
+    expected = walk_chunks(walker, 300)
+    assert [reader.chunk_text(plan, i) for i in range(len(plan))] == expected
+
+
+def test_chunk_ids_map_to_scene_ranges_and_back(tmp_path):
+    reader = BookReader(make_book(tmp_path), progress_file=tmp_path / "progress.json")
+
+    plan = reader.chunk_plan(20)
+
+    assert [plan.chunk(i) for i in range(len(plan))] == [(0, 0, 1), (0, 1, 2), (0, 2, 3), (2, 0, 1)]
+    assert list(plan.scene_chunks(1)) == []
+    assert plan.locate(0, 2) == 2
+    assert plan.locate(1, 0) == 3      # empty scene → next chunk
+    assert plan.locate(2, 5) is None   # past the end of the book
+    with pytest.raises(IndexError):
+        plan.chunk(len(plan))
+
+
+def test_seek_chunk_moves_position_without_replaying(tmp_path):
+    reader = BookReader(make_book(tmp_path), progress_file=tmp_path / "progress.json")
+    plan = reader.chunk_plan(20)
+
+    scene = reader.seek_chunk(plan, 3)
+
+    assert (scene.chapter, scene.scene, reader.current_sentence_index) == (2, 1, 0)
+    assert reader.current_chunk_id(plan) == 3
+    assert reader.get_next_chunk(max_chars=20) == "Delta sentence."
+
+
+def test_plan_is_cached_on_disk_and_rebuilt_when_a_scene_changes(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+    plan = reader.chunk_plan(20)
+    reader.chunk_plan(500)
+
+    data = json.loads((scenes_dir / PLAN_NAME).read_text(encoding="utf-8"))
+    assert sorted(data["plans"]) == ["20", "500"]
+
+    reopened = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Scene, "sentences", None)   # building would fail; the plan must be loaded
+        cached = reopened.chunk_plan(20)
+    assert (cached.starts, cached.ends, cached.scene_first) == (plan.starts, plan.ends, plan.scene_first)
+
+    scene = scenes_dir / "ch02" / "scene1.md"
+    scene.write_text("Delta sentence. Epsilon sentence.", encoding="utf-8")
+    os.utime(scene, ns=(1, 1))
+    assert load_plan(scenes_dir, 20, plan.signature) is not None
+    rebuilt = BookReader(scenes_dir, progress_file=tmp_path / "progress.json").chunk_plan(20)
+    assert rebuilt.signature != plan.signature
+    assert len(rebuilt) == len(plan) + 1
+    assert isinstance(rebuilt, ChunkPlan)
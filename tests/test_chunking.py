@@ -0,0 +1,44 @@
+import pytest
+
+from sample_code.chunking import ChunkPlanner
+from sample_code.reader import BookReader
+
+
+def test_budgets_start_with_one_sentence_then_grow_to_ceiling():
+    planner = ChunkPlanner(first_chars=100, growth=2.0, max_chars=500)
+
+    assert [planner.next_budget() for _ in range(6)] == [0, 100, 200, 400, 500, 500]
+
+    planner.reset()
+    assert planner.next_budget() == 0
+
+
+def test_from_settings_fills_defaults():
+    planner = ChunkPlanner.from_settings({"max_chars": 300})
+
+    assert planner.max_chars == 300
+    assert planner.first_chars > 0
+
+
+@pytest.mark.parametrize("kwargs", [{"first_chars": 0}, {"max_chars": 0}, {"growth": 0.5}])
+def test_invalid_settings_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        ChunkPlanner(**kwargs)
+
+
+def test_first_chunk_is_a_single_sentence(tmp_path):
+    scenes_dir = tmp_path / "scenes"
+    (scenes_dir / "ch01").mkdir(parents=True)
+    body = " ".join(f"Sentence number {i} is here." for i in range(40))
+    (scenes_dir / "ch01" / "scene1.md").write_text(body, encoding="utf-8")
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+    planner = ChunkPlanner(first_chars=60, growth=2.0, max_chars=200)
+
+    chunks = []
+    while (chunk := planner.next_chunk(reader)) is not None:
+        chunks.append(chunk)
+
+    assert chunks[0] == "Sentence number 0 is here."
+    assert len(chunks[1]) <= 60
+    assert len(chunks[2]) > len(chunks[1])
+    assert " ".join(chunks) == body
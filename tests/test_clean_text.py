@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+from manual_tests.clean_text_reference import reference_clean_text
+from sample_code.reader import _clean_text
+
+SAMPLE_BOOK = Path(__file__).resolve().parents[1] / "sample_book"
+
+
+EDGE_CASES = [
+    "",
+    "\n\n\n",
+    "# Heading\nBody",
+    "#\nnot a heading",
+    "####### seven hashes",
+    "#\x1fodd space",
+    "_[stage\ndirection]_ spans lines",
+    "_open emphasis\nclosed_ on the next line",
+    "**bold\nacross** lines",
+    "[Illustration: one\ntwo]",
+    "(_Mem._ note\ncontinues)",
+    "(_mem._ lower case)",
+    "dash--dash---dash\n--\n---",
+    "crlf line\r\nnext\rold mac unicode\x0bvt\x0cff\x1cfs\x85nel",
+    "a\n\n\n\nb\r\n\r\n\r\n\r\nc",
+    "___triple___ and __double__ and _single_",
+    "*a* **b** ***c*** *unclosed",
+    "_3 May. Bistritz._--Left Munich at 8:35 P. M.",
+    "   leading and trailing   \n\n",
+]
+
+
+@pytest.mark.parametrize("raw", EDGE_CASES)
+def test_clean_text_matches_reference_on_edge_cases(raw):
+    assert _clean_text(raw) == reference_clean_text(raw)
+
+
+def test_clean_text_matches_reference_on_sample_scenes():
+    paths = sorted((SAMPLE_BOOK / "scenes").rglob("*.md"))
+    assert paths
+    for path in paths:
+        raw = path.read_text(encoding="utf-8")
+        assert _clean_text(raw) == reference_clean_text(raw), path
+
+
+def test_clean_text_matches_reference_on_full_book():
+    raw = (SAMPLE_BOOK / "dracula.txt").read_text(encoding="utf-8")
+
+    assert _clean_text(raw) == reference_clean_text(raw)
@@ -0,0 +1,91 @@
+import threading
+
+from sample_code.reader import BookReader
+
+
+def make_book(tmp_path):
+    scenes_dir = tmp_path / "scenes"
+    for ch in (1, 2, 3):
+        (scenes_dir / f"ch0{ch}").mkdir(parents=True)
+        (scenes_dir / f"ch0{ch}" / "scene1.md").write_text(
+            " ".join(f"Chapter {ch} sentence {n}." for n in range(1, 6)), encoding="utf-8"
+        )
+    (scenes_dir / "ch02" / "scene2.md").write_text("", encoding="utf-8")
+    return scenes_dir
+
+
+def all_chunks(source, max_chars):
+    chunks = []
+    while (chunk := source.get_next_chunk(max_chars=max_chars)) is not None:
+        chunks.append(chunk)
+    return chunks
+
+
+def test_cursor_yields_the_readers_chunks_without_moving_it(tmp_path):
+    progress = tmp_path / "progress.json"
+    reader = BookReader(make_book(tmp_path), progress_file=progress)
+    reader.go_to(1, 1, 2)
+    reader.flush_progress()
+    saved = progress.read_bytes()
+
+    cursor = reader.cursor()
+    from_cursor = all_chunks(cursor, 50)
+
+    assert (reader.current.chapter, reader.current_sentence_index) == (1, 2)
+    assert progress.read_bytes() == saved
+    assert from_cursor == all_chunks(reader, 50)
+
+
+def test_cursors_are_independent_across_threads(tmp_path):
+    reader = BookReader(make_book(tmp_path), progress_file=tmp_path / "progress.json")
+    expected = all_chunks(reader.cursor(), 40)
+    results = [None] * 4
+
+    def consume(slot):
+        results[slot] = all_chunks(reader.cursor(), 40)
+
+    threads = [threading.Thread(target=consume, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [expected] * 4
+    assert reader.cursor().position == (0, 0)
+
+
+def test_cursor_plan_matches_chunks_and_survives_refresh(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+    cursor = reader.cursor()
+    plan = cursor.chunk_plan(40)
+    assert plan is reader.chunk_plan(40)
+    assert [cursor.chunk_text(plan, i) for i in range(len(plan))] == all_chunks(reader.cursor(), 40)
+
+    (scenes_dir / "ch03" / "scene1.md").unlink()
+    reader.refresh()
+    assert len(cursor.scenes) == 4 and len(reader.cursor().scenes) == 3
+    assert cursor.seek_chunk(plan, len(plan) - 1).chapter == 3   # the snapshot is unchanged
+
+
+def test_chunk_text_resumes_inside_a_chunk(tmp_path):
+    reader = BookReader(make_book(tmp_path), progress_file=tmp_path / "progress.json")
+    reader.go_to(1, 1, 2)
+    cursor = reader.cursor()
+    plan = cursor.chunk_plan(1000)
+    chunk_id = cursor.current_chunk_id(plan)
+
+    assert cursor.chunk_text(plan, chunk_id).startswith("Chapter 1 sentence 1.")
+    assert cursor.chunk_text(plan, chunk_id, cursor.sentence_index) == (
+        "Chapter 1 sentence 3. Chapter 1 sentence 4. Chapter 1 sentence 5."
+    )
+
+
+def test_go_to_scene_follows_a_cursor(tmp_path):
+    reader = BookReader(make_book(tmp_path), progress_file=tmp_path / "progress.json")
+    cursor = reader.cursor()
+    cursor.get_next_chunk(max_chars=1000)
+    cursor.get_next_chunk(max_chars=1000)
+
+    assert reader.go_to_scene(cursor.current, cursor.sentence_index).chapter == 2
+    assert reader.current_sentence_index == cursor.sentence_index
@@ -0,0 +1,90 @@
+import sqlite3
+import threading
+
+from sample_code.library import Library
+from sample_code.progress import write_json_atomic
+from sample_code.reader import BookReader
+
+
+def make_book(root, name="book"):
+    scenes_dir = root / name
+    for ch in (1, 2):
+        (scenes_dir / f"ch0{ch}").mkdir(parents=True)
+        (scenes_dir / f"ch0{ch}" / "scene1.md").write_text(
+            f"Chapter {ch} one. Chapter {ch} two. Chapter {ch} three.", encoding="utf-8"
+        )
+    return scenes_dir
+
+
+def test_progress_for_several_books(tmp_path):
+    library = Library(tmp_path / "library.sqlite3")
+    first = BookReader(make_book(tmp_path, "first"), library=library)
+    second = BookReader(make_book(tmp_path, "second"), library=library)
+
+    first.next_scene()
+    second.current_sentence_index = 2
+    second.save_progress()
+    second.flush_progress()
+
+    assert BookReader(first.scenes_dir, library=library).current.chapter == 2
+    assert BookReader(second.scenes_dir, library=library).current_sentence_index == 2
+    books = library.books()
+    assert {b["title"] for b in books} == {"first", "second"}
+    assert all(b["scene_count"] == 2 and b["chapter_count"] == 2 for b in books)
+
+
+def test_library_uses_wal_and_shares_across_connections(tmp_path):
+    path = tmp_path / "library.sqlite3"
+    library = Library(path)
+    library.save_progress({"book": "/books/a", "index": 3, "sentence_index": 1})
+
+    other = Library(path)   # e.g. the CLI while the GUI is open
+    assert other.progress("/books/a")["index"] == 3
+    assert sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    results = []
+    thread = threading.Thread(target=lambda: results.append(library.progress("/books/a")))
+    thread.start()
+    thread.join()
+    assert results[0]["sentence_index"] == 1
+
+
+def test_bookmarks_and_notes(tmp_path):
+    library = Library(tmp_path / "library.sqlite3")
+    reader = BookReader(make_book(tmp_path), library=library)
+
+    reader.go_to(2, 1, 1)
+    reader.save_bookmark("later")
+    reader.add_note("First note")
+    reader.add_note("Second note")
+    reader.go_to(1, 1)
+
+    assert [m["name"] for m in reader.bookmarks()] == ["later"]
+    assert reader.restore_bookmark("later")
+    assert (reader.current.chapter, reader.current_sentence_index) == (2, 1)
+    assert not reader.restore_bookmark("missing")
+    assert [n["text"] for n in reader.notes(limit=1)] == ["Second note"]
+    assert reader.notes()[0]["label"] == reader.current.label
+
+    library.forget_book(reader._book_key)
+    assert library.bookmarks(reader._book_key) == []
+    assert library.notes(reader._book_key) == []
+
+
+def test_legacy_progress_file_is_imported_once(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    legacy = tmp_path / "progress.json"
+    write_json_atomic(legacy, {"book": str(scenes_dir.resolve()), "index": 1, "sentence_index": 2})
+    library = Library(tmp_path / "library.sqlite3")
+
+    assert library.import_progress_file(legacy)
+    assert not library.import_progress_file(legacy)
+    reader = BookReader(scenes_dir, library=library)
+    assert (reader.current.chapter, reader.current_sentence_index) == (2, 2)
+
+
+def test_settings_round_trip(tmp_path):
+    library = Library(tmp_path / "library.sqlite3")
+    assert library.setting("gui_session") is None
+    library.set_setting("gui_session", {"scenes_dir": "/books/a", "index": 4})
+    assert Library(library.path).setting("gui_session")["index"] == 4
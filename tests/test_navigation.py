@@ -78,3 +78,60 @@ def test_chapter_navigation(tmp_path):
     assert reader.prev_chapter() is None
     assert reader.current.chapter == 1
     assert reader.current.scene == 1
+
+
+class _NoScan(list):
+    """Scene list that fails if navigation falls back to a linear scan."""
+
+    def __iter__(self):
+        raise AssertionError("navigation scanned the scene list")
+
+
+def test_navigation_uses_index_not_scans(tmp_path):
+    scenes_dir = tmp_path / "scenes"
+    for ch, count in ((1, 2), (3, 3)):
+        ch_dir = scenes_dir / f"ch{ch:02d}"
+        ch_dir.mkdir(parents=True)
+        for sc in range(1, count + 1):
+            (ch_dir / f"scene{sc}.md").write_text(f"# {ch}-{sc}\nText.", encoding="utf-8")
+
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+    reader._scenes = _NoScan(reader._scenes)
+
+    assert reader._chapter_count() == 2
+    assert reader.go_to(3, 2).scene == 2
+    assert reader.go_to(2, 1) is None
+    assert reader.prev_chapter().scene == 1          # start of chapter 3
+    assert reader.prev_chapter() is None             # chapter 2 does not exist
+    reader.go_to(1, 2)
+    assert (reader.next_chapter().chapter, reader.current.scene) == (3, 1)
+    assert reader.next_chapter() is None
+
+
+def test_scene_index_jumps_do_not_scan_large_books():
+    from types import SimpleNamespace
+
+    from sample_code.reader import SceneIndex
+
+    class CountingList(list):
+        reads = 0
+
+        def __getitem__(self, i):
+            CountingList.reads += 1
+            return super().__getitem__(i)
+
+    scenes = [SimpleNamespace(chapter=i // 10 + 1, scene=i % 10 + 1) for i in range(50_000)]
+    index = SceneIndex(scenes)
+    index.chapter_starts = CountingList(index.chapter_starts)
+
+    lookups = 0
+    for i in range(0, 50_000, 5):
+        assert index.positions[(scenes[i].chapter, scenes[i].scene)] == i
+        assert index.chapter_start(i) == i - i % 10
+        nxt = index.next_chapter_start(i)
+        assert nxt == (i - i % 10 + 10 if i < 49_990 else None)
+        lookups += 2
+
+    assert index.chapter_count == 5_000
+    # Bisection reads about log2(5000) ≈ 13 entries per lookup; a scan would read thousands.
+    assert CountingList.reads <= lookups * 16
@@ -0,0 +1,84 @@
+import builtins
+
+import pytest
+
+from sample_code.packed_book import PackedBook, write_pack
+from sample_code.reader import BookReader
+from sample_code.splitter import BookSplitter
+
+BOOK = """*** START OF THE PROJECT GUTENBERG EBOOK TEST ***
+
+CHAPTER I
+
+_3 May. Bistritz._--Left Munich at 8:35 P. M. The *train* was late.
+
+_4 May._--I found that my landlord had got a letter.
+
+CHAPTER II
+
+Ünïcode survives the round trip. Second sentence here!
+
+*** END OF THE PROJECT GUTENBERG EBOOK TEST ***
+"""
+
+
+def entry(ch, sc, text, title):
+    return {"path": f"ch{ch:02d}/scene{sc}.md", "chapter": ch, "scene": sc, "name": None,
+            "title": title, "sentences": 1, "words": len(text.split()), "text": text}
+
+
+def test_pack_round_trips_texts_and_metadata(tmp_path):
+    target = write_pack(tmp_path / "book.tbrpack", [entry(1, 1, "Héllo there.", "One"), entry(2, 1, "", "Two")])
+
+    book = PackedBook(target)
+
+    assert len(book) == 2
+    assert book.text(0) == "Héllo there."
+    assert book.text(1) == ""
+    assert book.entries[1]["title"] == "Two"
+    assert "text" not in book.entries[0]
+
+
+def test_rejects_files_that_are_not_packs(tmp_path):
+    bogus = tmp_path / "bogus.tbrpack"
+    bogus.write_bytes(b"not a packed book at all, definitely not")
+
+    with pytest.raises(ValueError):
+        PackedBook(bogus)
+
+
+def test_splitter_pack_matches_scene_folder(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    splitter = BookSplitter(verbose=False)
+    pack = splitter.split_book(source, tmp_path / "book.tbrpack")
+    folder = splitter.split_book(source, tmp_path / "scenes")
+
+    packed = BookReader(pack, progress_file=tmp_path / "p1.json")
+    loose = BookReader(folder, progress_file=tmp_path / "p2.json")
+
+    assert len(packed._scenes) == len(loose._scenes) == 4
+    for a, b in zip(packed._scenes, loose._scenes):
+        assert (a.chapter, a.scene, a.title()) == (b.chapter, b.scene, b.title())
+        assert a.text() == b.text()
+        assert a.sentence_count == len(b.sentences())
+    assert packed.chunk_plan(200).key(0) != loose.chunk_plan(200).key(0)
+
+
+def test_packed_reader_never_opens_scene_files(tmp_path, monkeypatch):
+    source = tmp_path / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    pack = BookSplitter(verbose=False).split_book(source, tmp_path / "book.tbrpack")
+    real_open = builtins.open
+
+    def guarded_open(file, *args, **kwargs):
+        if str(file).endswith(".md"):
+            raise AssertionError(f"opened scene file {file}")
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", guarded_open)
+    reader = BookReader(pack, progress_file=tmp_path / "progress.json")
+
+    reader.go_to(2, 1)
+    assert reader.get_next_chunk() == "CHAPTER II Ünïcode survives the round trip. Second sentence here!"
+    assert reader.notes_file == tmp_path / "book.notes.txt"
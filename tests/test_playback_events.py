@@ -0,0 +1,66 @@
+import threading
+import time
+
+from sample_code.playback_events import CHUNK_STARTED, UNDERRUN, EventDispatcher, PlaybackEvent
+
+
+def test_events_are_delivered_in_order_on_one_thread():
+    dispatcher = EventDispatcher()
+    seen, threads = [], set()
+
+    def record(event):
+        seen.append(event.position)
+        threads.add(threading.get_ident())
+
+    dispatcher.subscribe(record)
+    for i in range(200):
+        assert dispatcher.post(PlaybackEvent(CHUNK_STARTED, position=i))
+    assert dispatcher.wait_idle(timeout=2)
+    dispatcher.close()
+
+    assert seen == list(range(200))
+    assert len(threads) == 1 and threading.get_ident() not in threads
+
+
+def test_idle_dispatcher_sleeps_until_posted_to_and_closes_promptly():
+    dispatcher = EventDispatcher()
+    seen = []
+    dispatcher.subscribe(seen.append)
+    time.sleep(0.05)
+    assert not dispatcher._wake.is_set()   # blocked on the event, not polling
+
+    dispatcher.post(PlaybackEvent(UNDERRUN, position=7))
+    assert dispatcher.wait_idle(timeout=1) and [e.position for e in seen] == [7]
+    dispatcher.close()
+    assert not dispatcher._thread.is_alive()
+
+
+def test_full_queue_drops_instead_of_blocking():
+    dispatcher = EventDispatcher(max_events=4)
+    gate = threading.Event()
+    dispatcher.subscribe(lambda e: gate.wait(2))
+    dispatcher.post(PlaybackEvent(UNDERRUN))
+    time.sleep(0.05)   # the dispatch thread is now blocked in the handler
+
+    posted = [dispatcher.post(PlaybackEvent(UNDERRUN, position=i)) for i in range(6)]
+    gate.set()
+    assert dispatcher.wait_idle(timeout=2)
+    dispatcher.close()
+    assert posted == [True] * 4 + [False] * 2 and dispatcher.dropped == 2
+
+
+def test_failing_subscriber_and_kind_filter():
+    dispatcher = EventDispatcher()
+    started = []
+
+    def boom(event):
+        raise RuntimeError("boom")
+
+    dispatcher.subscribe(boom)
+    dispatcher.subscribe(lambda e: started.append(e.position), kinds=(CHUNK_STARTED,))
+    dispatcher.post(PlaybackEvent(UNDERRUN, position=1))
+    dispatcher.post(PlaybackEvent(CHUNK_STARTED, position=2))
+    assert dispatcher.wait_idle(timeout=2)
+    dispatcher.unsubscribe(boom)
+    dispatcher.close()
+    assert started == [2]
@@ -0,0 +1,84 @@
+import json
+import threading
+import time
+
+from sample_code.progress import ProgressJournal, read_json_locked, write_json_atomic
+from sample_code.reader import BookReader
+
+
+def test_write_json_atomic_replaces_without_leftovers(tmp_path):
+    target = tmp_path / "progress.json"
+
+    write_json_atomic(target, {"index": 1})
+    write_json_atomic(target, {"index": 2})
+
+    assert read_json_locked(target) == {"index": 2}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_read_json_locked_ignores_corrupt_files(tmp_path):
+    target = tmp_path / "progress.json"
+    target.write_text("{not json", encoding="utf-8")
+
+    assert read_json_locked(target) is None
+    assert read_json_locked(tmp_path / "missing.json") is None
+
+
+def test_journal_coalesces_bursts_into_one_write(tmp_path):
+    writes = []
+    journal = ProgressJournal(delay=0.05, writer=lambda target, data: writes.append((target, data)))
+    target = tmp_path / "progress.json"
+
+    for i in range(100):
+        journal.submit(target, {"index": i})
+    deadline = time.monotonic() + 2
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    journal.flush()
+
+    assert writes == [(target, {"index": 99})]
+
+
+def test_journal_flush_writes_pending_data_and_builds_callables(tmp_path):
+    journal = ProgressJournal(delay=60)
+    target = tmp_path / "progress.json"
+
+    journal.submit(target, lambda: {"index": 7})
+    assert not target.exists()
+    journal.flush(target)
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"index": 7}
+    assert journal.pending() == 0
+
+
+def test_concurrent_writers_never_tear_the_file(tmp_path):
+    target = tmp_path / "progress.json"
+
+    def hammer(n):
+        for i in range(20):
+            write_json_atomic(target, {"writer": n, "i": i, "pad": "x" * 1000})
+
+    threads = [threading.Thread(target=hammer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert read_json_locked(target)["i"] == 19
+
+
+def test_navigation_does_not_write_synchronously(tmp_path, monkeypatch):
+    scenes_dir = tmp_path / "scenes"
+    (scenes_dir / "ch01").mkdir(parents=True)
+    for sc in (1, 2):
+        (scenes_dir / "ch01" / f"scene{sc}.md").write_text(f"# S{sc}\nText.", encoding="utf-8")
+    progress = tmp_path / "progress.json"
+    reader = BookReader(scenes_dir, progress_file=progress)
+    monkeypatch.setattr("sample_code.reader.PROGRESS_JOURNAL", ProgressJournal(delay=60))
+
+    reader.next_scene()
+    assert not progress.exists()
+
+    reader.flush_progress()
+    data = json.loads(progress.read_text(encoding="utf-8"))
+    assert (data["index"], data["scene_title"]) == (1, "S2")
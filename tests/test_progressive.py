@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+from sample_code.book_index import manifest_path
+from sample_code.reader import BookReader
+
+
+@pytest.fixture
+def held_indexer(monkeypatch):
+    """Hold the background indexer until the test releases it."""
+    release = threading.Event()
+    original = BookReader._index_in_background
+
+    def held(self):
+        release.wait(5)
+        original(self)
+
+    monkeypatch.setattr(BookReader, "_index_in_background", held)
+    yield release
+    release.set()
+
+
+def make_book(tmp_path, chapters=12):
+    scenes_dir = tmp_path / "book"
+    for ch in range(1, chapters + 1):
+        folder = scenes_dir / "part1" / f"ch{ch}"
+        folder.mkdir(parents=True)
+        for sc in (1, 2):
+            (folder / f"scene{sc}.md").write_text(
+                f"Chapter {ch} scene {sc} first. Chapter {ch} scene {sc} second.", encoding="utf-8"
+            )
+    return scenes_dir
+
+
+def test_first_scene_opens_before_indexing_finishes(tmp_path, held_indexer):
+    scenes_dir = make_book(tmp_path)
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json", progressive=True)
+
+    assert reader.indexing
+    assert [sc.rel for sc in reader._scenes] == ["part1/ch1/scene1.md"]   # ch1 sorts before ch10
+    assert reader.current.sentences()[0] == "Chapter 1 scene 1 first."
+    assert not reader.has_changes() and reader.refresh() == {"added": [], "removed": [], "modified": []}
+
+    held_indexer.set()
+    assert reader.wait_for_index(5)
+    assert not reader.indexing
+    assert len(reader._scenes) == 24 and reader._chapter_count() == 12
+    assert reader.current.rel == "part1/ch1/scene1.md"
+    assert manifest_path(scenes_dir).exists()
+
+
+def test_saved_scene_is_resolved_by_path(tmp_path, held_indexer):
+    scenes_dir = make_book(tmp_path)
+    progress = tmp_path / "progress.json"
+    held_indexer.set()
+    reader = BookReader(scenes_dir, progress_file=progress)
+    reader.go_to(7, 2, 1)
+    reader.flush_progress()
+    manifest_path(scenes_dir).unlink()
+    held_indexer.clear()
+
+    reopened = BookReader(scenes_dir, progress_file=progress, progressive=True)
+    assert reopened.indexing
+    assert (reopened.current.chapter, reopened.current.scene, reopened.current_sentence_index) == (7, 2, 1)
+
+    held_indexer.set()
+    reopened.wait_for_index(5)
+    assert (reopened.current.chapter, reopened.current.scene, reopened.current_sentence_index) == (7, 2, 1)
+    assert reopened._index == 13
+
+
+def test_cursor_taken_while_indexing_reads_past_the_first_scene(tmp_path, held_indexer):
+    scenes_dir = make_book(tmp_path, chapters=2)
+    progress = tmp_path / "progress.json"
+    held_indexer.set()
+    first = BookReader(scenes_dir, progress_file=progress)
+    first.go_to(1, 2, 1)
+    first.flush_progress()
+    manifest_path(scenes_dir).unlink()
+    held_indexer.clear()
+
+    reader = BookReader(scenes_dir, progress_file=progress, progressive=True)
+    cursor = reader.cursor()
+    assert reader.indexing and len(cursor.scenes) == 1
+    assert cursor.get_next_chunk(1000) == "Chapter 1 scene 2 second."
+
+    held_indexer.set()
+    assert reader.wait_for_index(5)
+    chunks = []
+    while (chunk := cursor.get_next_chunk(1000)) is not None:
+        chunks.append(chunk)
+    assert chunks == [f"Chapter 2 scene {sc} first. Chapter 2 scene {sc} second." for sc in (1, 2)]
+
+
+def test_partial_results_keep_the_position(tmp_path, monkeypatch):
+    monkeypatch.setattr(BookReader, "PUBLISH_INTERVAL", 0)
+    scenes_dir = make_book(tmp_path)
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json", progressive=True)
+    reader.current_sentence_index = 1
+
+    installs = 0
+    while reader.indexing:
+        installs += reader.update_index()
+        assert reader.current.rel == "part1/ch1/scene1.md"
+        assert reader.current_sentence_index == 1
+    assert installs >= 1
+    assert reader.next_chapter().chapter == 2
+
+
+def test_indexed_book_ignores_progressive(tmp_path):
+    scenes_dir = make_book(tmp_path, chapters=2)
+    BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json", progressive=True)
+    assert not reader.indexing and len(reader._scenes) == 4
@@ -1,6 +1,7 @@
 import pytest
 import json
 from pathlib import Path
+from sample_code.library import Library
 from sample_code.reader import BookReader, Scene, _clean_text
 
 def test_clean_text():
@@ -27,6 +28,21 @@ def test_scene_sentences(tmp_path):
     assert sents[2] == "This is sentence two!"
     assert sents[3] == "And three?"
 
+def test_scenes_are_compact_and_share_the_book_folder(tmp_path):
+    scenes_dir = tmp_path / "scenes"
+    for name in ("scene1.md", "scene2.md"):
+        (scenes_dir / "ch01").mkdir(parents=True, exist_ok=True)
+        (scenes_dir / "ch01" / name).write_text("# S\nText.", encoding="utf-8")
+
+    for _ in range(2):   # scanned, then loaded from the sidecar index
+        reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+        first, second = reader._scenes
+        assert not hasattr(first, "__dict__")
+        assert first._root is second._root
+        assert [sc.rel for sc in reader._scenes] == ["ch01/scene1.md", "ch01/scene2.md"]
+        assert first.path == scenes_dir / "ch01" / "scene1.md"
+        assert first.text() == "S\nText."
+
 def test_reader_navigation(tmp_path):
     # Setup dummy scenes structure
     scenes_dir = tmp_path / "scenes"
@@ -83,6 +99,21 @@ def test_get_next_chunk_reads_single_sentence_book(tmp_path):
     assert reader.get_next_chunk() == "S1 Only sentence."
     assert reader.get_next_chunk() is None
 
+def test_get_next_chunk_is_bounded_for_unpunctuated_text(tmp_path):
+    scenes_dir = tmp_path / "scenes"
+    ch01 = scenes_dir / "ch01"
+    ch01.mkdir(parents=True)
+    run_on = ", ".join(f"and then item {i}" for i in range(1000))
+    (ch01 / "scene1.md").write_text(f"# S1\n{run_on}\nShort. Lines. Here.", encoding="utf-8")
+
+    reader = BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+    chunks = []
+    while (chunk := reader.get_next_chunk(max_chars=300)) is not None:
+        chunks.append(chunk)
+    assert max(len(c) for c in chunks) <= 300
+    assert "".join("".join(chunks).split()) == "".join(f"S1{run_on}Short.Lines.Here.".split())
+
 def test_bookmark_persistence(tmp_path):
     scenes_dir = tmp_path / "scenes"
     ch01 = scenes_dir / "ch01"
@@ -104,6 +135,6 @@ def test_bookmark_persistence(tmp_path):
     reader.save_progress(bkm_file)
     assert bkm_file.exists()
     
-    reader3 = BookReader(scenes_dir)
+    reader3 = BookReader(scenes_dir, library=Library(tmp_path / "library.sqlite3"))
     reader3._restore_progress(bkm_file)
     assert reader3.current_sentence_index == 1
@@ -0,0 +1,137 @@
+import os
+import threading
+
+from sample_code.book_watcher import BookWatcher
+from sample_code.packed_book import write_pack
+from sample_code.reader import BookReader, Scene
+
+
+def make_book(root):
+    scenes_dir = root / "scenes"
+    for ch in (1, 2):
+        ch_dir = scenes_dir / f"ch{ch:02d}"
+        ch_dir.mkdir(parents=True)
+        for sc in (1, 2, 3):
+            (ch_dir / f"scene{sc}.md").write_text(f"# S{ch}-{sc}\nFirst. Second. Third.", encoding="utf-8")
+    return scenes_dir
+
+
+def edit(path, text):
+    path.write_text(text, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def open_reader(scenes_dir, tmp_path):
+    return BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+
+def test_no_changes_is_cheap_and_empty(tmp_path):
+    reader = open_reader(make_book(tmp_path), tmp_path)
+
+    assert not reader.has_changes()
+    assert reader.refresh() == {"added": [], "removed": [], "modified": []}
+
+
+def test_modified_scene_invalidates_only_its_own_cache_entry(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    reader = open_reader(scenes_dir, tmp_path)
+    reader.go_to(1, 2, sentence=3)
+    other = reader._scenes[4]
+    other.text()
+
+    edit(scenes_dir / "ch01" / "scene2.md", "# Renamed\nOnly one now.")
+    assert reader.has_changes()
+    changes = reader.refresh()
+
+    assert changes == {"added": [], "removed": [], "modified": ["ch01/scene2.md"]}
+    assert (reader.current.chapter, reader.current.scene) == (1, 2)
+    assert reader.current.title() == "Renamed"
+    assert reader.current_sentence_index == 2   # clamped to the shorter scene
+    misses = Scene.cache.misses
+    other.text()
+    assert Scene.cache.misses == misses          # untouched scene still cached
+    assert not reader.has_changes()
+
+
+def test_added_and_removed_scenes_keep_position_on_same_scene(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    reader = open_reader(scenes_dir, tmp_path)
+    reader.go_to(2, 1, sentence=1)
+
+    (scenes_dir / "ch01" / "scene4.md").write_text("# New\nAdded text.", encoding="utf-8")
+    (scenes_dir / "ch01" / "scene1.md").unlink()
+    changes = reader.refresh()
+
+    assert changes["added"] == ["ch01/scene4.md"]
+    assert changes["removed"] == ["ch01/scene1.md"]
+    assert (reader.current.chapter, reader.current.scene, reader.current_sentence_index) == (2, 1, 1)
+    assert [(sc.chapter, sc.scene) for sc in reader._scenes] == [(1, 2), (1, 3), (1, 4), (2, 1), (2, 2), (2, 3)]
+    reader.flush_progress()
+    assert open_reader(scenes_dir, tmp_path)._index == 3
+
+
+def test_removing_current_scene_moves_to_the_next_one(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    reader = open_reader(scenes_dir, tmp_path)
+    reader.go_to(1, 3, sentence=2)
+
+    (scenes_dir / "ch01" / "scene3.md").unlink()
+    reader.refresh()
+
+    assert (reader.current.chapter, reader.current.scene, reader.current_sentence_index) == (2, 1, 0)
+
+
+def test_chunk_plans_reuse_rows_of_unchanged_scenes(tmp_path, monkeypatch):
+    scenes_dir = make_book(tmp_path)
+    reader = open_reader(scenes_dir, tmp_path)
+    before = reader.chunk_plan(10)
+    changed = scenes_dir / "ch02" / "scene3.md"
+    real_sentences = Scene.sentences
+
+    def only_changed(self):
+        assert self.path == changed, f"re-read unchanged scene {self.path}"
+        return real_sentences(self)
+
+    edit(changed, "# S2-3\nFirst. Second. Third. Fourth.")
+    monkeypatch.setattr(Scene, "sentences", only_changed)
+    reader.refresh()
+    monkeypatch.setattr(Scene, "sentences", real_sentences)
+
+    after = reader.chunk_plan(10)
+    assert after.signature != before.signature
+    assert len(after) == len(before) + 1
+    fresh = open_reader(scenes_dir, tmp_path)
+    fresh._plans.clear()
+    rebuilt = fresh.chunk_plan(10)
+    assert (after.starts, after.ends, after.scene_first) == (rebuilt.starts, rebuilt.ends, rebuilt.scene_first)
+
+
+def test_rewritten_pack_is_diffed_by_path_and_text(tmp_path):
+    def entry(sc, text):
+        return {"path": f"ch01/scene{sc}.md", "chapter": 1, "scene": sc, "name": None,
+                "title": f"S{sc}", "sentences": 1, "words": 1, "text": text}
+
+    pack = write_pack(tmp_path / "book.tbrpack", [entry(1, "One."), entry(2, "Two."), entry(3, "Three.")])
+    reader = open_reader(pack, tmp_path)
+    reader.go_to(1, 3)
+
+    write_pack(pack, [entry(1, "One."), entry(3, "Three, edited."), entry(4, "Four.")])
+    os.utime(pack, ns=(0, pack.stat().st_mtime_ns + 1_000_000_000))
+    changes = reader.refresh()
+
+    assert changes == {"added": ["ch01/scene4.md"], "removed": ["ch01/scene2.md"], "modified": ["ch01/scene3.md"]}
+    assert reader.current.text() == "Three, edited."
+
+
+def test_watcher_reports_changes(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    reader = open_reader(scenes_dir, tmp_path)
+    fired = threading.Event()
+    watcher = BookWatcher(reader, fired.set, interval=0.01).start()
+    try:
+        assert not fired.wait(0.1)
+        edit(scenes_dir / "ch01" / "scene1.md", "# Changed\nNew text.")
+        assert fired.wait(2)
+    finally:
+        watcher.stop()
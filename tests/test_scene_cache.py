@@ -0,0 +1,65 @@
+import os
+
+from sample_code.reader import Scene
+from sample_code.scene_cache import SceneCache
+
+
+def test_cache_counts_hits_and_misses():
+    cache = SceneCache()
+
+    assert cache.get("a", 1) is None
+    cache.put("a", 1, "text")
+    assert cache.get("a", 1).text == "text"
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used_past_byte_budget():
+    cache = SceneCache(max_bytes=3500)
+    for key in "abc":
+        cache.put(key, 1, key * 1000)
+    cache.get("a", 1)  # touch a so b is the oldest
+
+    cache.put("d", 1, "d" * 1000)
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) is not None
+    assert cache.nbytes <= cache.max_bytes
+    assert cache.stats()["evictions"] >= 1
+
+
+def test_cache_stamp_mismatch_drops_entry():
+    cache = SceneCache()
+    cache.put("a", 1, "old")
+
+    assert cache.get("a", 2) is None
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_sentences_are_charged_to_the_budget():
+    cache = SceneCache()
+    entry = cache.put("a", 1, "One. Two.")
+    before = cache.nbytes
+
+    cache.set_sentences("a", entry, ["One.", "Two."])
+
+    assert cache.nbytes > before
+
+
+def test_scenes_share_cache_and_reload_when_file_changes(tmp_path, monkeypatch):
+    cache = SceneCache()
+    monkeypatch.setattr(Scene, "cache", cache)
+    path = tmp_path / "scene1.md"
+    path.write_text("First version.", encoding="utf-8")
+
+    assert Scene(path, 1, 1).sentences() == ["First version."]
+    assert Scene(path, 1, 1).text() == "First version."
+    assert cache.stats()["hits"] >= 1
+
+    path.write_text("Second version. Now longer.", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert Scene(path, 1, 1).sentences() == ["Second version.", "Now longer."]
@@ -0,0 +1,126 @@
+import os
+
+from sample_code.packed_book import PackedBook
+from sample_code.scene_writer import HASHES_NAME
+from sample_code.splitter import BookSplitter
+
+BOOK = """*** START OF THE PROJECT GUTENBERG EBOOK TEST ***
+
+CHAPTER I
+
+First chapter.
+
+CHAPTER II
+
+_3 May._--Second chapter, first entry.
+
+_4 May._--Second entry.
+
+CHAPTER III
+
+Third chapter.
+
+*** END OF THE PROJECT GUTENBERG EBOOK TEST ***
+"""
+
+
+def mtimes(folder):
+    return {p.relative_to(folder).as_posix(): p.stat().st_mtime_ns for p in folder.rglob("*.md")}
+
+
+def test_reimport_leaves_unchanged_scenes_untouched(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    out = tmp_path / "scenes"
+    splitter = BookSplitter(verbose=False)
+
+    first = splitter.import_book(source, out)
+    before = mtimes(out)
+    again = splitter.import_book(source, out)
+
+    assert first["added"] == sorted(before) and not first["unchanged"]
+    assert again == {"added": [], "removed": [], "modified": [], "unchanged": sorted(before)}
+    assert mtimes(out) == before
+    assert (out / HASHES_NAME).is_file()
+
+
+def test_reimport_of_a_mixed_format_book_leaves_it_untouched(tmp_path):
+    source = tmp_path / "play.txt"
+    source.write_text("CHAPTER I\n\nPrologue.\nACT I\n\nOne.\nACT II\n\nTwo.\n", encoding="utf-8")
+    out = tmp_path / "scenes"
+    splitter = BookSplitter(verbose=False)
+
+    splitter.import_book(source, out)   # first split by chapter, then again by act
+    before = mtimes(out)
+    again = splitter.import_book(source, out)
+
+    assert again == {"added": [], "removed": [], "modified": [], "unchanged": sorted(before)}
+    assert mtimes(out) == before
+    assert sorted(p.name for p in out.rglob("*.tmp")) == []
+
+
+def test_reimport_reports_and_applies_only_the_changes(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    out = tmp_path / "scenes"
+    splitter = BookSplitter(verbose=False)
+    splitter.import_book(source, out)
+    before = mtimes(out)
+    (out / "notes.txt").write_text("mine", encoding="utf-8")
+
+    edited = BOOK.replace("First chapter.", "First chapter, revised.")
+    edited = edited.replace("CHAPTER III\n\nThird chapter.\n\n", "")
+    edited = edited.replace("_4 May._--Second entry.\n", "_4 May._--Second entry.\n\n_5 May._--A new entry.\n")
+    source.write_text(edited, encoding="utf-8")
+    report = splitter.import_book(source, out)
+
+    assert report == {
+        "added": ["ch02/scene4.md"],
+        "removed": ["ch03/scene1.md"],
+        "modified": ["ch01/scene1.md"],
+        "unchanged": ["ch02/scene1.md", "ch02/scene2.md", "ch02/scene3.md"],
+    }
+    after = mtimes(out)
+    assert after["ch02/scene3.md"] == before["ch02/scene3.md"]
+    assert not (out / "ch03").exists()
+    assert (out / "notes.txt").read_text(encoding="utf-8") == "mine"
+    assert "revised" in (out / "ch01" / "scene1.md").read_text(encoding="utf-8")
+
+
+def test_externally_edited_scene_is_rewritten(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    out = tmp_path / "scenes"
+    splitter = BookSplitter(verbose=False)
+    splitter.import_book(source, out)
+    scene = out / "ch01" / "scene1.md"
+    original = scene.read_text(encoding="utf-8")
+    scene.write_text("tampered", encoding="utf-8")
+
+    report = splitter.import_book(source, out)
+
+    assert report["modified"] == ["ch01/scene1.md"]
+    assert scene.read_text(encoding="utf-8") == original
+
+
+def test_packed_reimport_skips_an_identical_pack(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    pack = tmp_path / "book.tbrpack"
+    splitter = BookSplitter(verbose=False)
+    splitter.import_book(source, pack)
+    stamp = pack.stat().st_mtime_ns
+    os.utime(pack, ns=(stamp, stamp - 1_000_000))
+
+    report = splitter.import_book(source, pack)
+    assert not (report["added"] or report["removed"] or report["modified"])
+    assert pack.stat().st_mtime_ns == stamp - 1_000_000
+
+    source.write_text(BOOK.replace("Third chapter.", "Third chapter, revised."), encoding="utf-8")
+    report = splitter.import_book(source, pack)
+    assert report["modified"] == ["ch03/scene1.md"]
+    book = PackedBook(pack)
+    try:
+        assert "revised" in book.text(len(book) - 1)
+    finally:
+        book.close()
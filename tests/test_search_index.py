@@ -0,0 +1,117 @@
+import os
+
+from sample_code.reader import BookReader, SearchHit
+from sample_code.search_index import SEARCH_INDEX_NAME, SearchIndex, tokenize
+
+
+def make_book(root):
+    scenes_dir = root / "scenes"
+    texts = {
+        (1, 1): "# Arrival\nThe Count met me at the door. It was cold.",
+        (1, 2): "# Castle\nThe castle was dark. The count smiled.",
+        (2, 1): "# Letters\nMina wrote to Lucy. Count on me, she said.",
+    }
+    for (ch, sc), text in texts.items():
+        ch_dir = scenes_dir / f"ch{ch:02d}"
+        ch_dir.mkdir(parents=True, exist_ok=True)
+        (ch_dir / f"scene{sc}.md").write_text(text, encoding="utf-8")
+    return scenes_dir
+
+
+def open_reader(scenes_dir, tmp_path):
+    return BookReader(scenes_dir, progress_file=tmp_path / "progress.json")
+
+
+def test_tokenize_lowercases_words():
+    assert tokenize("Harker’s JOURNAL, 3 May—Bistritz_") == ["harker", "s", "journal", "3", "may", "bistritz"]
+
+
+def test_search_returns_sentence_positions_in_reading_order(tmp_path):
+    reader = open_reader(make_book(tmp_path), tmp_path)
+
+    assert reader.search("count") == [
+        SearchHit(1, 1, 1),
+        SearchHit(1, 2, 2),
+        SearchHit(2, 1, 2),
+    ]
+    assert reader.search("COUNT smiled") == [SearchHit(1, 2, 2)]
+    assert reader.search("count vampire") == []
+    assert reader.search("   ") == []
+    assert reader.search("count", limit=1) == [SearchHit(1, 1, 1)]
+
+
+def test_quoted_query_must_match_as_phrase(tmp_path):
+    reader = open_reader(make_book(tmp_path), tmp_path)
+
+    assert reader.search('"the count"') == [SearchHit(1, 1, 1), SearchHit(1, 2, 2)]
+    assert reader.search('"count on"') == [SearchHit(2, 1, 2)]
+
+
+def test_phrase_must_match_whole_words(tmp_path):
+    scenes_dir = tmp_path / "scenes"
+    (scenes_dir / "ch01").mkdir(parents=True)
+    (scenes_dir / "ch01" / "scene1.md").write_text(
+        "# Count\nThe counting began when Count Dracula came. We met the count.", encoding="utf-8")
+    reader = open_reader(scenes_dir, tmp_path)
+
+    assert reader.search("the count") == [SearchHit(1, 1, 1), SearchHit(1, 1, 2)]
+    assert reader.search('"the count"') == [SearchHit(1, 1, 2)]
+
+
+def test_cursor_search_leaves_the_reader_untouched(tmp_path):
+    import threading
+    reader = open_reader(make_book(tmp_path), tmp_path)
+    index, cursor = reader.open_search_index(), reader.cursor()
+    result = []
+    worker = threading.Thread(target=lambda: result.append(cursor.search(index, '"the count"')))
+    worker.start()
+    worker.join()
+
+    hits, counts = result[0]
+    assert hits == [SearchHit(1, 1, 1), SearchHit(1, 2, 2)] and counts["indexed"] == 3
+    assert not reader._search_fresh and reader._rel_index is None
+    reader.search_index_updated(cursor.scenes, counts)
+    assert reader._search_fresh and reader.search('"the count"') == hits
+
+
+def test_hits_are_go_to_positions(tmp_path):
+    reader = open_reader(make_book(tmp_path), tmp_path)
+    hit = reader.search("lucy")[0]
+
+    reader.go_to(*hit)
+
+    assert reader.get_next_chunk(max_chars=1) == "Mina wrote to Lucy."
+
+
+def test_index_is_stored_next_to_book_and_updated_incrementally(tmp_path):
+    scenes_dir = make_book(tmp_path)
+    reader = open_reader(scenes_dir, tmp_path)
+    reader.search("count")
+    assert (scenes_dir / SEARCH_INDEX_NAME).exists()
+
+    index = SearchIndex(scenes_dir)
+    assert index.update(reader._scenes) == {"indexed": 0, "removed": 0}
+
+    edited = scenes_dir / "ch01" / "scene2.md"
+    edited.write_text("# Castle\nNo nobleman here.", encoding="utf-8")
+    os.utime(edited, ns=(0, edited.stat().st_mtime_ns + 1_000_000_000))
+    (scenes_dir / "ch02" / "scene1.md").unlink()
+    reader.refresh()
+
+    assert reader.search("count") == [SearchHit(1, 1, 1)]
+    assert reader.search("nobleman") == [SearchHit(1, 2, 1)]
+    assert index.update(reader._scenes) == {"indexed": 0, "removed": 0}
+    index.close()
+
+
+def test_packed_book_index_lives_beside_the_pack(tmp_path):
+    from sample_code.packed_book import write_pack
+
+    pack = write_pack(tmp_path / "book.tbrpack", [{
+        "path": "ch01/scene1.md", "chapter": 1, "scene": 1, "name": None,
+        "title": "One", "sentences": 2, "words": 4, "text": "One\n\nFind the needle.",
+    }])
+    reader = open_reader(pack, tmp_path)
+
+    assert reader.search("needle") == [SearchHit(1, 1, 1)]
+    assert (tmp_path / f".book.tbrpack{SEARCH_INDEX_NAME}").exists()
@@ -0,0 +1,93 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from sample_code.reader import _clean_text
+from sample_code.sentences import MAX_SENTENCE_CHARS, SentenceSpans, segment_sentences
+
+SAMPLE_SCENES = Path(__file__).resolve().parents[1] / "sample_book" / "scenes"
+
+
+def reference_sentences(text: str) -> list[str]:
+    """The original list-of-strings segmenter; spans must produce the same sentences."""
+    out = []
+    for s in re.split(r"(?<=[.!?])\s+|\n+", text):
+        s = s.strip()
+        if s and any(c.isalnum() for c in s):
+            out.append(s)
+    return out
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "One. Two! Three?",
+    "No break.here but.\nnew line",
+    "Trailing spaces   \n   leading spaces",
+    "Dots... then more.  Spaced out. nbsp",
+    "---\n...\n***\nReal words",
+    "under_score_ only _",
+    "Tabs\tinside.\tafter stop",
+    "Ends with space ",
+])
+def test_segment_matches_reference(text):
+    assert list(segment_sentences(text)) == reference_sentences(text)
+
+
+def test_segment_matches_reference_on_sample_scenes():
+    for path in sorted(SAMPLE_SCENES.rglob("*.md")):
+        text = _clean_text(path.read_text(encoding="utf-8"))
+        assert list(segment_sentences(text)) == reference_sentences(text), path
+
+
+def test_spans_support_len_indexing_and_slices():
+    sents = segment_sentences("Alpha one. Beta two! Gamma three?")
+
+    assert isinstance(sents, SentenceSpans)
+    assert len(sents) == 3
+    assert sents[1] == "Beta two!"
+    assert sents[-1] == "Gamma three?"
+    assert sents[0:2] == ["Alpha one.", "Beta two!"]
+    assert sents.span(1) == (11, 20)
+    assert sents.lengths() == [10, 9, 12]
+    assert sents == ["Alpha one.", "Beta two!", "Gamma three?"]
+    with pytest.raises(IndexError):
+        sents[3]
+
+
+def test_spans_store_offsets_not_strings():
+    text = _clean_text((SAMPLE_SCENES / "ch21" / "scene2.md").read_text(encoding="utf-8"))
+
+    sents = segment_sentences(text)
+
+    assert sents.text is text
+    assert sents.nbytes < sum(len(s) for s in sents) / 4
+
+
+RUN_ON = " ".join(f"word{i}" for i in range(2000))
+CLAUSES = "; ".join(f"then clause number {i} went on" for i in range(200)) + "."
+COMMAS = ", ".join(f"item {i}" for i in range(600))
+ONE_WORD = "x" * 5000
+
+
+@pytest.mark.parametrize("text", [RUN_ON, CLAUSES, COMMAS, ONE_WORD, "A short one. " + RUN_ON])
+def test_long_sentences_are_bounded_and_lose_no_text(text):
+    sents = segment_sentences(text)
+
+    assert max(sents.lengths()) <= MAX_SENTENCE_CHARS
+    assert "".join(text.split()) == "".join("".join(sents).split())
+
+
+def test_long_sentences_prefer_clause_then_comma_breaks():
+    assert all(s.endswith(";") for s in segment_sentences(CLAUSES)[:-1])
+    assert all(s.endswith(",") for s in segment_sentences(COMMAS)[:-1])
+    # Word-only text breaks between words, never inside one.
+    assert all(s.split()[-1].startswith("word") for s in segment_sentences(RUN_ON))
+    assert set(w for s in segment_sentences(RUN_ON) for w in s.split()) == set(RUN_ON.split())
+
+
+def test_max_chars_is_configurable():
+    sents = segment_sentences(RUN_ON, max_chars=40)
+
+    assert max(sents.lengths()) <= 40
+    assert len(sents) > len(segment_sentences(RUN_ON))
@@ -1,4 +1,4 @@
-from sample_code.speaker import BufferedSpeaker, generation_kwargs
+from sample_code.speaker import BufferedSpeaker, chunk_settings, generation_kwargs
 
 
 def test_speaker_initialization():
@@ -45,3 +45,10 @@ def test_speaker_wait_until_idle_with_missing_model():
     speaker.feed("Hello world")
 
     assert speaker.wait_until_idle(timeout=1)
+
+
+def test_chunk_settings_come_from_model_config():
+    settings = chunk_settings("mlx-community/Kokoro-82M-bf16")
+
+    assert set(settings) == {"first_chars", "growth", "max_chars"}
+    assert chunk_settings("unknown/model")["max_chars"] == 500
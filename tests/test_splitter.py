@@ -37,3 +37,134 @@ def test_toc_filtering():
     # RE_CHAPTER should NOT match the TOC one if it's strict
     assert not RE_CHAPTER.match(toc)
     assert RE_CHAPTER_TOC.match(toc)
+
+BOOK = """Title page
+*** START OF THE PROJECT GUTENBERG EBOOK TEST ***
+
+CHAPTER I. Contents line
+
+CHAPTER I
+
+_3 May. Bistritz._--Left Munich.
+
+_4 May._--A letter.
+
+CHAPTER II
+
+Last chapter text.
+
+*** END OF THE PROJECT GUTENBERG EBOOK TEST ***
+Licence text that mentions *** END OF THE PROJECT GUTENBERG twice.
+*** END OF THE PROJECT GUTENBERG EBOOK TEST ***
+Trailing licence.
+"""
+
+
+def whole_file_split(lines, title="book"):
+    from sample_code.book_structure import plan_scenes, scene_content
+    _fmt, plans = plan_scenes(lines, title)
+    return [(p.chapter, p.scene, p.title, scene_content(lines, p)) for p in plans]
+
+
+def streamed_split(lines, title="book"):
+    from sample_code.book_structure import SceneStream, clean_block
+    return [(ch, sc, t, clean_block(list(ls))) for ch, sc, t, ls in SceneStream(title).scenes(iter(lines))]
+
+
+@pytest.mark.parametrize("text", [
+    BOOK,
+    BOOK.replace("*** START", "*** BEGIN"),                  # no START marker
+    "No headings at all.\n\nJust prose.\n",                   # unknown format
+    "ACT I\n\nNORA. Hello.\n  ACT II is mentioned\nACT II\n\nHELMER. Bye.\n",
+])
+def test_stream_matches_whole_file_plan(text, monkeypatch):
+    import sample_code.book_structure as book_structure
+    monkeypatch.setattr(book_structure, "SPOOL_BYTES", 16)   # exercise the on-disk spools
+    lines = text.splitlines(keepends=True)
+    assert streamed_split(lines) == whole_file_split(lines)
+
+
+def test_stream_without_start_marker_holds_one_chapter_at_a_time():
+    from sample_code.book_structure import SceneStream
+    lines = [f"CHAPTER {n}\n\nText of chapter {n}.\n" for n in range(1, 201)]
+    stream = SceneStream("book")
+    held = []
+    take_ready = stream._take_ready
+    stream._take_ready = lambda: held.append(len(stream._ready)) or take_ready()
+    seen = 0
+    for _ch, _sc, _title, scene_lines in stream.scenes(iter("".join(lines).splitlines())):
+        list(scene_lines)
+        seen += 1
+    assert seen == 200 and max(held) <= 1
+
+
+@pytest.mark.parametrize("max_chars", [1, 20, 60])
+def test_bounded_stream_matches_bounded_plan(max_chars):
+    from sample_code.book_structure import SceneStream, clean_block, plan_scenes, scene_content
+    text = BOOK + "ACT I\n\nNORA. Hello there.\nHELMER. Hi.\n\nNORA. Bye.\n"
+    for book in (text, "No headings at all.\n\nJust prose,\nover lines.\n\nMore prose.\n"):
+        lines = book.splitlines(keepends=True)
+        _fmt, plans = plan_scenes(lines, "book", max_chars)
+        planned = [(p.chapter, p.scene, p.title, scene_content(lines, p)) for p in plans]
+        streamed = [(ch, sc, t, clean_block(list(ls)))
+                    for ch, sc, t, ls in SceneStream("book", max_scene_chars=max_chars).scenes(iter(lines))]
+        assert streamed == planned
+
+
+def test_long_scenes_are_cut_at_paragraphs_into_ordered_scenes(tmp_path):
+    from sample_code.reader import BookReader
+    from sample_code.splitter import BookSplitter
+    paragraphs = [f"NORA. Line {n} of the act.\nHELMER. Reply {n}." for n in range(1, 61)]
+    source = tmp_path / "play.txt"
+    source.write_text("ACT I\n\n" + "\n\n".join(paragraphs) + "\n\nACT II\n\nShort.\n", encoding="utf-8")
+
+    out = BookSplitter(verbose=False, max_scene_chars=200).split_book(source, tmp_path / "scenes")
+
+    act_one = sorted((out / "ch01").glob("*.md"), key=lambda p: int(p.stem[5:]))
+    assert len(act_one) > 10 and [p.name for p in (out / "ch02").glob("*.md")] == ["scene1.md"]
+    bodies = [p.read_text(encoding="utf-8").split("\n\n", 1)[1].strip() for p in act_one]
+    assert all(len(body) <= 200 for body in bodies)
+    assert "\n\n".join(bodies) == "\n\n".join(paragraphs)   # cut only between paragraphs
+    assert act_one[1].read_text(encoding="utf-8").startswith("# ACT I (part 2)\n")
+
+    reader = BookReader(out, progress_file=tmp_path / "progress.json")
+    assert [(sc.chapter, sc.scene) for sc in reader._scenes] == (
+        [(1, n) for n in range(1, len(act_one) + 1)] + [(2, 1)]
+    )
+
+    virtual = BookReader(source, progress_file=tmp_path / "virtual.json", max_scene_chars=200)
+    assert [(sc.rel, sc.text()) for sc in virtual._scenes] == [(sc.rel, sc.text()) for sc in reader._scenes]
+
+
+def test_split_reads_gzip_and_writes_scenes(tmp_path):
+    import gzip
+    from sample_code.splitter import BookSplitter
+    plain, packed = tmp_path / "book.txt", tmp_path / "book.txt.gz"
+    plain.write_text(BOOK, encoding="utf-8")
+    with gzip.open(packed, "wt", encoding="utf-8") as f:
+        f.write(BOOK)
+    splitter = BookSplitter(verbose=False)
+
+    a = splitter.split_book(plain, tmp_path / "a")
+    b = splitter.split_book(packed, tmp_path / "b")
+
+    files = sorted(p.relative_to(a).as_posix() for p in a.rglob("*.md"))
+    assert files == ["ch01/scene1.md", "ch01/scene2.md", "ch01/scene3.md", "ch02/scene1.md"]
+    for rel in files:
+        assert (a / rel).read_text(encoding="utf-8") == (b / rel).read_text(encoding="utf-8")
+    assert (a / "ch01/scene2.md").read_text(encoding="utf-8") == (
+        "# CHAPTER I — 3 May. Bistritz\n\n_3 May. Bistritz._--Left Munich.\n"
+    )
+    assert "Licence text" in (a / "ch02/scene1.md").read_text(encoding="utf-8")
+    assert "Trailing licence" not in (a / "ch02/scene1.md").read_text(encoding="utf-8")
+
+
+def test_mixed_headings_are_split_again_by_the_commoner_kind(tmp_path):
+    from sample_code.splitter import BookSplitter
+    source = tmp_path / "play.txt"
+    source.write_text("CHAPTER I\n\nPrologue.\nACT I\n\nOne.\nACT II\n\nTwo.\n", encoding="utf-8")
+
+    out = BookSplitter(verbose=False).split_book(source, tmp_path / "scenes")
+
+    assert sorted(p.relative_to(out).as_posix() for p in out.rglob("*.md")) == ["ch01/scene1.md", "ch02/scene1.md"]
+    assert (out / "ch01/scene1.md").read_text(encoding="utf-8") == "# ACT I\n\nOne.\n"
@@ -0,0 +1,89 @@
+import os
+
+from sample_code.book_index import MANIFEST_NAME, load_manifest
+from sample_code.reader import BookReader
+from sample_code.scene_cache import SCENE_CACHE
+from sample_code.sentences import segment_sentences
+from sample_code.splitter import BookSplitter
+from sample_code.tts_stream import STREAM_NAME
+
+BOOK = """*** START OF THE PROJECT GUTENBERG EBOOK TEST ***
+
+CHAPTER I
+
+First chapter. It has *two* sentences.
+
+CHAPTER II
+
+_3 May._--Second chapter, first entry.
+
+_4 May._--Second entry. With [Illustration: a castle] more text.
+
+*** END OF THE PROJECT GUTENBERG EBOOK TEST ***
+"""
+
+
+def split(tmp_path):
+    source = tmp_path / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    out = tmp_path / "scenes"
+    BookSplitter(verbose=False).import_book(source, out)
+    return out
+
+
+def contents(reader):
+    return [(sc.rel, sc.title(), sc.text(), list(sc.sentences())) for sc in reader._scenes]
+
+
+def test_splitter_index_matches_a_reader_scan(tmp_path):
+    out = split(tmp_path)
+    written = load_manifest(out)
+    assert written is not None and (out / STREAM_NAME).is_file()
+
+    os.remove(out / MANIFEST_NAME)
+    scanned = BookReader(out, progress_file=tmp_path / "progress.json")
+    assert load_manifest(out) == written
+    assert [sc.word_count for sc in scanned._scenes] == [e["words"] for e in written]
+
+
+def test_open_serves_text_and_sentences_without_scanning_or_cleaning(tmp_path, monkeypatch):
+    out = split(tmp_path)
+    expected = contents(BookReader(out, progress_file=tmp_path / "a.json"))
+    os.remove(out / STREAM_NAME)
+    assert contents(BookReader(out, progress_file=tmp_path / "b.json")) == expected
+
+    out = split(tmp_path)   # puts the stream back
+
+    def fail(*args, **kwargs):
+        raise AssertionError("should come from the stream")
+
+    SCENE_CACHE.clear()   # drop what the first readers loaded
+    monkeypatch.setattr(BookReader, "_walk_scene_tree", fail)
+    monkeypatch.setattr("sample_code.reader._clean_text", fail)
+    monkeypatch.setattr("sample_code.reader.segment_sentences", fail)
+    assert contents(BookReader(out, progress_file=tmp_path / "c.json")) == expected
+
+
+def test_edited_scene_falls_back_to_its_file(tmp_path):
+    out = split(tmp_path)
+    scene = out / "ch01" / "scene1.md"
+    scene.write_text("# Changed\n\nAn edited scene. Read from disk.\n", encoding="utf-8")
+
+    reader = BookReader(out, progress_file=tmp_path / "progress.json")
+    SCENE_CACHE.clear()
+    first = reader._scenes[0]
+    assert first.text() == "Changed\n\nAn edited scene. Read from disk."
+    assert list(first.sentences()) == list(segment_sentences(first.text()))
+
+
+def test_corrupt_stream_or_foreign_files_fall_back(tmp_path):
+    out = split(tmp_path)
+    (out / STREAM_NAME).write_bytes(b"garbage")
+    reader = BookReader(out, progress_file=tmp_path / "progress.json")
+    SCENE_CACHE.clear()
+    assert reader._scenes[0].text().startswith("CHAPTER I\n\nFirst chapter.")
+
+    os.remove(out / MANIFEST_NAME)
+    (out / "extra.md").write_text("# Extra\n\nNot from the book.\n", encoding="utf-8")
+    BookSplitter(verbose=False).import_book(tmp_path / "book.txt", out)
+    assert not (out / MANIFEST_NAME).exists()
@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+
+from sample_code.reader import BookReader
+from sample_code.splitter import BookSplitter
+from sample_code.virtual_book import VirtualBook
+
+SAMPLE_BOOK = Path(__file__).resolve().parents[1] / "sample_book"
+
+BOOK = """Preamble that is not part of the book.
+*** START OF THE PROJECT GUTENBERG EBOOK TEST ***
+
+CHAPTER I
+
+_3 May. Bistritz._--Left Munich at 8:35 P. M. The *train* was late.
+
+_4 May._--I found that my landlord had got a letter.
+
+CHAPTER II
+
+Ünïcode survives the round trip. Second sentence here!
+
+*** END OF THE PROJECT GUTENBERG EBOOK TEST ***
+"""
+
+
+def open_pair(tmp_path, text, newline="\n"):
+    tmp_path.mkdir(exist_ok=True)
+    source = tmp_path / "book.txt"
+    source.write_bytes(text.replace("\n", newline).encode("utf-8"))
+    folder = BookSplitter(verbose=False).split_book(source, tmp_path / "scenes")
+    virtual = BookReader(source, progress_file=tmp_path / "p1.json")
+    loose = BookReader(folder, progress_file=tmp_path / "p2.json")
+    return source, virtual, loose
+
+
+def test_virtual_scenes_match_split_scene_files(tmp_path):
+    for newline in ("\n", "\r\n"):
+        _source, virtual, loose = open_pair(tmp_path / newline.encode().hex(), BOOK, newline)
+
+        assert len(virtual._scenes) == len(loose._scenes) == 4
+        for v, f in zip(virtual._scenes, loose._scenes):
+            assert (v.rel, v.chapter, v.scene, v.title()) == (f.rel, f.chapter, f.scene, f.title())
+            assert v.text() == f.text()
+            assert list(v.sentences()) == list(f.sentences())
+
+
+def test_sample_book_matches_its_split_scenes():
+    book = VirtualBook(SAMPLE_BOOK / "dracula.txt")
+    try:
+        files = sorted(p.relative_to(SAMPLE_BOOK / "scenes").as_posix() for p in (SAMPLE_BOOK / "scenes").rglob("*.md"))
+        assert book.format == "chapter"
+        assert sorted(e["path"] for e in book.entries) == files
+        for i, entry in enumerate(book.entries):
+            assert book.text(i) == (SAMPLE_BOOK / "scenes" / entry["path"]).read_text(encoding="utf-8")
+    finally:
+        book.close()
+
+
+def test_reading_writes_no_scene_files(tmp_path):
+    (tmp_path / "book").mkdir()
+    source = tmp_path / "book" / "book.txt"
+    source.write_text(BOOK, encoding="utf-8")
+    reader = BookReader(source, progress_file=tmp_path / "progress.json")
+
+    while reader.get_next_chunk() is not None:
+        pass
+
+    assert os.listdir(tmp_path / "book") == ["book.txt"]
+
+
+def test_refresh_reindexes_an_edited_book(tmp_path):
+    source, virtual, _loose = open_pair(tmp_path, BOOK)
+    virtual.go_to(2, 1)
+    before = source.stat()
+
+    source.write_text(BOOK.replace("Second sentence here!", "A new ending."), encoding="utf-8")
+    os.utime(source, ns=(before.st_atime_ns, before.st_mtime_ns + 1_000_000))
+
+    assert virtual.has_changes()
+    report = virtual.refresh()
+    assert report == {"added": [], "removed": [], "modified": ["ch02/scene1.md"]}
+    assert "A new ending." in virtual.current.text()